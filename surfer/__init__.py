@@ -1,4 +1,4 @@
-from .viz import Brain, TimeViewer  # noqa
+from .viz import Brain, BrainGrid, TimeViewer  # noqa
 from .utils import Surface, verbose, set_log_level, set_log_file  # noqa
 from .io import project_volume_data  # noqa
 
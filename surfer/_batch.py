@@ -0,0 +1,214 @@
+"""
+Non-interactive rendering of many images from a job manifest.
+
+This is used by ``pysurfer batch``, see :mod:`surfer._commandline` for a
+description of the manifest format.
+"""
+from collections import OrderedDict
+import json
+import logging
+import os
+import time
+
+from .utils import string_types
+
+logger = logging.getLogger('surfer')
+
+# Job entries that are passed to Brain(); jobs that share all of these are
+# rendered with the same Brain
+_brain_kwargs = ('views', 'size', 'background', 'foreground', 'cortex',
+                 'alpha', 'title')
+_brain_keys = ('subjects_dir', 'subject_id', 'hemi', 'surf') + _brain_kwargs
+# Job entries that add something to the Brain, in the order they are added
+_layer_methods = (('morphometry', 'add_morphometry'),
+                  ('overlays', 'add_overlay'),
+                  ('annotations', 'add_annotation'),
+                  ('labels', 'add_label'),
+                  ('foci', 'add_foci'))
+
+
+def read_manifest(fname):
+    """Read the jobs of a batch manifest.
+
+    Parameters
+    ----------
+    fname : str
+        A JSON file, or a YAML file (``.yml`` or ``.yaml``, requires PyYAML).
+
+    Returns
+    -------
+    jobs : list of dict
+        The jobs, with the manifest defaults filled in.
+    """
+    with open(fname) as fid:
+        if fname.endswith(('.yml', '.yaml')):
+            try:
+                import yaml
+            except ImportError:
+                raise ImportError('Reading YAML manifests requires PyYAML, '
+                                  'use a JSON manifest or install PyYAML')
+            manifest = yaml.safe_load(fid)
+        else:
+            manifest = json.load(fid)
+    if isinstance(manifest, list):
+        manifest = dict(jobs=manifest)
+    if not isinstance(manifest, dict) or 'jobs' not in manifest:
+        raise ValueError('The manifest must be a list of jobs or a mapping '
+                         'with a "jobs" entry')
+    jobs = list()
+    for ji, job in enumerate(manifest['jobs']):
+        full_job = dict(manifest.get('defaults', dict()))
+        full_job.update(job)
+        missing = [key for key in ('subject_id', 'hemi', 'surf', 'output')
+                   if key not in full_job]
+        if missing:
+            raise ValueError('Job %d is missing %s' % (ji, ', '.join(missing)))
+        views = full_job.get('views', ['lat'])
+        if isinstance(views, string_types):
+            views = [views]
+        full_job['views'] = tuple(views)
+        jobs.append(full_job)
+    return jobs
+
+
+def _brain_key(job):
+    """Get the Brain parameters of a job as a hashable key."""
+    return tuple((key, json.dumps(job.get(key), sort_keys=True))
+                 for key in _brain_keys)
+
+
+def group_jobs(jobs):
+    """Group the jobs that can be rendered with the same Brain.
+
+    Returns
+    -------
+    groups : list of list of tuple
+        For each group, the (index, job) tuples in manifest order.
+    """
+    groups = OrderedDict()
+    for ji, job in enumerate(jobs):
+        groups.setdefault(_brain_key(job), []).append((ji, job))
+    return list(groups.values())
+
+
+def _add_layers(brain, job):
+    """Add the morphometry, overlays, annotations, ... of a job."""
+    for key, method in _layer_methods:
+        entries = job.get(key, [])
+        if not isinstance(entries, list):
+            entries = [entries]
+        for entry in entries:
+            if isinstance(entry, dict):
+                getattr(brain, method)(**entry)
+            else:
+                getattr(brain, method)(entry)
+
+
+def render_group(jobs):
+    """Render a group of jobs offscreen, reusing one Brain.
+
+    Parameters
+    ----------
+    jobs : list of tuple
+        The (index, job) tuples of a group (see :func:`group_jobs`).
+
+    Returns
+    -------
+    timings : list of dict
+        For each job, the time spent creating or clearing the Brain
+        (``setup``), adding layers (``layers``) and saving the image
+        (``save``), in seconds. ``error`` is None or the error message.
+    """
+    from .viz import Brain
+    timings = list()
+    brain = None
+    for ji, job in jobs:
+        timing = dict(index=ji, output=job['output'], reused=brain is not None,
+                      setup=0., layers=0., save=0., error=None)
+        t0 = time.time()
+        try:
+            if brain is None:
+                kwargs = dict((key, job[key]) for key in _brain_kwargs
+                              if key in job)
+                kwargs['views'] = list(kwargs['views'])
+                brain = Brain(job['subject_id'], job['hemi'], job['surf'],
+                              subjects_dir=job.get('subjects_dir'),
+                              offscreen=True, **kwargs)
+            else:
+                brain.clear()
+            t1 = time.time()
+            with brain.batch_updates():
+                _add_layers(brain, job)
+            t2 = time.time()
+            out_dir = os.path.dirname(os.path.abspath(job['output']))
+            if not os.path.isdir(out_dir):
+                os.makedirs(out_dir)
+            brain.save_image(job['output'])
+            t3 = time.time()
+            timing.update(setup=t1 - t0, layers=t2 - t1, save=t3 - t2)
+        except Exception as exp:
+            logger.error('Job %d (%s) failed: %s' % (ji, job['output'], exp))
+            timing['error'] = '%s: %s' % (type(exp).__name__, exp)
+            if brain is not None:  # do not reuse a Brain in a broken state
+                brain.close()
+                brain = None
+        timing['total'] = time.time() - t0
+        timings.append(timing)
+    if brain is not None:
+        brain.close()
+    return timings
+
+
+def run_batch(fname, n_jobs=1):
+    """Render all jobs of a manifest.
+
+    Parameters
+    ----------
+    fname : str
+        The manifest file (see :func:`read_manifest`).
+    n_jobs : int
+        The number of worker processes. Each group of jobs sharing the same
+        Brain parameters is rendered by one worker.
+
+    Returns
+    -------
+    timings : list of dict
+        The timing of each job, in manifest order (see
+        :func:`render_group`).
+    """
+    groups = group_jobs(read_manifest(fname))
+    logger.info('Rendering %d jobs in %d groups'
+                % (sum(len(group) for group in groups), len(groups)))
+    n_jobs = min(int(n_jobs), len(groups))
+    if n_jobs > 1:
+        from multiprocessing import Pool
+        pool = Pool(n_jobs)
+        try:
+            results = pool.map(render_group, groups, chunksize=1)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        results = [render_group(group) for group in groups]
+    return sorted((timing for result in results for timing in result),
+                  key=lambda timing: timing['index'])
+
+
+def format_timings(timings):
+    """Format a table of job timings (see :func:`run_batch`)."""
+    lines = ['%5s %8s %8s %8s %8s  %s'
+             % ('job', 'setup', 'layers', 'save', 'total', 'output')]
+    for timing in timings:
+        status = timing['output']
+        if timing['reused']:
+            status += ' (reused Brain)'
+        if timing['error'] is not None:
+            status += ' FAILED: %s' % timing['error']
+        lines.append('%5d %8.2f %8.2f %8.2f %8.2f  %s'
+                     % (timing['index'], timing['setup'], timing['layers'],
+                        timing['save'], timing['total'], status))
+    lines.append('%d jobs, %d failed, %0.2f s in total'
+                 % (len(timings),
+                    sum(timing['error'] is not None for timing in timings),
+                    sum(timing['total'] for timing in timings)))
+    return '\n'.join(lines)
@@ -72,3 +72,43 @@ parser.add_argument("-title",
                     help="title to use for the figure")
 parser.add_argument("-views", nargs="*", default=['lat'],
                     help="view list (space-separated) to use")
+
+batch_help_text = """
+Render images offscreen from a job manifest, without starting IPython.
+
+The manifest is a JSON (or, if PyYAML is installed, YAML) file with an
+optional "defaults" mapping and a list of "jobs". Each job is a mapping with
+the entries:
+
+  subject_id, hemi, surf     as for Brain (required)
+  output                     image file to write (required)
+  subjects_dir, views, size, background, foreground, cortex, alpha, title
+                             other Brain parameters (optional)
+  morphometry, overlays, annotations, labels, foci
+                             what to add, each is a list whose entries are
+                             the first argument (e.g. a label name) or a
+                             mapping of keyword arguments for the
+                             corresponding Brain.add_* method (optional)
+
+Entries missing from a job are taken from "defaults". Jobs with the same
+Brain parameters are rendered one after the other with the same Brain.
+For example:
+
+  {"defaults": {"subject_id": "fsaverage", "surf": "inflated",
+                "views": ["lat", "med"]},
+   "jobs": [{"hemi": "lh", "labels": ["V1", {"label": "MT", "color": "r"}],
+             "output": "lh_visual.png"},
+            {"hemi": "lh", "annotations": ["aparc"], "output": "lh.png"}]}
+
+"""
+
+batch_parser = ArgumentParser(prog='pysurfer batch',
+                              usage='%(prog)s manifest [options]',
+                              formatter_class=RawDescriptionHelpFormatter,
+                              description=batch_help_text)
+batch_parser.add_argument("manifest",
+                          help="JSON or YAML file describing the jobs")
+batch_parser.add_argument("-jobs", metavar="N", type=int, default=1,
+                          help="number of worker processes")
+batch_parser.add_argument("-timings", metavar="FILE",
+                          help="write the job timings to a JSON file")
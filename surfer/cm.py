@@ -1,1053 +1,1125 @@
-from matplotlib import colors
+"""Colormaps shipped with PySurfer.
 
+The tables are stored as text and parsed to read-only arrays (see
+:func:`get_lut`), from which the matplotlib colormaps are built. The
+colormaps are also module attributes (e.g. ``surfer.cm.rocket``), only
+built when they are first used, so importing this module is cheap and
+does not require matplotlib.
+"""
 
-_rocket_lut = [
-    [ 0.01060815, 0.01808215, 0.10018654],
-    [ 0.01428972, 0.02048237, 0.10374486],
-    [ 0.01831941, 0.0229766 , 0.10738511],
-    [ 0.02275049, 0.02554464, 0.11108639],
-    [ 0.02759119, 0.02818316, 0.11483751],
-    [ 0.03285175, 0.03088792, 0.11863035],
-    [ 0.03853466, 0.03365771, 0.12245873],
-    [ 0.04447016, 0.03648425, 0.12631831],
-    [ 0.05032105, 0.03936808, 0.13020508],
-    [ 0.05611171, 0.04224835, 0.13411624],
-    [ 0.0618531 , 0.04504866, 0.13804929],
-    [ 0.06755457, 0.04778179, 0.14200206],
-    [ 0.0732236 , 0.05045047, 0.14597263],
-    [ 0.0788708 , 0.05305461, 0.14995981],
-    [ 0.08450105, 0.05559631, 0.15396203],
-    [ 0.09011319, 0.05808059, 0.15797687],
-    [ 0.09572396, 0.06050127, 0.16200507],
-    [ 0.10132312, 0.06286782, 0.16604287],
-    [ 0.10692823, 0.06517224, 0.17009175],
-    [ 0.1125315 , 0.06742194, 0.17414848],
-    [ 0.11813947, 0.06961499, 0.17821272],
-    [ 0.12375803, 0.07174938, 0.18228425],
-    [ 0.12938228, 0.07383015, 0.18636053],
-    [ 0.13501631, 0.07585609, 0.19044109],
-    [ 0.14066867, 0.0778224 , 0.19452676],
-    [ 0.14633406, 0.07973393, 0.1986151 ],
-    [ 0.15201338, 0.08159108, 0.20270523],
-    [ 0.15770877, 0.08339312, 0.20679668],
-    [ 0.16342174, 0.0851396 , 0.21088893],
-    [ 0.16915387, 0.08682996, 0.21498104],
-    [ 0.17489524, 0.08848235, 0.2190294 ],
-    [ 0.18065495, 0.09009031, 0.22303512],
-    [ 0.18643324, 0.09165431, 0.22699705],
-    [ 0.19223028, 0.09317479, 0.23091409],
-    [ 0.19804623, 0.09465217, 0.23478512],
-    [ 0.20388117, 0.09608689, 0.23860907],
-    [ 0.20973515, 0.09747934, 0.24238489],
-    [ 0.21560818, 0.09882993, 0.24611154],
-    [ 0.22150014, 0.10013944, 0.2497868 ],
-    [ 0.22741085, 0.10140876, 0.25340813],
-    [ 0.23334047, 0.10263737, 0.25697736],
-    [ 0.23928891, 0.10382562, 0.2604936 ],
-    [ 0.24525608, 0.10497384, 0.26395596],
-    [ 0.25124182, 0.10608236, 0.26736359],
-    [ 0.25724602, 0.10715148, 0.27071569],
-    [ 0.26326851, 0.1081815 , 0.27401148],
-    [ 0.26930915, 0.1091727 , 0.2772502 ],
-    [ 0.27536766, 0.11012568, 0.28043021],
-    [ 0.28144375, 0.11104133, 0.2835489 ],
-    [ 0.2875374 , 0.11191896, 0.28660853],
-    [ 0.29364846, 0.11275876, 0.2896085 ],
-    [ 0.29977678, 0.11356089, 0.29254823],
-    [ 0.30592213, 0.11432553, 0.29542718],
-    [ 0.31208435, 0.11505284, 0.29824485],
-    [ 0.31826327, 0.1157429 , 0.30100076],
-    [ 0.32445869, 0.11639585, 0.30369448],
-    [ 0.33067031, 0.11701189, 0.30632563],
-    [ 0.33689808, 0.11759095, 0.3088938 ],
-    [ 0.34314168, 0.11813362, 0.31139721],
-    [ 0.34940101, 0.11863987, 0.3138355 ],
-    [ 0.355676  , 0.11910909, 0.31620996],
-    [ 0.36196644, 0.1195413 , 0.31852037],
-    [ 0.36827206, 0.11993653, 0.32076656],
-    [ 0.37459292, 0.12029443, 0.32294825],
-    [ 0.38092887, 0.12061482, 0.32506528],
-    [ 0.38727975, 0.12089756, 0.3271175 ],
-    [ 0.39364518, 0.12114272, 0.32910494],
-    [ 0.40002537, 0.12134964, 0.33102734],
-    [ 0.40642019, 0.12151801, 0.33288464],
-    [ 0.41282936, 0.12164769, 0.33467689],
-    [ 0.41925278, 0.12173833, 0.33640407],
-    [ 0.42569057, 0.12178916, 0.33806605],
-    [ 0.43214263, 0.12179973, 0.33966284],
-    [ 0.43860848, 0.12177004, 0.34119475],
-    [ 0.44508855, 0.12169883, 0.34266151],
-    [ 0.45158266, 0.12158557, 0.34406324],
-    [ 0.45809049, 0.12142996, 0.34540024],
-    [ 0.46461238, 0.12123063, 0.34667231],
-    [ 0.47114798, 0.12098721, 0.34787978],
-    [ 0.47769736, 0.12069864, 0.34902273],
-    [ 0.48426077, 0.12036349, 0.35010104],
-    [ 0.49083761, 0.11998161, 0.35111537],
-    [ 0.49742847, 0.11955087, 0.35206533],
-    [ 0.50403286, 0.11907081, 0.35295152],
-    [ 0.51065109, 0.11853959, 0.35377385],
-    [ 0.51728314, 0.1179558 , 0.35453252],
-    [ 0.52392883, 0.11731817, 0.35522789],
-    [ 0.53058853, 0.11662445, 0.35585982],
-    [ 0.53726173, 0.11587369, 0.35642903],
-    [ 0.54394898, 0.11506307, 0.35693521],
-    [ 0.5506426 , 0.11420757, 0.35737863],
-    [ 0.55734473, 0.11330456, 0.35775059],
-    [ 0.56405586, 0.11235265, 0.35804813],
-    [ 0.57077365, 0.11135597, 0.35827146],
-    [ 0.5774991 , 0.11031233, 0.35841679],
-    [ 0.58422945, 0.10922707, 0.35848469],
-    [ 0.59096382, 0.10810205, 0.35847347],
-    [ 0.59770215, 0.10693774, 0.35838029],
-    [ 0.60444226, 0.10573912, 0.35820487],
-    [ 0.61118304, 0.10450943, 0.35794557],
-    [ 0.61792306, 0.10325288, 0.35760108],
-    [ 0.62466162, 0.10197244, 0.35716891],
-    [ 0.63139686, 0.10067417, 0.35664819],
-    [ 0.63812122, 0.09938212, 0.35603757],
-    [ 0.64483795, 0.0980891 , 0.35533555],
-    [ 0.65154562, 0.09680192, 0.35454107],
-    [ 0.65824241, 0.09552918, 0.3536529 ],
-    [ 0.66492652, 0.09428017, 0.3526697 ],
-    [ 0.67159578, 0.09306598, 0.35159077],
-    [ 0.67824099, 0.09192342, 0.3504148 ],
-    [ 0.684863  , 0.09085633, 0.34914061],
-    [ 0.69146268, 0.0898675 , 0.34776864],
-    [ 0.69803757, 0.08897226, 0.3462986 ],
-    [ 0.70457834, 0.0882129 , 0.34473046],
-    [ 0.71108138, 0.08761223, 0.3430635 ],
-    [ 0.7175507 , 0.08716212, 0.34129974],
-    [ 0.72398193, 0.08688725, 0.33943958],
-    [ 0.73035829, 0.0868623 , 0.33748452],
-    [ 0.73669146, 0.08704683, 0.33543669],
-    [ 0.74297501, 0.08747196, 0.33329799],
-    [ 0.74919318, 0.08820542, 0.33107204],
-    [ 0.75535825, 0.08919792, 0.32876184],
-    [ 0.76145589, 0.09050716, 0.32637117],
-    [ 0.76748424, 0.09213602, 0.32390525],
-    [ 0.77344838, 0.09405684, 0.32136808],
-    [ 0.77932641, 0.09634794, 0.31876642],
-    [ 0.78513609, 0.09892473, 0.31610488],
-    [ 0.79085854, 0.10184672, 0.313391  ],
-    [ 0.7965014 , 0.10506637, 0.31063031],
-    [ 0.80205987, 0.10858333, 0.30783   ],
-    [ 0.80752799, 0.11239964, 0.30499738],
-    [ 0.81291606, 0.11645784, 0.30213802],
-    [ 0.81820481, 0.12080606, 0.29926105],
-    [ 0.82341472, 0.12535343, 0.2963705 ],
-    [ 0.82852822, 0.13014118, 0.29347474],
-    [ 0.83355779, 0.13511035, 0.29057852],
-    [ 0.83850183, 0.14025098, 0.2876878 ],
-    [ 0.84335441, 0.14556683, 0.28480819],
-    [ 0.84813096, 0.15099892, 0.281943  ],
-    [ 0.85281737, 0.15657772, 0.27909826],
-    [ 0.85742602, 0.1622583 , 0.27627462],
-    [ 0.86196552, 0.16801239, 0.27346473],
-    [ 0.86641628, 0.17387796, 0.27070818],
-    [ 0.87079129, 0.17982114, 0.26797378],
-    [ 0.87507281, 0.18587368, 0.26529697],
-    [ 0.87925878, 0.19203259, 0.26268136],
-    [ 0.8833417 , 0.19830556, 0.26014181],
-    [ 0.88731387, 0.20469941, 0.25769539],
-    [ 0.89116859, 0.21121788, 0.2553592 ],
-    [ 0.89490337, 0.21785614, 0.25314362],
-    [ 0.8985026 , 0.22463251, 0.25108745],
-    [ 0.90197527, 0.23152063, 0.24918223],
-    [ 0.90530097, 0.23854541, 0.24748098],
-    [ 0.90848638, 0.24568473, 0.24598324],
-    [ 0.911533  , 0.25292623, 0.24470258],
-    [ 0.9144225 , 0.26028902, 0.24369359],
-    [ 0.91717106, 0.26773821, 0.24294137],
-    [ 0.91978131, 0.27526191, 0.24245973],
-    [ 0.92223947, 0.28287251, 0.24229568],
-    [ 0.92456587, 0.29053388, 0.24242622],
-    [ 0.92676657, 0.29823282, 0.24285536],
-    [ 0.92882964, 0.30598085, 0.24362274],
-    [ 0.93078135, 0.31373977, 0.24468803],
-    [ 0.93262051, 0.3215093 , 0.24606461],
-    [ 0.93435067, 0.32928362, 0.24775328],
-    [ 0.93599076, 0.33703942, 0.24972157],
-    [ 0.93752831, 0.34479177, 0.25199928],
-    [ 0.93899289, 0.35250734, 0.25452808],
-    [ 0.94036561, 0.36020899, 0.25734661],
-    [ 0.94167588, 0.36786594, 0.2603949 ],
-    [ 0.94291042, 0.37549479, 0.26369821],
-    [ 0.94408513, 0.3830811 , 0.26722004],
-    [ 0.94520419, 0.39062329, 0.27094924],
-    [ 0.94625977, 0.39813168, 0.27489742],
-    [ 0.94727016, 0.4055909 , 0.27902322],
-    [ 0.94823505, 0.41300424, 0.28332283],
-    [ 0.94914549, 0.42038251, 0.28780969],
-    [ 0.95001704, 0.42771398, 0.29244728],
-    [ 0.95085121, 0.43500005, 0.29722817],
-    [ 0.95165009, 0.44224144, 0.30214494],
-    [ 0.9524044 , 0.44944853, 0.3072105 ],
-    [ 0.95312556, 0.45661389, 0.31239776],
-    [ 0.95381595, 0.46373781, 0.31769923],
-    [ 0.95447591, 0.47082238, 0.32310953],
-    [ 0.95510255, 0.47787236, 0.32862553],
-    [ 0.95569679, 0.48489115, 0.33421404],
-    [ 0.95626788, 0.49187351, 0.33985601],
-    [ 0.95681685, 0.49882008, 0.34555431],
-    [ 0.9573439 , 0.50573243, 0.35130912],
-    [ 0.95784842, 0.51261283, 0.35711942],
-    [ 0.95833051, 0.51946267, 0.36298589],
-    [ 0.95879054, 0.52628305, 0.36890904],
-    [ 0.95922872, 0.53307513, 0.3748895 ],
-    [ 0.95964538, 0.53983991, 0.38092784],
-    [ 0.96004345, 0.54657593, 0.3870292 ],
-    [ 0.96042097, 0.55328624, 0.39319057],
-    [ 0.96077819, 0.55997184, 0.39941173],
-    [ 0.9611152 , 0.5666337 , 0.40569343],
-    [ 0.96143273, 0.57327231, 0.41203603],
-    [ 0.96173392, 0.57988594, 0.41844491],
-    [ 0.96201757, 0.58647675, 0.42491751],
-    [ 0.96228344, 0.59304598, 0.43145271],
-    [ 0.96253168, 0.5995944 , 0.43805131],
-    [ 0.96276513, 0.60612062, 0.44471698],
-    [ 0.96298491, 0.6126247 , 0.45145074],
-    [ 0.96318967, 0.61910879, 0.45824902],
-    [ 0.96337949, 0.6255736 , 0.46511271],
-    [ 0.96355923, 0.63201624, 0.47204746],
-    [ 0.96372785, 0.63843852, 0.47905028],
-    [ 0.96388426, 0.64484214, 0.4861196 ],
-    [ 0.96403203, 0.65122535, 0.4932578 ],
-    [ 0.96417332, 0.65758729, 0.50046894],
-    [ 0.9643063 , 0.66393045, 0.5077467 ],
-    [ 0.96443322, 0.67025402, 0.51509334],
-    [ 0.96455845, 0.67655564, 0.52251447],
-    [ 0.96467922, 0.68283846, 0.53000231],
-    [ 0.96479861, 0.68910113, 0.53756026],
-    [ 0.96492035, 0.69534192, 0.5451917 ],
-    [ 0.96504223, 0.7015636 , 0.5528892 ],
-    [ 0.96516917, 0.70776351, 0.5606593 ],
-    [ 0.96530224, 0.71394212, 0.56849894],
-    [ 0.96544032, 0.72010124, 0.57640375],
-    [ 0.96559206, 0.72623592, 0.58438387],
-    [ 0.96575293, 0.73235058, 0.59242739],
-    [ 0.96592829, 0.73844258, 0.60053991],
-    [ 0.96612013, 0.74451182, 0.60871954],
-    [ 0.96632832, 0.75055966, 0.61696136],
-    [ 0.96656022, 0.75658231, 0.62527295],
-    [ 0.96681185, 0.76258381, 0.63364277],
-    [ 0.96709183, 0.76855969, 0.64207921],
-    [ 0.96739773, 0.77451297, 0.65057302],
-    [ 0.96773482, 0.78044149, 0.65912731],
-    [ 0.96810471, 0.78634563, 0.66773889],
-    [ 0.96850919, 0.79222565, 0.6764046 ],
-    [ 0.96893132, 0.79809112, 0.68512266],
-    [ 0.96935926, 0.80395415, 0.69383201],
-    [ 0.9698028 , 0.80981139, 0.70252255],
-    [ 0.97025511, 0.81566605, 0.71120296],
-    [ 0.97071849, 0.82151775, 0.71987163],
-    [ 0.97120159, 0.82736371, 0.72851999],
-    [ 0.97169389, 0.83320847, 0.73716071],
-    [ 0.97220061, 0.83905052, 0.74578903],
-    [ 0.97272597, 0.84488881, 0.75440141],
-    [ 0.97327085, 0.85072354, 0.76299805],
-    [ 0.97383206, 0.85655639, 0.77158353],
-    [ 0.97441222, 0.86238689, 0.78015619],
-    [ 0.97501782, 0.86821321, 0.78871034],
-    [ 0.97564391, 0.87403763, 0.79725261],
-    [ 0.97628674, 0.87986189, 0.8057883 ],
-    [ 0.97696114, 0.88568129, 0.81430324],
-    [ 0.97765722, 0.89149971, 0.82280948],
-    [ 0.97837585, 0.89731727, 0.83130786],
-    [ 0.97912374, 0.90313207, 0.83979337],
-    [ 0.979891  , 0.90894778, 0.84827858],
-    [ 0.98067764, 0.91476465, 0.85676611],
-    [ 0.98137749, 0.92061729, 0.86536915]
-]
+import sys
+import types
 
+import numpy as np
 
-_mako_lut = [
-    [ 0.04503935, 0.01482344, 0.02092227],
-    [ 0.04933018, 0.01709292, 0.02535719],
-    [ 0.05356262, 0.01950702, 0.03018802],
-    [ 0.05774337, 0.02205989, 0.03545515],
-    [ 0.06188095, 0.02474764, 0.04115287],
-    [ 0.06598247, 0.0275665 , 0.04691409],
-    [ 0.07005374, 0.03051278, 0.05264306],
-    [ 0.07409947, 0.03358324, 0.05834631],
-    [ 0.07812339, 0.03677446, 0.06403249],
-    [ 0.08212852, 0.0400833 , 0.06970862],
-    [ 0.08611731, 0.04339148, 0.07538208],
-    [ 0.09009161, 0.04664706, 0.08105568],
-    [ 0.09405308, 0.04985685, 0.08673591],
-    [ 0.09800301, 0.05302279, 0.09242646],
-    [ 0.10194255, 0.05614641, 0.09813162],
-    [ 0.10587261, 0.05922941, 0.103854  ],
-    [ 0.1097942 , 0.06227277, 0.10959847],
-    [ 0.11370826, 0.06527747, 0.11536893],
-    [ 0.11761516, 0.06824548, 0.12116393],
-    [ 0.12151575, 0.07117741, 0.12698763],
-    [ 0.12541095, 0.07407363, 0.1328442 ],
-    [ 0.12930083, 0.07693611, 0.13873064],
-    [ 0.13317849, 0.07976988, 0.14465095],
-    [ 0.13701138, 0.08259683, 0.15060265],
-    [ 0.14079223, 0.08542126, 0.15659379],
-    [ 0.14452486, 0.08824175, 0.16262484],
-    [ 0.14820351, 0.09106304, 0.16869476],
-    [ 0.15183185, 0.09388372, 0.17480366],
-    [ 0.15540398, 0.09670855, 0.18094993],
-    [ 0.15892417, 0.09953561, 0.18713384],
-    [ 0.16238588, 0.10236998, 0.19335329],
-    [ 0.16579435, 0.10520905, 0.19960847],
-    [ 0.16914226, 0.10805832, 0.20589698],
-    [ 0.17243586, 0.11091443, 0.21221911],
-    [ 0.17566717, 0.11378321, 0.21857219],
-    [ 0.17884322, 0.11666074, 0.2249565 ],
-    [ 0.18195582, 0.11955283, 0.23136943],
-    [ 0.18501213, 0.12245547, 0.23781116],
-    [ 0.18800459, 0.12537395, 0.24427914],
-    [ 0.19093944, 0.1283047 , 0.25077369],
-    [ 0.19381092, 0.13125179, 0.25729255],
-    [ 0.19662307, 0.13421303, 0.26383543],
-    [ 0.19937337, 0.13719028, 0.27040111],
-    [ 0.20206187, 0.14018372, 0.27698891],
-    [ 0.20469116, 0.14319196, 0.28359861],
-    [ 0.20725547, 0.14621882, 0.29022775],
-    [ 0.20976258, 0.14925954, 0.29687795],
-    [ 0.21220409, 0.15231929, 0.30354703],
-    [ 0.21458611, 0.15539445, 0.31023563],
-    [ 0.21690827, 0.15848519, 0.31694355],
-    [ 0.21916481, 0.16159489, 0.32366939],
-    [ 0.2213631 , 0.16471913, 0.33041431],
-    [ 0.22349947, 0.1678599 , 0.33717781],
-    [ 0.2255714 , 0.1710185 , 0.34395925],
-    [ 0.22758415, 0.17419169, 0.35075983],
-    [ 0.22953569, 0.17738041, 0.35757941],
-    [ 0.23142077, 0.18058733, 0.3644173 ],
-    [ 0.2332454 , 0.18380872, 0.37127514],
-    [ 0.2350092 , 0.18704459, 0.3781528 ],
-    [ 0.23670785, 0.190297  , 0.38504973],
-    [ 0.23834119, 0.19356547, 0.39196711],
-    [ 0.23991189, 0.19684817, 0.39890581],
-    [ 0.24141903, 0.20014508, 0.4058667 ],
-    [ 0.24286214, 0.20345642, 0.4128484 ],
-    [ 0.24423453, 0.20678459, 0.41985299],
-    [ 0.24554109, 0.21012669, 0.42688124],
-    [ 0.2467815 , 0.21348266, 0.43393244],
-    [ 0.24795393, 0.21685249, 0.4410088 ],
-    [ 0.24905614, 0.22023618, 0.448113  ],
-    [ 0.25007383, 0.22365053, 0.45519562],
-    [ 0.25098926, 0.22710664, 0.46223892],
-    [ 0.25179696, 0.23060342, 0.46925447],
-    [ 0.25249346, 0.23414353, 0.47623196],
-    [ 0.25307401, 0.23772973, 0.48316271],
-    [ 0.25353152, 0.24136961, 0.49001976],
-    [ 0.25386167, 0.24506548, 0.49679407],
-    [ 0.25406082, 0.2488164 , 0.50348932],
-    [ 0.25412435, 0.25262843, 0.51007843],
-    [ 0.25404842, 0.25650743, 0.51653282],
-    [ 0.25383134, 0.26044852, 0.52286845],
-    [ 0.2534705 , 0.26446165, 0.52903422],
-    [ 0.25296722, 0.2685428 , 0.53503572],
-    [ 0.2523226 , 0.27269346, 0.54085315],
-    [ 0.25153974, 0.27691629, 0.54645752],
-    [ 0.25062402, 0.28120467, 0.55185939],
-    [ 0.24958205, 0.28556371, 0.55701246],
-    [ 0.24842386, 0.28998148, 0.56194601],
-    [ 0.24715928, 0.29446327, 0.56660884],
-    [ 0.24580099, 0.29899398, 0.57104399],
-    [ 0.24436202, 0.30357852, 0.57519929],
-    [ 0.24285591, 0.30819938, 0.57913247],
-    [ 0.24129828, 0.31286235, 0.58278615],
-    [ 0.23970131, 0.3175495 , 0.5862272 ],
-    [ 0.23807973, 0.32226344, 0.58941872],
-    [ 0.23644557, 0.32699241, 0.59240198],
-    [ 0.2348113 , 0.33173196, 0.59518282],
-    [ 0.23318874, 0.33648036, 0.59775543],
-    [ 0.2315855 , 0.34122763, 0.60016456],
-    [ 0.23001121, 0.34597357, 0.60240251],
-    [ 0.2284748 , 0.35071512, 0.6044784 ],
-    [ 0.22698081, 0.35544612, 0.60642528],
-    [ 0.22553305, 0.36016515, 0.60825252],
-    [ 0.22413977, 0.36487341, 0.60994938],
-    [ 0.22280246, 0.36956728, 0.61154118],
-    [ 0.22152555, 0.37424409, 0.61304472],
-    [ 0.22030752, 0.37890437, 0.61446646],
-    [ 0.2191538 , 0.38354668, 0.61581561],
-    [ 0.21806257, 0.38817169, 0.61709794],
-    [ 0.21703799, 0.39277882, 0.61831922],
-    [ 0.21607792, 0.39736958, 0.61948028],
-    [ 0.21518463, 0.40194196, 0.62059763],
-    [ 0.21435467, 0.40649717, 0.62167507],
-    [ 0.21358663, 0.41103579, 0.62271724],
-    [ 0.21288172, 0.41555771, 0.62373011],
-    [ 0.21223835, 0.42006355, 0.62471794],
-    [ 0.21165312, 0.42455441, 0.62568371],
-    [ 0.21112526, 0.42903064, 0.6266318 ],
-    [ 0.21065161, 0.43349321, 0.62756504],
-    [ 0.21023306, 0.43794288, 0.62848279],
-    [ 0.20985996, 0.44238227, 0.62938329],
-    [ 0.20951045, 0.44680966, 0.63030696],
-    [ 0.20916709, 0.45122981, 0.63124483],
-    [ 0.20882976, 0.45564335, 0.63219599],
-    [ 0.20849798, 0.46005094, 0.63315928],
-    [ 0.20817199, 0.46445309, 0.63413391],
-    [ 0.20785149, 0.46885041, 0.63511876],
-    [ 0.20753716, 0.47324327, 0.63611321],
-    [ 0.20722876, 0.47763224, 0.63711608],
-    [ 0.20692679, 0.48201774, 0.63812656],
-    [ 0.20663156, 0.48640018, 0.63914367],
-    [ 0.20634336, 0.49078002, 0.64016638],
-    [ 0.20606303, 0.49515755, 0.6411939 ],
-    [ 0.20578999, 0.49953341, 0.64222457],
-    [ 0.20552612, 0.50390766, 0.64325811],
-    [ 0.20527189, 0.50828072, 0.64429331],
-    [ 0.20502868, 0.51265277, 0.64532947],
-    [ 0.20479718, 0.51702417, 0.64636539],
-    [ 0.20457804, 0.52139527, 0.64739979],
-    [ 0.20437304, 0.52576622, 0.64843198],
-    [ 0.20418396, 0.53013715, 0.64946117],
-    [ 0.20401238, 0.53450825, 0.65048638],
-    [ 0.20385896, 0.53887991, 0.65150606],
-    [ 0.20372653, 0.54325208, 0.65251978],
-    [ 0.20361709, 0.5476249 , 0.6535266 ],
-    [ 0.20353258, 0.55199854, 0.65452542],
-    [ 0.20347472, 0.55637318, 0.655515  ],
-    [ 0.20344718, 0.56074869, 0.65649508],
-    [ 0.20345161, 0.56512531, 0.65746419],
-    [ 0.20349089, 0.56950304, 0.65842151],
-    [ 0.20356842, 0.57388184, 0.65936642],
-    [ 0.20368663, 0.57826181, 0.66029768],
-    [ 0.20384884, 0.58264293, 0.6612145 ],
-    [ 0.20405904, 0.58702506, 0.66211645],
-    [ 0.20431921, 0.59140842, 0.66300179],
-    [ 0.20463464, 0.59579264, 0.66387079],
-    [ 0.20500731, 0.60017798, 0.66472159],
-    [ 0.20544449, 0.60456387, 0.66555409],
-    [ 0.20596097, 0.60894927, 0.66636568],
-    [ 0.20654832, 0.61333521, 0.66715744],
-    [ 0.20721003, 0.61772167, 0.66792838],
-    [ 0.20795035, 0.62210845, 0.66867802],
-    [ 0.20877302, 0.62649546, 0.66940555],
-    [ 0.20968223, 0.63088252, 0.6701105 ],
-    [ 0.21068163, 0.63526951, 0.67079211],
-    [ 0.21177544, 0.63965621, 0.67145005],
-    [ 0.21298582, 0.64404072, 0.67208182],
-    [ 0.21430361, 0.64842404, 0.67268861],
-    [ 0.21572716, 0.65280655, 0.67326978],
-    [ 0.21726052, 0.65718791, 0.6738255 ],
-    [ 0.21890636, 0.66156803, 0.67435491],
-    [ 0.220668  , 0.66594665, 0.67485792],
-    [ 0.22255447, 0.67032297, 0.67533374],
-    [ 0.22458372, 0.67469531, 0.67578061],
-    [ 0.22673713, 0.67906542, 0.67620044],
-    [ 0.22901625, 0.6834332 , 0.67659251],
-    [ 0.23142316, 0.68779836, 0.67695703],
-    [ 0.23395924, 0.69216072, 0.67729378],
-    [ 0.23663857, 0.69651881, 0.67760151],
-    [ 0.23946645, 0.70087194, 0.67788018],
-    [ 0.24242624, 0.70522162, 0.67813088],
-    [ 0.24549008, 0.70957083, 0.67835215],
-    [ 0.24863372, 0.71392166, 0.67854868],
-    [ 0.25187832, 0.71827158, 0.67872193],
-    [ 0.25524083, 0.72261873, 0.67887024],
-    [ 0.25870947, 0.72696469, 0.67898912],
-    [ 0.26229238, 0.73130855, 0.67907645],
-    [ 0.26604085, 0.73564353, 0.67914062],
-    [ 0.26993099, 0.73997282, 0.67917264],
-    [ 0.27397488, 0.74429484, 0.67917096],
-    [ 0.27822463, 0.74860229, 0.67914468],
-    [ 0.28264201, 0.75290034, 0.67907959],
-    [ 0.2873016 , 0.75717817, 0.67899164],
-    [ 0.29215894, 0.76144162, 0.67886578],
-    [ 0.29729823, 0.76567816, 0.67871894],
-    [ 0.30268199, 0.76989232, 0.67853896],
-    [ 0.30835665, 0.77407636, 0.67833512],
-    [ 0.31435139, 0.77822478, 0.67811118],
-    [ 0.3206671 , 0.78233575, 0.67786729],
-    [ 0.32733158, 0.78640315, 0.67761027],
-    [ 0.33437168, 0.79042043, 0.67734882],
-    [ 0.34182112, 0.79437948, 0.67709394],
-    [ 0.34968889, 0.79827511, 0.67685638],
-    [ 0.35799244, 0.80210037, 0.67664969],
-    [ 0.36675371, 0.80584651, 0.67649539],
-    [ 0.3759816 , 0.80950627, 0.67641393],
-    [ 0.38566792, 0.81307432, 0.67642947],
-    [ 0.39579804, 0.81654592, 0.67656899],
-    [ 0.40634556, 0.81991799, 0.67686215],
-    [ 0.41730243, 0.82318339, 0.67735255],
-    [ 0.4285828 , 0.82635051, 0.6780564 ],
-    [ 0.44012728, 0.82942353, 0.67900049],
-    [ 0.45189421, 0.83240398, 0.68021733],
-    [ 0.46378379, 0.83530763, 0.6817062 ],
-    [ 0.47573199, 0.83814472, 0.68347352],
-    [ 0.48769865, 0.84092197, 0.68552698],
-    [ 0.49962354, 0.84365379, 0.68783929],
-    [ 0.5114027 , 0.8463718 , 0.69029789],
-    [ 0.52301693, 0.84908401, 0.69288545],
-    [ 0.53447549, 0.85179048, 0.69561066],
-    [ 0.54578602, 0.8544913 , 0.69848331],
-    [ 0.55695565, 0.85718723, 0.70150427],
-    [ 0.56798832, 0.85987893, 0.70468261],
-    [ 0.57888639, 0.86256715, 0.70802931],
-    [ 0.5896541 , 0.8652532 , 0.71154204],
-    [ 0.60028928, 0.86793835, 0.71523675],
-    [ 0.61079441, 0.87062438, 0.71910895],
-    [ 0.62116633, 0.87331311, 0.72317003],
-    [ 0.63140509, 0.87600675, 0.72741689],
-    [ 0.64150735, 0.87870746, 0.73185717],
-    [ 0.65147219, 0.8814179 , 0.73648495],
-    [ 0.66129632, 0.8841403 , 0.74130658],
-    [ 0.67097934, 0.88687758, 0.74631123],
-    [ 0.68051833, 0.88963189, 0.75150483],
-    [ 0.68991419, 0.89240612, 0.75687187],
-    [ 0.69916533, 0.89520211, 0.76241714],
-    [ 0.70827373, 0.89802257, 0.76812286],
-    [ 0.71723995, 0.90086891, 0.77399039],
-    [ 0.72606665, 0.90374337, 0.7800041 ],
-    [ 0.73475675, 0.90664718, 0.78615802],
-    [ 0.74331358, 0.90958151, 0.79244474],
-    [ 0.75174143, 0.91254787, 0.79884925],
-    [ 0.76004473, 0.91554656, 0.80536823],
-    [ 0.76827704, 0.91856549, 0.81196513],
-    [ 0.77647029, 0.921603  , 0.81855729],
-    [ 0.78462009, 0.92466151, 0.82514119],
-    [ 0.79273542, 0.92773848, 0.83172131],
-    [ 0.8008109 , 0.93083672, 0.83829355],
-    [ 0.80885107, 0.93395528, 0.84485982],
-    [ 0.81685878, 0.9370938 , 0.85142101],
-    [ 0.82483206, 0.94025378, 0.8579751 ],
-    [ 0.83277661, 0.94343371, 0.86452477],
-    [ 0.84069127, 0.94663473, 0.87106853],
-    [ 0.84857662, 0.9498573 , 0.8776059 ],
-    [ 0.8564431 , 0.95309792, 0.88414253],
-    [ 0.86429066, 0.95635719, 0.89067759],
-    [ 0.87218969, 0.95960708, 0.89725384]
-]
+_rocket_lut = """
+0.01060815 0.01808215 0.10018654
+0.01428972 0.02048237 0.10374486
+0.01831941 0.02297660 0.10738511
+0.02275049 0.02554464 0.11108639
+0.02759119 0.02818316 0.11483751
+0.03285175 0.03088792 0.11863035
+0.03853466 0.03365771 0.12245873
+0.04447016 0.03648425 0.12631831
+0.05032105 0.03936808 0.13020508
+0.05611171 0.04224835 0.13411624
+0.06185310 0.04504866 0.13804929
+0.06755457 0.04778179 0.14200206
+0.07322360 0.05045047 0.14597263
+0.07887080 0.05305461 0.14995981
+0.08450105 0.05559631 0.15396203
+0.09011319 0.05808059 0.15797687
+0.09572396 0.06050127 0.16200507
+0.10132312 0.06286782 0.16604287
+0.10692823 0.06517224 0.17009175
+0.11253150 0.06742194 0.17414848
+0.11813947 0.06961499 0.17821272
+0.12375803 0.07174938 0.18228425
+0.12938228 0.07383015 0.18636053
+0.13501631 0.07585609 0.19044109
+0.14066867 0.07782240 0.19452676
+0.14633406 0.07973393 0.19861510
+0.15201338 0.08159108 0.20270523
+0.15770877 0.08339312 0.20679668
+0.16342174 0.08513960 0.21088893
+0.16915387 0.08682996 0.21498104
+0.17489524 0.08848235 0.21902940
+0.18065495 0.09009031 0.22303512
+0.18643324 0.09165431 0.22699705
+0.19223028 0.09317479 0.23091409
+0.19804623 0.09465217 0.23478512
+0.20388117 0.09608689 0.23860907
+0.20973515 0.09747934 0.24238489
+0.21560818 0.09882993 0.24611154
+0.22150014 0.10013944 0.24978680
+0.22741085 0.10140876 0.25340813
+0.23334047 0.10263737 0.25697736
+0.23928891 0.10382562 0.26049360
+0.24525608 0.10497384 0.26395596
+0.25124182 0.10608236 0.26736359
+0.25724602 0.10715148 0.27071569
+0.26326851 0.10818150 0.27401148
+0.26930915 0.10917270 0.27725020
+0.27536766 0.11012568 0.28043021
+0.28144375 0.11104133 0.28354890
+0.28753740 0.11191896 0.28660853
+0.29364846 0.11275876 0.28960850
+0.29977678 0.11356089 0.29254823
+0.30592213 0.11432553 0.29542718
+0.31208435 0.11505284 0.29824485
+0.31826327 0.11574290 0.30100076
+0.32445869 0.11639585 0.30369448
+0.33067031 0.11701189 0.30632563
+0.33689808 0.11759095 0.30889380
+0.34314168 0.11813362 0.31139721
+0.34940101 0.11863987 0.31383550
+0.35567600 0.11910909 0.31620996
+0.36196644 0.11954130 0.31852037
+0.36827206 0.11993653 0.32076656
+0.37459292 0.12029443 0.32294825
+0.38092887 0.12061482 0.32506528
+0.38727975 0.12089756 0.32711750
+0.39364518 0.12114272 0.32910494
+0.40002537 0.12134964 0.33102734
+0.40642019 0.12151801 0.33288464
+0.41282936 0.12164769 0.33467689
+0.41925278 0.12173833 0.33640407
+0.42569057 0.12178916 0.33806605
+0.43214263 0.12179973 0.33966284
+0.43860848 0.12177004 0.34119475
+0.44508855 0.12169883 0.34266151
+0.45158266 0.12158557 0.34406324
+0.45809049 0.12142996 0.34540024
+0.46461238 0.12123063 0.34667231
+0.47114798 0.12098721 0.34787978
+0.47769736 0.12069864 0.34902273
+0.48426077 0.12036349 0.35010104
+0.49083761 0.11998161 0.35111537
+0.49742847 0.11955087 0.35206533
+0.50403286 0.11907081 0.35295152
+0.51065109 0.11853959 0.35377385
+0.51728314 0.11795580 0.35453252
+0.52392883 0.11731817 0.35522789
+0.53058853 0.11662445 0.35585982
+0.53726173 0.11587369 0.35642903
+0.54394898 0.11506307 0.35693521
+0.55064260 0.11420757 0.35737863
+0.55734473 0.11330456 0.35775059
+0.56405586 0.11235265 0.35804813
+0.57077365 0.11135597 0.35827146
+0.57749910 0.11031233 0.35841679
+0.58422945 0.10922707 0.35848469
+0.59096382 0.10810205 0.35847347
+0.59770215 0.10693774 0.35838029
+0.60444226 0.10573912 0.35820487
+0.61118304 0.10450943 0.35794557
+0.61792306 0.10325288 0.35760108
+0.62466162 0.10197244 0.35716891
+0.63139686 0.10067417 0.35664819
+0.63812122 0.09938212 0.35603757
+0.64483795 0.09808910 0.35533555
+0.65154562 0.09680192 0.35454107
+0.65824241 0.09552918 0.35365290
+0.66492652 0.09428017 0.35266970
+0.67159578 0.09306598 0.35159077
+0.67824099 0.09192342 0.35041480
+0.68486300 0.09085633 0.34914061
+0.69146268 0.08986750 0.34776864
+0.69803757 0.08897226 0.34629860
+0.70457834 0.08821290 0.34473046
+0.71108138 0.08761223 0.34306350
+0.71755070 0.08716212 0.34129974
+0.72398193 0.08688725 0.33943958
+0.73035829 0.08686230 0.33748452
+0.73669146 0.08704683 0.33543669
+0.74297501 0.08747196 0.33329799
+0.74919318 0.08820542 0.33107204
+0.75535825 0.08919792 0.32876184
+0.76145589 0.09050716 0.32637117
+0.76748424 0.09213602 0.32390525
+0.77344838 0.09405684 0.32136808
+0.77932641 0.09634794 0.31876642
+0.78513609 0.09892473 0.31610488
+0.79085854 0.10184672 0.31339100
+0.79650140 0.10506637 0.31063031
+0.80205987 0.10858333 0.30783000
+0.80752799 0.11239964 0.30499738
+0.81291606 0.11645784 0.30213802
+0.81820481 0.12080606 0.29926105
+0.82341472 0.12535343 0.29637050
+0.82852822 0.13014118 0.29347474
+0.83355779 0.13511035 0.29057852
+0.83850183 0.14025098 0.28768780
+0.84335441 0.14556683 0.28480819
+0.84813096 0.15099892 0.28194300
+0.85281737 0.15657772 0.27909826
+0.85742602 0.16225830 0.27627462
+0.86196552 0.16801239 0.27346473
+0.86641628 0.17387796 0.27070818
+0.87079129 0.17982114 0.26797378
+0.87507281 0.18587368 0.26529697
+0.87925878 0.19203259 0.26268136
+0.88334170 0.19830556 0.26014181
+0.88731387 0.20469941 0.25769539
+0.89116859 0.21121788 0.25535920
+0.89490337 0.21785614 0.25314362
+0.89850260 0.22463251 0.25108745
+0.90197527 0.23152063 0.24918223
+0.90530097 0.23854541 0.24748098
+0.90848638 0.24568473 0.24598324
+0.91153300 0.25292623 0.24470258
+0.91442250 0.26028902 0.24369359
+0.91717106 0.26773821 0.24294137
+0.91978131 0.27526191 0.24245973
+0.92223947 0.28287251 0.24229568
+0.92456587 0.29053388 0.24242622
+0.92676657 0.29823282 0.24285536
+0.92882964 0.30598085 0.24362274
+0.93078135 0.31373977 0.24468803
+0.93262051 0.32150930 0.24606461
+0.93435067 0.32928362 0.24775328
+0.93599076 0.33703942 0.24972157
+0.93752831 0.34479177 0.25199928
+0.93899289 0.35250734 0.25452808
+0.94036561 0.36020899 0.25734661
+0.94167588 0.36786594 0.26039490
+0.94291042 0.37549479 0.26369821
+0.94408513 0.38308110 0.26722004
+0.94520419 0.39062329 0.27094924
+0.94625977 0.39813168 0.27489742
+0.94727016 0.40559090 0.27902322
+0.94823505 0.41300424 0.28332283
+0.94914549 0.42038251 0.28780969
+0.95001704 0.42771398 0.29244728
+0.95085121 0.43500005 0.29722817
+0.95165009 0.44224144 0.30214494
+0.95240440 0.44944853 0.30721050
+0.95312556 0.45661389 0.31239776
+0.95381595 0.46373781 0.31769923
+0.95447591 0.47082238 0.32310953
+0.95510255 0.47787236 0.32862553
+0.95569679 0.48489115 0.33421404
+0.95626788 0.49187351 0.33985601
+0.95681685 0.49882008 0.34555431
+0.95734390 0.50573243 0.35130912
+0.95784842 0.51261283 0.35711942
+0.95833051 0.51946267 0.36298589
+0.95879054 0.52628305 0.36890904
+0.95922872 0.53307513 0.37488950
+0.95964538 0.53983991 0.38092784
+0.96004345 0.54657593 0.38702920
+0.96042097 0.55328624 0.39319057
+0.96077819 0.55997184 0.39941173
+0.96111520 0.56663370 0.40569343
+0.96143273 0.57327231 0.41203603
+0.96173392 0.57988594 0.41844491
+0.96201757 0.58647675 0.42491751
+0.96228344 0.59304598 0.43145271
+0.96253168 0.59959440 0.43805131
+0.96276513 0.60612062 0.44471698
+0.96298491 0.61262470 0.45145074
+0.96318967 0.61910879 0.45824902
+0.96337949 0.62557360 0.46511271
+0.96355923 0.63201624 0.47204746
+0.96372785 0.63843852 0.47905028
+0.96388426 0.64484214 0.48611960
+0.96403203 0.65122535 0.49325780
+0.96417332 0.65758729 0.50046894
+0.96430630 0.66393045 0.50774670
+0.96443322 0.67025402 0.51509334
+0.96455845 0.67655564 0.52251447
+0.96467922 0.68283846 0.53000231
+0.96479861 0.68910113 0.53756026
+0.96492035 0.69534192 0.54519170
+0.96504223 0.70156360 0.55288920
+0.96516917 0.70776351 0.56065930
+0.96530224 0.71394212 0.56849894
+0.96544032 0.72010124 0.57640375
+0.96559206 0.72623592 0.58438387
+0.96575293 0.73235058 0.59242739
+0.96592829 0.73844258 0.60053991
+0.96612013 0.74451182 0.60871954
+0.96632832 0.75055966 0.61696136
+0.96656022 0.75658231 0.62527295
+0.96681185 0.76258381 0.63364277
+0.96709183 0.76855969 0.64207921
+0.96739773 0.77451297 0.65057302
+0.96773482 0.78044149 0.65912731
+0.96810471 0.78634563 0.66773889
+0.96850919 0.79222565 0.67640460
+0.96893132 0.79809112 0.68512266
+0.96935926 0.80395415 0.69383201
+0.96980280 0.80981139 0.70252255
+0.97025511 0.81566605 0.71120296
+0.97071849 0.82151775 0.71987163
+0.97120159 0.82736371 0.72851999
+0.97169389 0.83320847 0.73716071
+0.97220061 0.83905052 0.74578903
+0.97272597 0.84488881 0.75440141
+0.97327085 0.85072354 0.76299805
+0.97383206 0.85655639 0.77158353
+0.97441222 0.86238689 0.78015619
+0.97501782 0.86821321 0.78871034
+0.97564391 0.87403763 0.79725261
+0.97628674 0.87986189 0.80578830
+0.97696114 0.88568129 0.81430324
+0.97765722 0.89149971 0.82280948
+0.97837585 0.89731727 0.83130786
+0.97912374 0.90313207 0.83979337
+0.97989100 0.90894778 0.84827858
+0.98067764 0.91476465 0.85676611
+0.98137749 0.92061729 0.86536915
+"""
 
+_mako_lut = """
+0.04503935 0.01482344 0.02092227
+0.04933018 0.01709292 0.02535719
+0.05356262 0.01950702 0.03018802
+0.05774337 0.02205989 0.03545515
+0.06188095 0.02474764 0.04115287
+0.06598247 0.02756650 0.04691409
+0.07005374 0.03051278 0.05264306
+0.07409947 0.03358324 0.05834631
+0.07812339 0.03677446 0.06403249
+0.08212852 0.04008330 0.06970862
+0.08611731 0.04339148 0.07538208
+0.09009161 0.04664706 0.08105568
+0.09405308 0.04985685 0.08673591
+0.09800301 0.05302279 0.09242646
+0.10194255 0.05614641 0.09813162
+0.10587261 0.05922941 0.10385400
+0.10979420 0.06227277 0.10959847
+0.11370826 0.06527747 0.11536893
+0.11761516 0.06824548 0.12116393
+0.12151575 0.07117741 0.12698763
+0.12541095 0.07407363 0.13284420
+0.12930083 0.07693611 0.13873064
+0.13317849 0.07976988 0.14465095
+0.13701138 0.08259683 0.15060265
+0.14079223 0.08542126 0.15659379
+0.14452486 0.08824175 0.16262484
+0.14820351 0.09106304 0.16869476
+0.15183185 0.09388372 0.17480366
+0.15540398 0.09670855 0.18094993
+0.15892417 0.09953561 0.18713384
+0.16238588 0.10236998 0.19335329
+0.16579435 0.10520905 0.19960847
+0.16914226 0.10805832 0.20589698
+0.17243586 0.11091443 0.21221911
+0.17566717 0.11378321 0.21857219
+0.17884322 0.11666074 0.22495650
+0.18195582 0.11955283 0.23136943
+0.18501213 0.12245547 0.23781116
+0.18800459 0.12537395 0.24427914
+0.19093944 0.12830470 0.25077369
+0.19381092 0.13125179 0.25729255
+0.19662307 0.13421303 0.26383543
+0.19937337 0.13719028 0.27040111
+0.20206187 0.14018372 0.27698891
+0.20469116 0.14319196 0.28359861
+0.20725547 0.14621882 0.29022775
+0.20976258 0.14925954 0.29687795
+0.21220409 0.15231929 0.30354703
+0.21458611 0.15539445 0.31023563
+0.21690827 0.15848519 0.31694355
+0.21916481 0.16159489 0.32366939
+0.22136310 0.16471913 0.33041431
+0.22349947 0.16785990 0.33717781
+0.22557140 0.17101850 0.34395925
+0.22758415 0.17419169 0.35075983
+0.22953569 0.17738041 0.35757941
+0.23142077 0.18058733 0.36441730
+0.23324540 0.18380872 0.37127514
+0.23500920 0.18704459 0.37815280
+0.23670785 0.19029700 0.38504973
+0.23834119 0.19356547 0.39196711
+0.23991189 0.19684817 0.39890581
+0.24141903 0.20014508 0.40586670
+0.24286214 0.20345642 0.41284840
+0.24423453 0.20678459 0.41985299
+0.24554109 0.21012669 0.42688124
+0.24678150 0.21348266 0.43393244
+0.24795393 0.21685249 0.44100880
+0.24905614 0.22023618 0.44811300
+0.25007383 0.22365053 0.45519562
+0.25098926 0.22710664 0.46223892
+0.25179696 0.23060342 0.46925447
+0.25249346 0.23414353 0.47623196
+0.25307401 0.23772973 0.48316271
+0.25353152 0.24136961 0.49001976
+0.25386167 0.24506548 0.49679407
+0.25406082 0.24881640 0.50348932
+0.25412435 0.25262843 0.51007843
+0.25404842 0.25650743 0.51653282
+0.25383134 0.26044852 0.52286845
+0.25347050 0.26446165 0.52903422
+0.25296722 0.26854280 0.53503572
+0.25232260 0.27269346 0.54085315
+0.25153974 0.27691629 0.54645752
+0.25062402 0.28120467 0.55185939
+0.24958205 0.28556371 0.55701246
+0.24842386 0.28998148 0.56194601
+0.24715928 0.29446327 0.56660884
+0.24580099 0.29899398 0.57104399
+0.24436202 0.30357852 0.57519929
+0.24285591 0.30819938 0.57913247
+0.24129828 0.31286235 0.58278615
+0.23970131 0.31754950 0.58622720
+0.23807973 0.32226344 0.58941872
+0.23644557 0.32699241 0.59240198
+0.23481130 0.33173196 0.59518282
+0.23318874 0.33648036 0.59775543
+0.23158550 0.34122763 0.60016456
+0.23001121 0.34597357 0.60240251
+0.22847480 0.35071512 0.60447840
+0.22698081 0.35544612 0.60642528
+0.22553305 0.36016515 0.60825252
+0.22413977 0.36487341 0.60994938
+0.22280246 0.36956728 0.61154118
+0.22152555 0.37424409 0.61304472
+0.22030752 0.37890437 0.61446646
+0.21915380 0.38354668 0.61581561
+0.21806257 0.38817169 0.61709794
+0.21703799 0.39277882 0.61831922
+0.21607792 0.39736958 0.61948028
+0.21518463 0.40194196 0.62059763
+0.21435467 0.40649717 0.62167507
+0.21358663 0.41103579 0.62271724
+0.21288172 0.41555771 0.62373011
+0.21223835 0.42006355 0.62471794
+0.21165312 0.42455441 0.62568371
+0.21112526 0.42903064 0.62663180
+0.21065161 0.43349321 0.62756504
+0.21023306 0.43794288 0.62848279
+0.20985996 0.44238227 0.62938329
+0.20951045 0.44680966 0.63030696
+0.20916709 0.45122981 0.63124483
+0.20882976 0.45564335 0.63219599
+0.20849798 0.46005094 0.63315928
+0.20817199 0.46445309 0.63413391
+0.20785149 0.46885041 0.63511876
+0.20753716 0.47324327 0.63611321
+0.20722876 0.47763224 0.63711608
+0.20692679 0.48201774 0.63812656
+0.20663156 0.48640018 0.63914367
+0.20634336 0.49078002 0.64016638
+0.20606303 0.49515755 0.64119390
+0.20578999 0.49953341 0.64222457
+0.20552612 0.50390766 0.64325811
+0.20527189 0.50828072 0.64429331
+0.20502868 0.51265277 0.64532947
+0.20479718 0.51702417 0.64636539
+0.20457804 0.52139527 0.64739979
+0.20437304 0.52576622 0.64843198
+0.20418396 0.53013715 0.64946117
+0.20401238 0.53450825 0.65048638
+0.20385896 0.53887991 0.65150606
+0.20372653 0.54325208 0.65251978
+0.20361709 0.54762490 0.65352660
+0.20353258 0.55199854 0.65452542
+0.20347472 0.55637318 0.65551500
+0.20344718 0.56074869 0.65649508
+0.20345161 0.56512531 0.65746419
+0.20349089 0.56950304 0.65842151
+0.20356842 0.57388184 0.65936642
+0.20368663 0.57826181 0.66029768
+0.20384884 0.58264293 0.66121450
+0.20405904 0.58702506 0.66211645
+0.20431921 0.59140842 0.66300179
+0.20463464 0.59579264 0.66387079
+0.20500731 0.60017798 0.66472159
+0.20544449 0.60456387 0.66555409
+0.20596097 0.60894927 0.66636568
+0.20654832 0.61333521 0.66715744
+0.20721003 0.61772167 0.66792838
+0.20795035 0.62210845 0.66867802
+0.20877302 0.62649546 0.66940555
+0.20968223 0.63088252 0.67011050
+0.21068163 0.63526951 0.67079211
+0.21177544 0.63965621 0.67145005
+0.21298582 0.64404072 0.67208182
+0.21430361 0.64842404 0.67268861
+0.21572716 0.65280655 0.67326978
+0.21726052 0.65718791 0.67382550
+0.21890636 0.66156803 0.67435491
+0.22066800 0.66594665 0.67485792
+0.22255447 0.67032297 0.67533374
+0.22458372 0.67469531 0.67578061
+0.22673713 0.67906542 0.67620044
+0.22901625 0.68343320 0.67659251
+0.23142316 0.68779836 0.67695703
+0.23395924 0.69216072 0.67729378
+0.23663857 0.69651881 0.67760151
+0.23946645 0.70087194 0.67788018
+0.24242624 0.70522162 0.67813088
+0.24549008 0.70957083 0.67835215
+0.24863372 0.71392166 0.67854868
+0.25187832 0.71827158 0.67872193
+0.25524083 0.72261873 0.67887024
+0.25870947 0.72696469 0.67898912
+0.26229238 0.73130855 0.67907645
+0.26604085 0.73564353 0.67914062
+0.26993099 0.73997282 0.67917264
+0.27397488 0.74429484 0.67917096
+0.27822463 0.74860229 0.67914468
+0.28264201 0.75290034 0.67907959
+0.28730160 0.75717817 0.67899164
+0.29215894 0.76144162 0.67886578
+0.29729823 0.76567816 0.67871894
+0.30268199 0.76989232 0.67853896
+0.30835665 0.77407636 0.67833512
+0.31435139 0.77822478 0.67811118
+0.32066710 0.78233575 0.67786729
+0.32733158 0.78640315 0.67761027
+0.33437168 0.79042043 0.67734882
+0.34182112 0.79437948 0.67709394
+0.34968889 0.79827511 0.67685638
+0.35799244 0.80210037 0.67664969
+0.36675371 0.80584651 0.67649539
+0.37598160 0.80950627 0.67641393
+0.38566792 0.81307432 0.67642947
+0.39579804 0.81654592 0.67656899
+0.40634556 0.81991799 0.67686215
+0.41730243 0.82318339 0.67735255
+0.42858280 0.82635051 0.67805640
+0.44012728 0.82942353 0.67900049
+0.45189421 0.83240398 0.68021733
+0.46378379 0.83530763 0.68170620
+0.47573199 0.83814472 0.68347352
+0.48769865 0.84092197 0.68552698
+0.49962354 0.84365379 0.68783929
+0.51140270 0.84637180 0.69029789
+0.52301693 0.84908401 0.69288545
+0.53447549 0.85179048 0.69561066
+0.54578602 0.85449130 0.69848331
+0.55695565 0.85718723 0.70150427
+0.56798832 0.85987893 0.70468261
+0.57888639 0.86256715 0.70802931
+0.58965410 0.86525320 0.71154204
+0.60028928 0.86793835 0.71523675
+0.61079441 0.87062438 0.71910895
+0.62116633 0.87331311 0.72317003
+0.63140509 0.87600675 0.72741689
+0.64150735 0.87870746 0.73185717
+0.65147219 0.88141790 0.73648495
+0.66129632 0.88414030 0.74130658
+0.67097934 0.88687758 0.74631123
+0.68051833 0.88963189 0.75150483
+0.68991419 0.89240612 0.75687187
+0.69916533 0.89520211 0.76241714
+0.70827373 0.89802257 0.76812286
+0.71723995 0.90086891 0.77399039
+0.72606665 0.90374337 0.78000410
+0.73475675 0.90664718 0.78615802
+0.74331358 0.90958151 0.79244474
+0.75174143 0.91254787 0.79884925
+0.76004473 0.91554656 0.80536823
+0.76827704 0.91856549 0.81196513
+0.77647029 0.92160300 0.81855729
+0.78462009 0.92466151 0.82514119
+0.79273542 0.92773848 0.83172131
+0.80081090 0.93083672 0.83829355
+0.80885107 0.93395528 0.84485982
+0.81685878 0.93709380 0.85142101
+0.82483206 0.94025378 0.85797510
+0.83277661 0.94343371 0.86452477
+0.84069127 0.94663473 0.87106853
+0.84857662 0.94985730 0.87760590
+0.85644310 0.95309792 0.88414253
+0.86429066 0.95635719 0.89067759
+0.87218969 0.95960708 0.89725384
+"""
 
-_vlag_lut = [
-    [ 0.13850039, 0.41331206, 0.74052025],
-    [ 0.15077609, 0.41762684, 0.73970427],
-    [ 0.16235219, 0.4219191 , 0.7389667 ],
-    [ 0.1733322 , 0.42619024, 0.73832537],
-    [ 0.18382538, 0.43044226, 0.73776764],
-    [ 0.19394034, 0.4346772 , 0.73725867],
-    [ 0.20367115, 0.43889576, 0.73685314],
-    [ 0.21313625, 0.44310003, 0.73648045],
-    [ 0.22231173, 0.44729079, 0.73619681],
-    [ 0.23125148, 0.45146945, 0.73597803],
-    [ 0.23998101, 0.45563715, 0.7358223 ],
-    [ 0.24853358, 0.45979489, 0.73571524],
-    [ 0.25691416, 0.4639437 , 0.73566943],
-    [ 0.26513894, 0.46808455, 0.73568319],
-    [ 0.27322194, 0.47221835, 0.73575497],
-    [ 0.28117543, 0.47634598, 0.73588332],
-    [ 0.28901021, 0.48046826, 0.73606686],
-    [ 0.2967358 , 0.48458597, 0.73630433],
-    [ 0.30436071, 0.48869986, 0.73659451],
-    [ 0.3118955 , 0.49281055, 0.73693255],
-    [ 0.31935389, 0.49691847, 0.73730851],
-    [ 0.32672701, 0.5010247 , 0.73774013],
-    [ 0.33402607, 0.50512971, 0.73821941],
-    [ 0.34125337, 0.50923419, 0.73874905],
-    [ 0.34840921, 0.51333892, 0.73933402],
-    [ 0.35551826, 0.51744353, 0.73994642],
-    [ 0.3625676 , 0.52154929, 0.74060763],
-    [ 0.36956356, 0.52565656, 0.74131327],
-    [ 0.37649902, 0.52976642, 0.74207698],
-    [ 0.38340273, 0.53387791, 0.74286286],
-    [ 0.39025859, 0.53799253, 0.7436962 ],
-    [ 0.39706821, 0.54211081, 0.744578  ],
-    [ 0.40384046, 0.54623277, 0.74549872],
-    [ 0.41058241, 0.55035849, 0.74645094],
-    [ 0.41728385, 0.55448919, 0.74745174],
-    [ 0.42395178, 0.55862494, 0.74849357],
-    [ 0.4305964 , 0.56276546, 0.74956387],
-    [ 0.4372044 , 0.56691228, 0.75068412],
-    [ 0.4437909 , 0.57106468, 0.75183427],
-    [ 0.45035117, 0.5752235 , 0.75302312],
-    [ 0.45687824, 0.57938983, 0.75426297],
-    [ 0.46339713, 0.58356191, 0.75551816],
-    [ 0.46988778, 0.58774195, 0.75682037],
-    [ 0.47635605, 0.59192986, 0.75816245],
-    [ 0.48281101, 0.5961252 , 0.75953212],
-    [ 0.4892374 , 0.60032986, 0.76095418],
-    [ 0.49566225, 0.60454154, 0.76238852],
-    [ 0.50206137, 0.60876307, 0.76387371],
-    [ 0.50845128, 0.61299312, 0.76538551],
-    [ 0.5148258 , 0.61723272, 0.76693475],
-    [ 0.52118385, 0.62148236, 0.76852436],
-    [ 0.52753571, 0.62574126, 0.77013939],
-    [ 0.53386831, 0.63001125, 0.77180152],
-    [ 0.54020159, 0.63429038, 0.7734803 ],
-    [ 0.54651272, 0.63858165, 0.77521306],
-    [ 0.55282975, 0.64288207, 0.77695608],
-    [ 0.55912585, 0.64719519, 0.77875327],
-    [ 0.56542599, 0.65151828, 0.78056551],
-    [ 0.57170924, 0.65585426, 0.78242747],
-    [ 0.57799572, 0.6602009 , 0.78430751],
-    [ 0.58426817, 0.66456073, 0.78623458],
-    [ 0.590544  , 0.66893178, 0.78818117],
-    [ 0.59680758, 0.67331643, 0.79017369],
-    [ 0.60307553, 0.67771273, 0.79218572],
-    [ 0.60934065, 0.68212194, 0.79422987],
-    [ 0.61559495, 0.68654548, 0.7963202 ],
-    [ 0.62185554, 0.69098125, 0.79842918],
-    [ 0.62810662, 0.69543176, 0.80058381],
-    [ 0.63436425, 0.69989499, 0.80275812],
-    [ 0.64061445, 0.70437326, 0.80497621],
-    [ 0.6468706 , 0.70886488, 0.80721641],
-    [ 0.65312213, 0.7133717 , 0.80949719],
-    [ 0.65937818, 0.71789261, 0.81180392],
-    [ 0.66563334, 0.72242871, 0.81414642],
-    [ 0.67189155, 0.72697967, 0.81651872],
-    [ 0.67815314, 0.73154569, 0.81892097],
-    [ 0.68441395, 0.73612771, 0.82136094],
-    [ 0.69068321, 0.74072452, 0.82382353],
-    [ 0.69694776, 0.7453385 , 0.82633199],
-    [ 0.70322431, 0.74996721, 0.8288583 ],
-    [ 0.70949595, 0.75461368, 0.83143221],
-    [ 0.7157774 , 0.75927574, 0.83402904],
-    [ 0.72206299, 0.76395461, 0.83665922],
-    [ 0.72835227, 0.76865061, 0.8393242 ],
-    [ 0.73465238, 0.7733628 , 0.84201224],
-    [ 0.74094862, 0.77809393, 0.84474951],
-    [ 0.74725683, 0.78284158, 0.84750915],
-    [ 0.75357103, 0.78760701, 0.85030217],
-    [ 0.75988961, 0.79239077, 0.85313207],
-    [ 0.76621987, 0.79719185, 0.85598668],
-    [ 0.77255045, 0.8020125 , 0.85888658],
-    [ 0.77889241, 0.80685102, 0.86181298],
-    [ 0.78524572, 0.81170768, 0.86476656],
-    [ 0.79159841, 0.81658489, 0.86776906],
-    [ 0.79796459, 0.82148036, 0.8707962 ],
-    [ 0.80434168, 0.82639479, 0.87385315],
-    [ 0.8107221 , 0.83132983, 0.87695392],
-    [ 0.81711301, 0.8362844 , 0.88008641],
-    [ 0.82351479, 0.84125863, 0.88325045],
-    [ 0.82992772, 0.84625263, 0.88644594],
-    [ 0.83634359, 0.85126806, 0.8896878 ],
-    [ 0.84277295, 0.85630293, 0.89295721],
-    [ 0.84921192, 0.86135782, 0.89626076],
-    [ 0.85566206, 0.866432  , 0.89959467],
-    [ 0.86211514, 0.87152627, 0.90297183],
-    [ 0.86857483, 0.87663856, 0.90638248],
-    [ 0.87504231, 0.88176648, 0.90981938],
-    [ 0.88151194, 0.88690782, 0.91328493],
-    [ 0.88797938, 0.89205857, 0.91677544],
-    [ 0.89443865, 0.89721298, 0.9202854 ],
-    [ 0.90088204, 0.90236294, 0.92380601],
-    [ 0.90729768, 0.90749778, 0.92732797],
-    [ 0.91367037, 0.91260329, 0.93083814],
-    [ 0.91998105, 0.91766106, 0.93431861],
-    [ 0.92620596, 0.92264789, 0.93774647],
-    [ 0.93231683, 0.9275351 , 0.94109192],
-    [ 0.93827772, 0.9322888 , 0.94432312],
-    [ 0.94404755, 0.93686925, 0.94740137],
-    [ 0.94958284, 0.94123072, 0.95027696],
-    [ 0.95482682, 0.9453245 , 0.95291103],
-    [ 0.9597248 , 0.94909728, 0.95525103],
-    [ 0.96422552, 0.95249273, 0.95723271],
-    [ 0.96826161, 0.95545812, 0.95882188],
-    [ 0.97178458, 0.95793984, 0.95995705],
-    [ 0.97474105, 0.95989142, 0.96059997],
-    [ 0.97708604, 0.96127366, 0.96071853],
-    [ 0.97877855, 0.96205832, 0.96030095],
-    [ 0.97978484, 0.96222949, 0.95935496],
-    [ 0.9805997 , 0.96155216, 0.95813083],
-    [ 0.98152619, 0.95993719, 0.95639322],
-    [ 0.9819726 , 0.95766608, 0.95399269],
-    [ 0.98191855, 0.9547873 , 0.95098107],
-    [ 0.98138514, 0.95134771, 0.94740644],
-    [ 0.98040845, 0.94739906, 0.94332125],
-    [ 0.97902107, 0.94300131, 0.93878672],
-    [ 0.97729348, 0.93820409, 0.93385135],
-    [ 0.9752533 , 0.933073  , 0.92858252],
-    [ 0.97297834, 0.92765261, 0.92302309],
-    [ 0.97049104, 0.92200317, 0.91723505],
-    [ 0.96784372, 0.91616744, 0.91126063],
-    [ 0.96507281, 0.91018664, 0.90514124],
-    [ 0.96222034, 0.90409203, 0.89890756],
-    [ 0.9593079 , 0.89791478, 0.89259122],
-    [ 0.95635626, 0.89167908, 0.88621654],
-    [ 0.95338303, 0.88540373, 0.87980238],
-    [ 0.95040174, 0.87910333, 0.87336339],
-    [ 0.94742246, 0.87278899, 0.86691076],
-    [ 0.94445249, 0.86646893, 0.86045277],
-    [ 0.94150476, 0.86014606, 0.85399191],
-    [ 0.93857394, 0.85382798, 0.84753642],
-    [ 0.93566206, 0.84751766, 0.84108935],
-    [ 0.93277194, 0.8412164 , 0.83465197],
-    [ 0.92990106, 0.83492672, 0.82822708],
-    [ 0.92704736, 0.82865028, 0.82181656],
-    [ 0.92422703, 0.82238092, 0.81541333],
-    [ 0.92142581, 0.81612448, 0.80902415],
-    [ 0.91864501, 0.80988032, 0.80264838],
-    [ 0.91587578, 0.80365187, 0.79629001],
-    [ 0.9131367 , 0.79743115, 0.78994   ],
-    [ 0.91041602, 0.79122265, 0.78360361],
-    [ 0.90771071, 0.78502727, 0.77728196],
-    [ 0.90501581, 0.77884674, 0.7709771 ],
-    [ 0.90235365, 0.77267117, 0.76467793],
-    [ 0.8997019 , 0.76650962, 0.75839484],
-    [ 0.89705346, 0.76036481, 0.752131  ],
-    [ 0.89444021, 0.75422253, 0.74587047],
-    [ 0.89183355, 0.74809474, 0.73962689],
-    [ 0.88923216, 0.74198168, 0.73340061],
-    [ 0.88665892, 0.73587283, 0.72717995],
-    [ 0.88408839, 0.72977904, 0.72097718],
-    [ 0.88153537, 0.72369332, 0.71478461],
-    [ 0.87899389, 0.7176179 , 0.70860487],
-    [ 0.87645157, 0.71155805, 0.7024439 ],
-    [ 0.8739399 , 0.70549893, 0.6962854 ],
-    [ 0.87142626, 0.6994551 , 0.69014561],
-    [ 0.8689268 , 0.69341868, 0.68401597],
-    [ 0.86643562, 0.687392  , 0.67789917],
-    [ 0.86394434, 0.68137863, 0.67179927],
-    [ 0.86147586, 0.67536728, 0.665704  ],
-    [ 0.85899928, 0.66937226, 0.6596292 ],
-    [ 0.85654668, 0.66337773, 0.6535577 ],
-    [ 0.85408818, 0.65739772, 0.64750494],
-    [ 0.85164413, 0.65142189, 0.64145983],
-    [ 0.84920091, 0.6454565 , 0.63542932],
-    [ 0.84676427, 0.63949827, 0.62941   ],
-    [ 0.84433231, 0.63354773, 0.62340261],
-    [ 0.84190106, 0.62760645, 0.61740899],
-    [ 0.83947935, 0.62166951, 0.61142404],
-    [ 0.8370538 , 0.61574332, 0.60545478],
-    [ 0.83463975, 0.60981951, 0.59949247],
-    [ 0.83221877, 0.60390724, 0.593547  ],
-    [ 0.82980985, 0.59799607, 0.58760751],
-    [ 0.82740268, 0.59209095, 0.58167944],
-    [ 0.82498638, 0.5861973 , 0.57576866],
-    [ 0.82258181, 0.5803034 , 0.56986307],
-    [ 0.82016611, 0.57442123, 0.56397539],
-    [ 0.81776305, 0.56853725, 0.55809173],
-    [ 0.81534551, 0.56266602, 0.55222741],
-    [ 0.81294293, 0.55679056, 0.5463651 ],
-    [ 0.81052113, 0.55092973, 0.54052443],
-    [ 0.80811509, 0.54506305, 0.53468464],
-    [ 0.80568952, 0.53921036, 0.52886622],
-    [ 0.80327506, 0.53335335, 0.52305077],
-    [ 0.80084727, 0.52750583, 0.51725256],
-    [ 0.79842217, 0.5216578 , 0.51146173],
-    [ 0.79599382, 0.51581223, 0.50568155],
-    [ 0.79355781, 0.50997127, 0.49991444],
-    [ 0.79112596, 0.50412707, 0.49415289],
-    [ 0.78867442, 0.49829386, 0.48841129],
-    [ 0.7862306 , 0.49245398, 0.48267247],
-    [ 0.7837687 , 0.48662309, 0.47695216],
-    [ 0.78130809, 0.4807883 , 0.47123805],
-    [ 0.77884467, 0.47495151, 0.46553236],
-    [ 0.77636283, 0.46912235, 0.45984473],
-    [ 0.77388383, 0.46328617, 0.45416141],
-    [ 0.77138912, 0.45745466, 0.44849398],
-    [ 0.76888874, 0.45162042, 0.44283573],
-    [ 0.76638802, 0.44577901, 0.43718292],
-    [ 0.76386116, 0.43994762, 0.43155211],
-    [ 0.76133542, 0.43410655, 0.42592523],
-    [ 0.75880631, 0.42825801, 0.42030488],
-    [ 0.75624913, 0.42241905, 0.41470727],
-    [ 0.7536919 , 0.41656866, 0.40911347],
-    [ 0.75112748, 0.41071104, 0.40352792],
-    [ 0.74854331, 0.40485474, 0.3979589 ],
-    [ 0.74594723, 0.39899309, 0.39240088],
-    [ 0.74334332, 0.39312199, 0.38685075],
-    [ 0.74073277, 0.38723941, 0.3813074 ],
-    [ 0.73809409, 0.38136133, 0.37578553],
-    [ 0.73544692, 0.37547129, 0.37027123],
-    [ 0.73278943, 0.36956954, 0.36476549],
-    [ 0.73011829, 0.36365761, 0.35927038],
-    [ 0.72743485, 0.35773314, 0.35378465],
-    [ 0.72472722, 0.35180504, 0.34831662],
-    [ 0.72200473, 0.34586421, 0.34285937],
-    [ 0.71927052, 0.33990649, 0.33741033],
-    [ 0.71652049, 0.33393396, 0.33197219],
-    [ 0.71375362, 0.32794602, 0.32654545],
-    [ 0.71096951, 0.32194148, 0.32113016],
-    [ 0.70816772, 0.31591904, 0.31572637],
-    [ 0.70534784, 0.30987734, 0.31033414],
-    [ 0.70250944, 0.30381489, 0.30495353],
-    [ 0.69965211, 0.2977301 , 0.2995846 ],
-    [ 0.6967754 , 0.29162126, 0.29422741],
-    [ 0.69388446, 0.28548074, 0.28887769],
-    [ 0.69097561, 0.2793096 , 0.28353795],
-    [ 0.68803513, 0.27311993, 0.27821876],
-    [ 0.6850794 , 0.26689144, 0.27290694],
-    [ 0.682108  , 0.26062114, 0.26760246],
-    [ 0.67911013, 0.2543177 , 0.26231367],
-    [ 0.67609393, 0.24796818, 0.25703372],
-    [ 0.67305921, 0.24156846, 0.25176238],
-    [ 0.67000176, 0.23511902, 0.24650278],
-    [ 0.66693423, 0.22859879, 0.24124404],
-    [ 0.6638441 , 0.22201742, 0.2359961 ],
-    [ 0.66080672, 0.21526712, 0.23069468]
-]
+_vlag_lut = """
+0.13850039 0.41331206 0.74052025
+0.15077609 0.41762684 0.73970427
+0.16235219 0.42191910 0.73896670
+0.17333220 0.42619024 0.73832537
+0.18382538 0.43044226 0.73776764
+0.19394034 0.43467720 0.73725867
+0.20367115 0.43889576 0.73685314
+0.21313625 0.44310003 0.73648045
+0.22231173 0.44729079 0.73619681
+0.23125148 0.45146945 0.73597803
+0.23998101 0.45563715 0.73582230
+0.24853358 0.45979489 0.73571524
+0.25691416 0.46394370 0.73566943
+0.26513894 0.46808455 0.73568319
+0.27322194 0.47221835 0.73575497
+0.28117543 0.47634598 0.73588332
+0.28901021 0.48046826 0.73606686
+0.29673580 0.48458597 0.73630433
+0.30436071 0.48869986 0.73659451
+0.31189550 0.49281055 0.73693255
+0.31935389 0.49691847 0.73730851
+0.32672701 0.50102470 0.73774013
+0.33402607 0.50512971 0.73821941
+0.34125337 0.50923419 0.73874905
+0.34840921 0.51333892 0.73933402
+0.35551826 0.51744353 0.73994642
+0.36256760 0.52154929 0.74060763
+0.36956356 0.52565656 0.74131327
+0.37649902 0.52976642 0.74207698
+0.38340273 0.53387791 0.74286286
+0.39025859 0.53799253 0.74369620
+0.39706821 0.54211081 0.74457800
+0.40384046 0.54623277 0.74549872
+0.41058241 0.55035849 0.74645094
+0.41728385 0.55448919 0.74745174
+0.42395178 0.55862494 0.74849357
+0.43059640 0.56276546 0.74956387
+0.43720440 0.56691228 0.75068412
+0.44379090 0.57106468 0.75183427
+0.45035117 0.57522350 0.75302312
+0.45687824 0.57938983 0.75426297
+0.46339713 0.58356191 0.75551816
+0.46988778 0.58774195 0.75682037
+0.47635605 0.59192986 0.75816245
+0.48281101 0.59612520 0.75953212
+0.48923740 0.60032986 0.76095418
+0.49566225 0.60454154 0.76238852
+0.50206137 0.60876307 0.76387371
+0.50845128 0.61299312 0.76538551
+0.51482580 0.61723272 0.76693475
+0.52118385 0.62148236 0.76852436
+0.52753571 0.62574126 0.77013939
+0.53386831 0.63001125 0.77180152
+0.54020159 0.63429038 0.77348030
+0.54651272 0.63858165 0.77521306
+0.55282975 0.64288207 0.77695608
+0.55912585 0.64719519 0.77875327
+0.56542599 0.65151828 0.78056551
+0.57170924 0.65585426 0.78242747
+0.57799572 0.66020090 0.78430751
+0.58426817 0.66456073 0.78623458
+0.59054400 0.66893178 0.78818117
+0.59680758 0.67331643 0.79017369
+0.60307553 0.67771273 0.79218572
+0.60934065 0.68212194 0.79422987
+0.61559495 0.68654548 0.79632020
+0.62185554 0.69098125 0.79842918
+0.62810662 0.69543176 0.80058381
+0.63436425 0.69989499 0.80275812
+0.64061445 0.70437326 0.80497621
+0.64687060 0.70886488 0.80721641
+0.65312213 0.71337170 0.80949719
+0.65937818 0.71789261 0.81180392
+0.66563334 0.72242871 0.81414642
+0.67189155 0.72697967 0.81651872
+0.67815314 0.73154569 0.81892097
+0.68441395 0.73612771 0.82136094
+0.69068321 0.74072452 0.82382353
+0.69694776 0.74533850 0.82633199
+0.70322431 0.74996721 0.82885830
+0.70949595 0.75461368 0.83143221
+0.71577740 0.75927574 0.83402904
+0.72206299 0.76395461 0.83665922
+0.72835227 0.76865061 0.83932420
+0.73465238 0.77336280 0.84201224
+0.74094862 0.77809393 0.84474951
+0.74725683 0.78284158 0.84750915
+0.75357103 0.78760701 0.85030217
+0.75988961 0.79239077 0.85313207
+0.76621987 0.79719185 0.85598668
+0.77255045 0.80201250 0.85888658
+0.77889241 0.80685102 0.86181298
+0.78524572 0.81170768 0.86476656
+0.79159841 0.81658489 0.86776906
+0.79796459 0.82148036 0.87079620
+0.80434168 0.82639479 0.87385315
+0.81072210 0.83132983 0.87695392
+0.81711301 0.83628440 0.88008641
+0.82351479 0.84125863 0.88325045
+0.82992772 0.84625263 0.88644594
+0.83634359 0.85126806 0.88968780
+0.84277295 0.85630293 0.89295721
+0.84921192 0.86135782 0.89626076
+0.85566206 0.86643200 0.89959467
+0.86211514 0.87152627 0.90297183
+0.86857483 0.87663856 0.90638248
+0.87504231 0.88176648 0.90981938
+0.88151194 0.88690782 0.91328493
+0.88797938 0.89205857 0.91677544
+0.89443865 0.89721298 0.92028540
+0.90088204 0.90236294 0.92380601
+0.90729768 0.90749778 0.92732797
+0.91367037 0.91260329 0.93083814
+0.91998105 0.91766106 0.93431861
+0.92620596 0.92264789 0.93774647
+0.93231683 0.92753510 0.94109192
+0.93827772 0.93228880 0.94432312
+0.94404755 0.93686925 0.94740137
+0.94958284 0.94123072 0.95027696
+0.95482682 0.94532450 0.95291103
+0.95972480 0.94909728 0.95525103
+0.96422552 0.95249273 0.95723271
+0.96826161 0.95545812 0.95882188
+0.97178458 0.95793984 0.95995705
+0.97474105 0.95989142 0.96059997
+0.97708604 0.96127366 0.96071853
+0.97877855 0.96205832 0.96030095
+0.97978484 0.96222949 0.95935496
+0.98059970 0.96155216 0.95813083
+0.98152619 0.95993719 0.95639322
+0.98197260 0.95766608 0.95399269
+0.98191855 0.95478730 0.95098107
+0.98138514 0.95134771 0.94740644
+0.98040845 0.94739906 0.94332125
+0.97902107 0.94300131 0.93878672
+0.97729348 0.93820409 0.93385135
+0.97525330 0.93307300 0.92858252
+0.97297834 0.92765261 0.92302309
+0.97049104 0.92200317 0.91723505
+0.96784372 0.91616744 0.91126063
+0.96507281 0.91018664 0.90514124
+0.96222034 0.90409203 0.89890756
+0.95930790 0.89791478 0.89259122
+0.95635626 0.89167908 0.88621654
+0.95338303 0.88540373 0.87980238
+0.95040174 0.87910333 0.87336339
+0.94742246 0.87278899 0.86691076
+0.94445249 0.86646893 0.86045277
+0.94150476 0.86014606 0.85399191
+0.93857394 0.85382798 0.84753642
+0.93566206 0.84751766 0.84108935
+0.93277194 0.84121640 0.83465197
+0.92990106 0.83492672 0.82822708
+0.92704736 0.82865028 0.82181656
+0.92422703 0.82238092 0.81541333
+0.92142581 0.81612448 0.80902415
+0.91864501 0.80988032 0.80264838
+0.91587578 0.80365187 0.79629001
+0.91313670 0.79743115 0.78994000
+0.91041602 0.79122265 0.78360361
+0.90771071 0.78502727 0.77728196
+0.90501581 0.77884674 0.77097710
+0.90235365 0.77267117 0.76467793
+0.89970190 0.76650962 0.75839484
+0.89705346 0.76036481 0.75213100
+0.89444021 0.75422253 0.74587047
+0.89183355 0.74809474 0.73962689
+0.88923216 0.74198168 0.73340061
+0.88665892 0.73587283 0.72717995
+0.88408839 0.72977904 0.72097718
+0.88153537 0.72369332 0.71478461
+0.87899389 0.71761790 0.70860487
+0.87645157 0.71155805 0.70244390
+0.87393990 0.70549893 0.69628540
+0.87142626 0.69945510 0.69014561
+0.86892680 0.69341868 0.68401597
+0.86643562 0.68739200 0.67789917
+0.86394434 0.68137863 0.67179927
+0.86147586 0.67536728 0.66570400
+0.85899928 0.66937226 0.65962920
+0.85654668 0.66337773 0.65355770
+0.85408818 0.65739772 0.64750494
+0.85164413 0.65142189 0.64145983
+0.84920091 0.64545650 0.63542932
+0.84676427 0.63949827 0.62941000
+0.84433231 0.63354773 0.62340261
+0.84190106 0.62760645 0.61740899
+0.83947935 0.62166951 0.61142404
+0.83705380 0.61574332 0.60545478
+0.83463975 0.60981951 0.59949247
+0.83221877 0.60390724 0.59354700
+0.82980985 0.59799607 0.58760751
+0.82740268 0.59209095 0.58167944
+0.82498638 0.58619730 0.57576866
+0.82258181 0.58030340 0.56986307
+0.82016611 0.57442123 0.56397539
+0.81776305 0.56853725 0.55809173
+0.81534551 0.56266602 0.55222741
+0.81294293 0.55679056 0.54636510
+0.81052113 0.55092973 0.54052443
+0.80811509 0.54506305 0.53468464
+0.80568952 0.53921036 0.52886622
+0.80327506 0.53335335 0.52305077
+0.80084727 0.52750583 0.51725256
+0.79842217 0.52165780 0.51146173
+0.79599382 0.51581223 0.50568155
+0.79355781 0.50997127 0.49991444
+0.79112596 0.50412707 0.49415289
+0.78867442 0.49829386 0.48841129
+0.78623060 0.49245398 0.48267247
+0.78376870 0.48662309 0.47695216
+0.78130809 0.48078830 0.47123805
+0.77884467 0.47495151 0.46553236
+0.77636283 0.46912235 0.45984473
+0.77388383 0.46328617 0.45416141
+0.77138912 0.45745466 0.44849398
+0.76888874 0.45162042 0.44283573
+0.76638802 0.44577901 0.43718292
+0.76386116 0.43994762 0.43155211
+0.76133542 0.43410655 0.42592523
+0.75880631 0.42825801 0.42030488
+0.75624913 0.42241905 0.41470727
+0.75369190 0.41656866 0.40911347
+0.75112748 0.41071104 0.40352792
+0.74854331 0.40485474 0.39795890
+0.74594723 0.39899309 0.39240088
+0.74334332 0.39312199 0.38685075
+0.74073277 0.38723941 0.38130740
+0.73809409 0.38136133 0.37578553
+0.73544692 0.37547129 0.37027123
+0.73278943 0.36956954 0.36476549
+0.73011829 0.36365761 0.35927038
+0.72743485 0.35773314 0.35378465
+0.72472722 0.35180504 0.34831662
+0.72200473 0.34586421 0.34285937
+0.71927052 0.33990649 0.33741033
+0.71652049 0.33393396 0.33197219
+0.71375362 0.32794602 0.32654545
+0.71096951 0.32194148 0.32113016
+0.70816772 0.31591904 0.31572637
+0.70534784 0.30987734 0.31033414
+0.70250944 0.30381489 0.30495353
+0.69965211 0.29773010 0.29958460
+0.69677540 0.29162126 0.29422741
+0.69388446 0.28548074 0.28887769
+0.69097561 0.27930960 0.28353795
+0.68803513 0.27311993 0.27821876
+0.68507940 0.26689144 0.27290694
+0.68210800 0.26062114 0.26760246
+0.67911013 0.25431770 0.26231367
+0.67609393 0.24796818 0.25703372
+0.67305921 0.24156846 0.25176238
+0.67000176 0.23511902 0.24650278
+0.66693423 0.22859879 0.24124404
+0.66384410 0.22201742 0.23599610
+0.66080672 0.21526712 0.23069468
+"""
 
+_icefire_lut = """
+0.73936227 0.90443867 0.85757238
+0.72888063 0.89639109 0.85488394
+0.71834255 0.88842162 0.85216050
+0.70773866 0.88052939 0.84942200
+0.69706215 0.87271313 0.84668315
+0.68629021 0.86497329 0.84398721
+0.67543654 0.85730617 0.84130969
+0.66448539 0.84971123 0.83868005
+0.65342679 0.84218728 0.83611512
+0.64231804 0.83471867 0.83358584
+0.63117745 0.82729400 0.83113431
+0.62000484 0.81991069 0.82876741
+0.60879435 0.81256797 0.82648905
+0.59754118 0.80526458 0.82430414
+0.58624247 0.79799884 0.82221573
+0.57489525 0.79076880 0.82022901
+0.56349779 0.78357215 0.81834861
+0.55204294 0.77640827 0.81657563
+0.54052516 0.76927562 0.81491462
+0.52894085 0.76217215 0.81336913
+0.51728854 0.75509528 0.81194156
+0.50555676 0.74804469 0.81063503
+0.49373871 0.74101870 0.80945242
+0.48183174 0.73401449 0.80839675
+0.46982587 0.72703075 0.80747097
+0.45770893 0.72006648 0.80667756
+0.44547249 0.71311941 0.80601991
+0.43318643 0.70617126 0.80549278
+0.42110294 0.69916972 0.80506683
+0.40925101 0.69211059 0.80473246
+0.39766930 0.68498786 0.80448272
+0.38632002 0.67781125 0.80431024
+0.37523981 0.67057537 0.80420832
+0.36442578 0.66328229 0.80417474
+0.35385939 0.65593699 0.80420591
+0.34358916 0.64853177 0.80430000
+0.33355526 0.64107876 0.80445484
+0.32383062 0.63356578 0.80467091
+0.31434372 0.62600624 0.80494750
+0.30516161 0.61838900 0.80528692
+0.29623491 0.61072284 0.80569021
+0.28759072 0.60300319 0.80616055
+0.27923924 0.59522877 0.80669803
+0.27114651 0.58740470 0.80730545
+0.26337153 0.57952055 0.80799113
+0.25588696 0.57157984 0.80875922
+0.24868600 0.56358255 0.80961366
+0.24180668 0.55552289 0.81055123
+0.23526251 0.54739477 0.81159390
+0.22921445 0.53918506 0.81267292
+0.22397687 0.53086094 0.81371410
+0.21977058 0.52241482 0.81457651
+0.21658989 0.51384321 0.81528511
+0.21452772 0.50514155 0.81577278
+0.21372783 0.49630865 0.81589566
+0.21409503 0.48734861 0.81566163
+0.21571760 0.47827123 0.81487615
+0.21842857 0.46909168 0.81351614
+0.22211705 0.45983212 0.81146983
+0.22665681 0.45052233 0.80860217
+0.23176013 0.44119137 0.80494325
+0.23727775 0.43187704 0.80038017
+0.24298285 0.42261123 0.79493267
+0.24865068 0.41341842 0.78869164
+0.25423116 0.40433127 0.78155831
+0.25950239 0.39535521 0.77376848
+0.26447360 0.38651212 0.76524809
+0.26901584 0.37779582 0.75621942
+0.27318141 0.36922056 0.74660500
+0.27690355 0.36077360 0.73659374
+0.28023585 0.35244234 0.72622103
+0.28306009 0.34438449 0.71500731
+0.28535896 0.33660243 0.70303975
+0.28708711 0.32912157 0.69034504
+0.28816354 0.32200604 0.67684067
+0.28862749 0.31519824 0.66278813
+0.28847904 0.30869064 0.64828150
+0.28770912 0.30250126 0.63331265
+0.28640325 0.29655509 0.61811374
+0.28458943 0.29082155 0.60280913
+0.28233561 0.28527482 0.58742866
+0.27967038 0.27989380 0.57204225
+0.27665361 0.27465357 0.55667809
+0.27332564 0.26951650 0.54145387
+0.26973851 0.26447054 0.52634916
+0.26592040 0.25949691 0.51141700
+0.26190145 0.25458123 0.49668768
+0.25771510 0.24971691 0.48214874
+0.25337618 0.24490494 0.46778758
+0.24890842 0.24013332 0.45363816
+0.24433654 0.23539226 0.43972450
+0.23967922 0.23067729 0.42605910
+0.23495608 0.22598894 0.41262952
+0.23018113 0.22132414 0.39945577
+0.22534609 0.21670847 0.38645794
+0.22048761 0.21211723 0.37372555
+0.21561980 0.20755389 0.36125301
+0.21074637 0.20302717 0.34903192
+0.20586893 0.19855368 0.33701661
+0.20101757 0.19411573 0.32529173
+0.19619947 0.18972425 0.31383846
+0.19140726 0.18540157 0.30260777
+0.18667690 0.18113320 0.29166583
+0.18201285 0.17694992 0.28088776
+0.17745228 0.17282141 0.27044211
+0.17300684 0.16876921 0.26024893
+0.16868273 0.16479861 0.25034479
+0.16448691 0.16091728 0.24075373
+0.16043195 0.15714351 0.23141745
+0.15652427 0.15348248 0.22238175
+0.15277065 0.14994111 0.21368395
+0.14918274 0.14653431 0.20529486
+0.14577095 0.14327403 0.19720829
+0.14254381 0.14016944 0.18944326
+0.13951035 0.13723063 0.18201072
+0.13667798 0.13446606 0.17493774
+0.13405762 0.13188822 0.16820842
+0.13165767 0.12950667 0.16183275
+0.12948748 0.12733187 0.15580631
+0.12755435 0.12537230 0.15014098
+0.12586516 0.12363617 0.14484590
+0.12442647 0.12213143 0.13992571
+0.12324241 0.12086419 0.13539995
+0.12232067 0.11984278 0.13124644
+0.12166209 0.11907077 0.12749671
+0.12126982 0.11855309 0.12415079
+0.12114244 0.11829179 0.12123850
+0.12127766 0.11828837 0.11878534
+0.12284806 0.11797290 0.11772022
+0.12619498 0.11721796 0.11770203
+0.12996800 0.11663788 0.11792377
+0.13410011 0.11625146 0.11839138
+0.13855459 0.11606618 0.11910584
+0.14333775 0.11607038 0.12006060
+0.14841700 0.11626929 0.12125453
+0.15377389 0.11666192 0.12268364
+0.15941427 0.11723486 0.12433911
+0.16533376 0.11797856 0.12621303
+0.17152547 0.11888403 0.12829735
+0.17797765 0.11994436 0.13058435
+0.18468769 0.12114722 0.13306426
+0.19165663 0.12247737 0.13572616
+0.19884415 0.12394381 0.13856690
+0.20627181 0.12551883 0.14157124
+0.21394877 0.12718055 0.14472604
+0.22184572 0.12893119 0.14802579
+0.22994394 0.13076731 0.15146314
+0.23823937 0.13267611 0.15502793
+0.24676041 0.13462172 0.15870321
+0.25546457 0.13661751 0.16248722
+0.26433628 0.13865956 0.16637301
+0.27341345 0.14070412 0.17034221
+0.28264773 0.14277192 0.17439570
+0.29202272 0.14486161 0.17852793
+0.30159648 0.14691224 0.18271690
+0.31129002 0.14897583 0.18695213
+0.32111555 0.15103351 0.19119629
+0.33107961 0.15306740 0.19543758
+0.34119892 0.15504762 0.19968030
+0.35142388 0.15701131 0.20389086
+0.36178937 0.15891240 0.20807639
+0.37229381 0.16073993 0.21223189
+0.38288348 0.16254006 0.21632490
+0.39359592 0.16426336 0.22036577
+0.40444332 0.16588767 0.22434027
+0.41537995 0.16745325 0.22822970
+0.42640867 0.16894939 0.23202755
+0.43754706 0.17034847 0.23572899
+0.44878564 0.17165350 0.23932344
+0.46011260 0.17287365 0.24278607
+0.47151732 0.17401641 0.24610337
+0.48300689 0.17506676 0.24927370
+0.49458302 0.17601892 0.25227688
+0.50623876 0.17687777 0.25509600
+0.51796230 0.17765528 0.25771620
+0.52975234 0.17835232 0.26011340
+0.54159776 0.17898292 0.26226847
+0.55348804 0.17956232 0.26416003
+0.56541729 0.18010175 0.26575971
+0.57736669 0.18063100 0.26704888
+0.58932081 0.18117827 0.26800409
+0.60127582 0.18175888 0.26858488
+0.61319563 0.18243360 0.26878720
+0.62506376 0.18324015 0.26858301
+0.63681202 0.18430173 0.26795276
+0.64842603 0.18565472 0.26689463
+0.65988195 0.18734638 0.26543435
+0.67111966 0.18948885 0.26357955
+0.68209194 0.19216636 0.26137175
+0.69281185 0.19535326 0.25887063
+0.70335022 0.19891271 0.25617971
+0.71375229 0.20276438 0.25331365
+0.72401436 0.20691287 0.25027366
+0.73407638 0.21145051 0.24710661
+0.74396983 0.21631913 0.24380715
+0.75361506 0.22163653 0.24043996
+0.76305790 0.22731637 0.23700095
+0.77222228 0.23346231 0.23356628
+0.78115441 0.23998404 0.23013825
+0.78979746 0.24694858 0.22678822
+0.79819286 0.25427223 0.22352658
+0.80630444 0.26198807 0.22040877
+0.81417437 0.27001406 0.21744645
+0.82177364 0.27837336 0.21468316
+0.82915955 0.28696963 0.21210766
+0.83628628 0.29584990 0.20977813
+0.84322168 0.30491136 0.20766435
+0.84995458 0.31415945 0.20578630
+0.85648867 0.32358058 0.20415327
+0.86286243 0.33312058 0.20274969
+0.86908321 0.34276705 0.20157271
+0.87512876 0.35254160 0.20064949
+0.88100349 0.36243385 0.19999078
+0.88664690 0.37249496 0.19979760
+0.89203964 0.38273475 0.20013431
+0.89713496 0.39318156 0.20121514
+0.90195099 0.40380687 0.20301555
+0.90648379 0.41460191 0.20558847
+0.91069670 0.42557857 0.20918529
+0.91463791 0.43668557 0.21367954
+0.91830723 0.44790913 0.21916352
+0.92171507 0.45922856 0.22568002
+0.92491786 0.47059360 0.23308207
+0.92790792 0.48200153 0.24145932
+0.93073701 0.49341219 0.25065486
+0.93343918 0.50480170 0.26056148
+0.93602064 0.51616486 0.27118485
+0.93850535 0.52748892 0.28242464
+0.94092933 0.53875462 0.29416042
+0.94330011 0.54996280 0.30634189
+0.94563159 0.56110987 0.31891624
+0.94792955 0.57219822 0.33184256
+0.95020929 0.58322320 0.34508419
+0.95247324 0.59419035 0.35859866
+0.95471709 0.60510869 0.37236035
+0.95698411 0.61595766 0.38629631
+0.95923863 0.62676473 0.40043317
+0.96150410 0.63752030 0.41474106
+0.96371553 0.64826619 0.42928335
+0.96591497 0.65899621 0.44380444
+0.96809871 0.66971662 0.45830232
+0.97024950 0.68043940 0.47280492
+0.97238810 0.69115622 0.48729272
+0.97450723 0.70187358 0.50178034
+0.97661080 0.71259200 0.51626837
+0.97871716 0.72330511 0.53074053
+0.98082222 0.73401769 0.54520694
+0.98290010 0.74474445 0.55970190
+0.98497466 0.75547635 0.57420239
+0.98705581 0.76621129 0.58870185
+0.98913325 0.77695637 0.60321626
+0.99119918 0.78771716 0.61775821
+0.99326720 0.79848979 0.63231691
+0.99535958 0.80926704 0.64687278
+0.99740544 0.82008078 0.66150571
+0.99921970 0.83100723 0.67641270
+"""
 
-_icefire_lut = [
-    [ 0.73936227, 0.90443867, 0.85757238],
-    [ 0.72888063, 0.89639109, 0.85488394],
-    [ 0.71834255, 0.88842162, 0.8521605 ],
-    [ 0.70773866, 0.88052939, 0.849422  ],
-    [ 0.69706215, 0.87271313, 0.84668315],
-    [ 0.68629021, 0.86497329, 0.84398721],
-    [ 0.67543654, 0.85730617, 0.84130969],
-    [ 0.66448539, 0.84971123, 0.83868005],
-    [ 0.65342679, 0.84218728, 0.83611512],
-    [ 0.64231804, 0.83471867, 0.83358584],
-    [ 0.63117745, 0.827294  , 0.83113431],
-    [ 0.62000484, 0.81991069, 0.82876741],
-    [ 0.60879435, 0.81256797, 0.82648905],
-    [ 0.59754118, 0.80526458, 0.82430414],
-    [ 0.58624247, 0.79799884, 0.82221573],
-    [ 0.57489525, 0.7907688 , 0.82022901],
-    [ 0.56349779, 0.78357215, 0.81834861],
-    [ 0.55204294, 0.77640827, 0.81657563],
-    [ 0.54052516, 0.76927562, 0.81491462],
-    [ 0.52894085, 0.76217215, 0.81336913],
-    [ 0.51728854, 0.75509528, 0.81194156],
-    [ 0.50555676, 0.74804469, 0.81063503],
-    [ 0.49373871, 0.7410187 , 0.80945242],
-    [ 0.48183174, 0.73401449, 0.80839675],
-    [ 0.46982587, 0.72703075, 0.80747097],
-    [ 0.45770893, 0.72006648, 0.80667756],
-    [ 0.44547249, 0.71311941, 0.80601991],
-    [ 0.43318643, 0.70617126, 0.80549278],
-    [ 0.42110294, 0.69916972, 0.80506683],
-    [ 0.40925101, 0.69211059, 0.80473246],
-    [ 0.3976693 , 0.68498786, 0.80448272],
-    [ 0.38632002, 0.67781125, 0.80431024],
-    [ 0.37523981, 0.67057537, 0.80420832],
-    [ 0.36442578, 0.66328229, 0.80417474],
-    [ 0.35385939, 0.65593699, 0.80420591],
-    [ 0.34358916, 0.64853177, 0.8043    ],
-    [ 0.33355526, 0.64107876, 0.80445484],
-    [ 0.32383062, 0.63356578, 0.80467091],
-    [ 0.31434372, 0.62600624, 0.8049475 ],
-    [ 0.30516161, 0.618389  , 0.80528692],
-    [ 0.29623491, 0.61072284, 0.80569021],
-    [ 0.28759072, 0.60300319, 0.80616055],
-    [ 0.27923924, 0.59522877, 0.80669803],
-    [ 0.27114651, 0.5874047 , 0.80730545],
-    [ 0.26337153, 0.57952055, 0.80799113],
-    [ 0.25588696, 0.57157984, 0.80875922],
-    [ 0.248686  , 0.56358255, 0.80961366],
-    [ 0.24180668, 0.55552289, 0.81055123],
-    [ 0.23526251, 0.54739477, 0.8115939 ],
-    [ 0.22921445, 0.53918506, 0.81267292],
-    [ 0.22397687, 0.53086094, 0.8137141 ],
-    [ 0.21977058, 0.52241482, 0.81457651],
-    [ 0.21658989, 0.51384321, 0.81528511],
-    [ 0.21452772, 0.50514155, 0.81577278],
-    [ 0.21372783, 0.49630865, 0.81589566],
-    [ 0.21409503, 0.48734861, 0.81566163],
-    [ 0.2157176 , 0.47827123, 0.81487615],
-    [ 0.21842857, 0.46909168, 0.81351614],
-    [ 0.22211705, 0.45983212, 0.81146983],
-    [ 0.22665681, 0.45052233, 0.80860217],
-    [ 0.23176013, 0.44119137, 0.80494325],
-    [ 0.23727775, 0.43187704, 0.80038017],
-    [ 0.24298285, 0.42261123, 0.79493267],
-    [ 0.24865068, 0.41341842, 0.78869164],
-    [ 0.25423116, 0.40433127, 0.78155831],
-    [ 0.25950239, 0.39535521, 0.77376848],
-    [ 0.2644736 , 0.38651212, 0.76524809],
-    [ 0.26901584, 0.37779582, 0.75621942],
-    [ 0.27318141, 0.36922056, 0.746605  ],
-    [ 0.27690355, 0.3607736 , 0.73659374],
-    [ 0.28023585, 0.35244234, 0.72622103],
-    [ 0.28306009, 0.34438449, 0.71500731],
-    [ 0.28535896, 0.33660243, 0.70303975],
-    [ 0.28708711, 0.32912157, 0.69034504],
-    [ 0.28816354, 0.32200604, 0.67684067],
-    [ 0.28862749, 0.31519824, 0.66278813],
-    [ 0.28847904, 0.30869064, 0.6482815 ],
-    [ 0.28770912, 0.30250126, 0.63331265],
-    [ 0.28640325, 0.29655509, 0.61811374],
-    [ 0.28458943, 0.29082155, 0.60280913],
-    [ 0.28233561, 0.28527482, 0.58742866],
-    [ 0.27967038, 0.2798938 , 0.57204225],
-    [ 0.27665361, 0.27465357, 0.55667809],
-    [ 0.27332564, 0.2695165 , 0.54145387],
-    [ 0.26973851, 0.26447054, 0.52634916],
-    [ 0.2659204 , 0.25949691, 0.511417  ],
-    [ 0.26190145, 0.25458123, 0.49668768],
-    [ 0.2577151 , 0.24971691, 0.48214874],
-    [ 0.25337618, 0.24490494, 0.46778758],
-    [ 0.24890842, 0.24013332, 0.45363816],
-    [ 0.24433654, 0.23539226, 0.4397245 ],
-    [ 0.23967922, 0.23067729, 0.4260591 ],
-    [ 0.23495608, 0.22598894, 0.41262952],
-    [ 0.23018113, 0.22132414, 0.39945577],
-    [ 0.22534609, 0.21670847, 0.38645794],
-    [ 0.22048761, 0.21211723, 0.37372555],
-    [ 0.2156198 , 0.20755389, 0.36125301],
-    [ 0.21074637, 0.20302717, 0.34903192],
-    [ 0.20586893, 0.19855368, 0.33701661],
-    [ 0.20101757, 0.19411573, 0.32529173],
-    [ 0.19619947, 0.18972425, 0.31383846],
-    [ 0.19140726, 0.18540157, 0.30260777],
-    [ 0.1866769 , 0.1811332 , 0.29166583],
-    [ 0.18201285, 0.17694992, 0.28088776],
-    [ 0.17745228, 0.17282141, 0.27044211],
-    [ 0.17300684, 0.16876921, 0.26024893],
-    [ 0.16868273, 0.16479861, 0.25034479],
-    [ 0.16448691, 0.16091728, 0.24075373],
-    [ 0.16043195, 0.15714351, 0.23141745],
-    [ 0.15652427, 0.15348248, 0.22238175],
-    [ 0.15277065, 0.14994111, 0.21368395],
-    [ 0.14918274, 0.14653431, 0.20529486],
-    [ 0.14577095, 0.14327403, 0.19720829],
-    [ 0.14254381, 0.14016944, 0.18944326],
-    [ 0.13951035, 0.13723063, 0.18201072],
-    [ 0.13667798, 0.13446606, 0.17493774],
-    [ 0.13405762, 0.13188822, 0.16820842],
-    [ 0.13165767, 0.12950667, 0.16183275],
-    [ 0.12948748, 0.12733187, 0.15580631],
-    [ 0.12755435, 0.1253723 , 0.15014098],
-    [ 0.12586516, 0.12363617, 0.1448459 ],
-    [ 0.12442647, 0.12213143, 0.13992571],
-    [ 0.12324241, 0.12086419, 0.13539995],
-    [ 0.12232067, 0.11984278, 0.13124644],
-    [ 0.12166209, 0.11907077, 0.12749671],
-    [ 0.12126982, 0.11855309, 0.12415079],
-    [ 0.12114244, 0.11829179, 0.1212385 ],
-    [ 0.12127766, 0.11828837, 0.11878534],
-    [ 0.12284806, 0.1179729 , 0.11772022],
-    [ 0.12619498, 0.11721796, 0.11770203],
-    [ 0.129968  , 0.11663788, 0.11792377],
-    [ 0.13410011, 0.11625146, 0.11839138],
-    [ 0.13855459, 0.11606618, 0.11910584],
-    [ 0.14333775, 0.11607038, 0.1200606 ],
-    [ 0.148417  , 0.11626929, 0.12125453],
-    [ 0.15377389, 0.11666192, 0.12268364],
-    [ 0.15941427, 0.11723486, 0.12433911],
-    [ 0.16533376, 0.11797856, 0.12621303],
-    [ 0.17152547, 0.11888403, 0.12829735],
-    [ 0.17797765, 0.11994436, 0.13058435],
-    [ 0.18468769, 0.12114722, 0.13306426],
-    [ 0.19165663, 0.12247737, 0.13572616],
-    [ 0.19884415, 0.12394381, 0.1385669 ],
-    [ 0.20627181, 0.12551883, 0.14157124],
-    [ 0.21394877, 0.12718055, 0.14472604],
-    [ 0.22184572, 0.12893119, 0.14802579],
-    [ 0.22994394, 0.13076731, 0.15146314],
-    [ 0.23823937, 0.13267611, 0.15502793],
-    [ 0.24676041, 0.13462172, 0.15870321],
-    [ 0.25546457, 0.13661751, 0.16248722],
-    [ 0.26433628, 0.13865956, 0.16637301],
-    [ 0.27341345, 0.14070412, 0.17034221],
-    [ 0.28264773, 0.14277192, 0.1743957 ],
-    [ 0.29202272, 0.14486161, 0.17852793],
-    [ 0.30159648, 0.14691224, 0.1827169 ],
-    [ 0.31129002, 0.14897583, 0.18695213],
-    [ 0.32111555, 0.15103351, 0.19119629],
-    [ 0.33107961, 0.1530674 , 0.19543758],
-    [ 0.34119892, 0.15504762, 0.1996803 ],
-    [ 0.35142388, 0.15701131, 0.20389086],
-    [ 0.36178937, 0.1589124 , 0.20807639],
-    [ 0.37229381, 0.16073993, 0.21223189],
-    [ 0.38288348, 0.16254006, 0.2163249 ],
-    [ 0.39359592, 0.16426336, 0.22036577],
-    [ 0.40444332, 0.16588767, 0.22434027],
-    [ 0.41537995, 0.16745325, 0.2282297 ],
-    [ 0.42640867, 0.16894939, 0.23202755],
-    [ 0.43754706, 0.17034847, 0.23572899],
-    [ 0.44878564, 0.1716535 , 0.23932344],
-    [ 0.4601126 , 0.17287365, 0.24278607],
-    [ 0.47151732, 0.17401641, 0.24610337],
-    [ 0.48300689, 0.17506676, 0.2492737 ],
-    [ 0.49458302, 0.17601892, 0.25227688],
-    [ 0.50623876, 0.17687777, 0.255096  ],
-    [ 0.5179623 , 0.17765528, 0.2577162 ],
-    [ 0.52975234, 0.17835232, 0.2601134 ],
-    [ 0.54159776, 0.17898292, 0.26226847],
-    [ 0.55348804, 0.17956232, 0.26416003],
-    [ 0.56541729, 0.18010175, 0.26575971],
-    [ 0.57736669, 0.180631  , 0.26704888],
-    [ 0.58932081, 0.18117827, 0.26800409],
-    [ 0.60127582, 0.18175888, 0.26858488],
-    [ 0.61319563, 0.1824336 , 0.2687872 ],
-    [ 0.62506376, 0.18324015, 0.26858301],
-    [ 0.63681202, 0.18430173, 0.26795276],
-    [ 0.64842603, 0.18565472, 0.26689463],
-    [ 0.65988195, 0.18734638, 0.26543435],
-    [ 0.67111966, 0.18948885, 0.26357955],
-    [ 0.68209194, 0.19216636, 0.26137175],
-    [ 0.69281185, 0.19535326, 0.25887063],
-    [ 0.70335022, 0.19891271, 0.25617971],
-    [ 0.71375229, 0.20276438, 0.25331365],
-    [ 0.72401436, 0.20691287, 0.25027366],
-    [ 0.73407638, 0.21145051, 0.24710661],
-    [ 0.74396983, 0.21631913, 0.24380715],
-    [ 0.75361506, 0.22163653, 0.24043996],
-    [ 0.7630579 , 0.22731637, 0.23700095],
-    [ 0.77222228, 0.23346231, 0.23356628],
-    [ 0.78115441, 0.23998404, 0.23013825],
-    [ 0.78979746, 0.24694858, 0.22678822],
-    [ 0.79819286, 0.25427223, 0.22352658],
-    [ 0.80630444, 0.26198807, 0.22040877],
-    [ 0.81417437, 0.27001406, 0.21744645],
-    [ 0.82177364, 0.27837336, 0.21468316],
-    [ 0.82915955, 0.28696963, 0.21210766],
-    [ 0.83628628, 0.2958499 , 0.20977813],
-    [ 0.84322168, 0.30491136, 0.20766435],
-    [ 0.84995458, 0.31415945, 0.2057863 ],
-    [ 0.85648867, 0.32358058, 0.20415327],
-    [ 0.86286243, 0.33312058, 0.20274969],
-    [ 0.86908321, 0.34276705, 0.20157271],
-    [ 0.87512876, 0.3525416 , 0.20064949],
-    [ 0.88100349, 0.36243385, 0.19999078],
-    [ 0.8866469 , 0.37249496, 0.1997976 ],
-    [ 0.89203964, 0.38273475, 0.20013431],
-    [ 0.89713496, 0.39318156, 0.20121514],
-    [ 0.90195099, 0.40380687, 0.20301555],
-    [ 0.90648379, 0.41460191, 0.20558847],
-    [ 0.9106967 , 0.42557857, 0.20918529],
-    [ 0.91463791, 0.43668557, 0.21367954],
-    [ 0.91830723, 0.44790913, 0.21916352],
-    [ 0.92171507, 0.45922856, 0.22568002],
-    [ 0.92491786, 0.4705936 , 0.23308207],
-    [ 0.92790792, 0.48200153, 0.24145932],
-    [ 0.93073701, 0.49341219, 0.25065486],
-    [ 0.93343918, 0.5048017 , 0.26056148],
-    [ 0.93602064, 0.51616486, 0.27118485],
-    [ 0.93850535, 0.52748892, 0.28242464],
-    [ 0.94092933, 0.53875462, 0.29416042],
-    [ 0.94330011, 0.5499628 , 0.30634189],
-    [ 0.94563159, 0.56110987, 0.31891624],
-    [ 0.94792955, 0.57219822, 0.33184256],
-    [ 0.95020929, 0.5832232 , 0.34508419],
-    [ 0.95247324, 0.59419035, 0.35859866],
-    [ 0.95471709, 0.60510869, 0.37236035],
-    [ 0.95698411, 0.61595766, 0.38629631],
-    [ 0.95923863, 0.62676473, 0.40043317],
-    [ 0.9615041 , 0.6375203 , 0.41474106],
-    [ 0.96371553, 0.64826619, 0.42928335],
-    [ 0.96591497, 0.65899621, 0.44380444],
-    [ 0.96809871, 0.66971662, 0.45830232],
-    [ 0.9702495 , 0.6804394 , 0.47280492],
-    [ 0.9723881 , 0.69115622, 0.48729272],
-    [ 0.97450723, 0.70187358, 0.50178034],
-    [ 0.9766108 , 0.712592  , 0.51626837],
-    [ 0.97871716, 0.72330511, 0.53074053],
-    [ 0.98082222, 0.73401769, 0.54520694],
-    [ 0.9829001 , 0.74474445, 0.5597019 ],
-    [ 0.98497466, 0.75547635, 0.57420239],
-    [ 0.98705581, 0.76621129, 0.58870185],
-    [ 0.98913325, 0.77695637, 0.60321626],
-    [ 0.99119918, 0.78771716, 0.61775821],
-    [ 0.9932672 , 0.79848979, 0.63231691],
-    [ 0.99535958, 0.80926704, 0.64687278],
-    [ 0.99740544, 0.82008078, 0.66150571],
-    [ 0.9992197 , 0.83100723, 0.6764127 ]
-]
+_luts = dict(rocket=_rocket_lut, mako=_mako_lut, vlag=_vlag_lut,
+             icefire=_icefire_lut)
+cmap_names = tuple(name + suffix for name in ("rocket", "mako", "vlag",
+                                              "icefire")
+                   for suffix in ("", "_r"))
+_arrays = dict()
+_cmaps = dict()
 
 
-_luts = [_rocket_lut, _mako_lut, _vlag_lut, _icefire_lut]
-_names = ["rocket", "mako", "vlag", "icefire"]
+def get_lut(name):
+    """Get the table of a PySurfer colormap.
 
-for _lut, _name in zip(_luts, _names):
+    Parameters
+    ----------
+    name : str
+        The colormap name, e.g. ``"rocket"`` or ``"icefire_r"``.
 
-    _cmap = colors.ListedColormap(_lut, _name)
-    locals()[_name] = _cmap
+    Returns
+    -------
+    lut : array, shape (256, 3)
+        The RGB values in [0, 1]. The array is shared and read-only.
+    """
+    if name not in cmap_names:
+        raise ValueError('Unknown colormap %r, must be one of %s'
+                         % (name, ', '.join(cmap_names)))
+    if name not in _arrays:
+        base = name[:-2] if name.endswith('_r') else name
+        if base not in _arrays:
+            lut = np.array(_luts[base].split(), float).reshape(-1, 3)
+            lut.flags.writeable = False
+            _arrays[base] = lut
+        if name != base:
+            _arrays[name] = _arrays[base][::-1]
+    return _arrays[name]
 
-    _cmap_r = colors.ListedColormap(_lut[::-1], _name + "_r")
-    locals()[_name + "_r"] = _cmap_r
+
+def get_cmap(name):
+    """Get a PySurfer colormap as a matplotlib colormap.
+
+    Parameters
+    ----------
+    name : str
+        The colormap name, e.g. ``"rocket"`` or ``"icefire_r"``.
+
+    Returns
+    -------
+    cmap : instance of matplotlib.colors.ListedColormap
+        The colormap.
+    """
+    if name not in _cmaps:
+        from matplotlib.colors import ListedColormap
+        _cmaps[name] = ListedColormap(get_lut(name), name)
+    return _cmaps[name]
+
+
+class _ColormapModule(types.ModuleType):
+    """This module, with the colormaps built when they are first used."""
+
+    def __dir__(self):
+        return sorted(set(self.__dict__) | set(cmap_names))
+
+
+for _name in cmap_names:
+    setattr(_ColormapModule, _name,
+            property(lambda self, name=_name: get_cmap(name),
+                     doc='The %s colormap, see get_cmap.' % _name))
+del _name
+
+if sys.version_info >= (3, 5):
+    sys.modules[__name__].__class__ = _ColormapModule
+else:  # the class of a module cannot be changed, replace the module
+    _module = _ColormapModule(__name__, __doc__)
+    _module.__dict__.update(globals())
+    _module._module = sys.modules[__name__]  # keeps the globals alive
+    sys.modules[__name__] = _module
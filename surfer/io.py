@@ -15,64 +15,153 @@ import logging
 logger = logging.getLogger('surfer')
 
 
-def read_scalar_data(filepath):
+def read_scalar_data(filepath, frames=None):
     """Load in scalar data from an image.
 
     Parameters
     ----------
     filepath : str
         path to scalar data file
+    frames : int | slice | None
+        If None (default), return all the data as a flat array. Otherwise,
+        the frames (last dimension of the image) to return, see below. Only
+        the selected frames are read: the data of .mgh files are
+        memory-mapped (see :func:`read_mgh`) and other images are sliced
+        through their nibabel array proxy.
 
     Returns
     -------
     scalar_data : numpy array
-        flat numpy array of scalar data
+        flat numpy array of scalar data, or an array of shape
+        (n_vertices, n_frames) if ``frames`` is not None
     """
+    if filepath.endswith(('.mgh', '.mgz')):
+        if frames is None:
+            return np.ravel(read_mgh(filepath, mmap=False)[0], order="F")
+        return read_mgh(filepath, frames)[0]
     try:
-        scalar_data = nib.load(filepath).get_data()
-        scalar_data = np.ravel(scalar_data, order="F")
-        return scalar_data
-
+        img = nib.load(filepath)
     except ImageFileError:
-        ext = os.path.splitext(filepath)[1]
-        if ext == ".mgz":
-            openfile = gzip.open
-        elif ext == ".mgh":
-            openfile = open
-        else:
-            raise ValueError("Scalar file format must be readable "
-                             "by Nibabel or .mg{hz} format")
+        raise ValueError("Scalar file format must be readable "
+                         "by Nibabel or .mg{hz} format")
+    if frames is None:
+        return np.ravel(img.get_data(), order="F")
+    if len(img.shape) > 4:
+        raise ValueError('Cannot select frames of an image with %d '
+                         'dimensions' % len(img.shape))
+    n_frames = img.shape[3] if len(img.shape) == 4 else 1
+    start, stop = _check_frames(frames, n_frames)
+    if len(img.shape) == 4:
+        scalar_data = img.dataobj[..., start:stop]
+    else:
+        scalar_data = np.asanyarray(img.dataobj)[..., np.newaxis]
+        scalar_data = scalar_data[..., start:stop]
+    n_vertices = int(np.prod(img.shape[:3]))
+    return scalar_data.reshape(n_vertices, stop - start, order="F")
+
+
+def _check_frames(frames, n_frames):
+    """Get the start and stop of a frame selection (int or slice)."""
+    if not isinstance(frames, slice):
+        frame = int(frames)
+        if not -n_frames <= frame < n_frames:
+            raise ValueError('frame %d out of range for %d frames'
+                             % (frame, n_frames))
+        frame %= n_frames
+        frames = slice(frame, frame + 1)
+    start, stop, step = frames.indices(n_frames)
+    if step != 1:
+        raise ValueError('frames must be a contiguous range, got step %d'
+                         % (step,))
+    return start, max(start, stop)
+
+
+# The fixed part of the MGH header, the data start at byte 284
+_mgh_header_dtype = np.dtype([
+    ('version', '>i4'), ('dims', '>i4', (4,)), ('type', '>i4'),
+    ('dof', '>i4'), ('goodRASFlag', '>i2'), ('delta', '>f4', (3,)),
+    ('Mdc', '>f4', (3, 3)), ('Pxyz_c', '>f4', (3,))])
+_mgh_data_offset = 284
+_mgh_chunk_size = 2 ** 20
+# FreeSurfer data type codes
+_mgh_data_types = {0: np.dtype('>u1'), 1: np.dtype('>i4'),
+                   3: np.dtype('>f4'), 4: np.dtype('>i2')}
+
+
+def read_mgh(filepath, frames=None, mmap=True):
+    """Read the data of an MGH (.mgh) or compressed MGH (.mgz) file.
+
+    Parameters
+    ----------
+    filepath : str
+        Path to the file.
+    frames : int | slice | None
+        The frames to read (all if None). Only the requested frames are
+        read from uncompressed files; compressed files are decompressed up
+        to the last requested frame.
+    mmap : bool
+        If True (default), memory-map the data of uncompressed files instead
+        of reading them into memory.
 
-    fobj = openfile(filepath, "rb")
-    # We have to use np.fromstring here as gzip fileobjects don't work
-    # with np.fromfile; same goes for try/finally instead of with statement
+    Returns
+    -------
+    data : array, shape (n_voxels, n_frames)
+        The data of the requested frames, with the voxels in Fortran order.
+        Memory-mapped data are read-only and in the (big-endian) byte order
+        of the file, data read into memory are in native byte order.
+    header : numpy record
+        The fixed part of the header (``version``, ``dims``, ``type``,
+        ``dof``, ``goodRASFlag``, ``delta``, ``Mdc`` and ``Pxyz_c``).
+    """
+    compressed = filepath.endswith('.mgz')
+    if not compressed and not filepath.endswith('.mgh'):
+        raise ValueError('MGH files must end with .mgh or .mgz, got %s'
+                         % (filepath,))
+    fobj = (gzip.open if compressed else open)(filepath, 'rb')
     try:
-        v = np.fromstring(fobj.read(4), ">i4")[0]
-        if v != 1:
-            # I don't actually know what versions this code will read, so to be
-            # on the safe side, let's only let version 1 in for now.
+        header = fobj.read(_mgh_header_dtype.itemsize)
+        if len(header) < _mgh_header_dtype.itemsize:
+            raise ValueError('%s is too short to be an MGH file'
+                             % (filepath,))
+        header = np.frombuffer(header, _mgh_header_dtype)[0]
+        if header['version'] != 1:
             # Scalar data might also be in curv format (e.g. lh.thickness)
             # in which case the first item in the file is a magic number.
-            raise NotImplementedError("Scalar data file version not supported")
-        ndim1 = np.fromstring(fobj.read(4), ">i4")[0]
-        ndim2 = np.fromstring(fobj.read(4), ">i4")[0]
-        ndim3 = np.fromstring(fobj.read(4), ">i4")[0]
-        nframes = np.fromstring(fobj.read(4), ">i4")[0]
-        datatype = np.fromstring(fobj.read(4), ">i4")[0]
-        # Set the number of bytes per voxel and numpy data type according to
-        # FS codes
-        databytes, typecode = {0: (1, ">i1"), 1: (4, ">i4"), 3: (4, ">f4"),
-                               4: (2, ">h")}[datatype]
-        # Ignore the rest of the header here, just seek to the data
-        fobj.seek(284)
-        nbytes = ndim1 * ndim2 * ndim3 * nframes * databytes
-        # Read in all the data, keep it in flat representation
-        # (is this ever a problem?)
-        scalar_data = np.fromstring(fobj.read(nbytes), typecode)
+            raise NotImplementedError("Scalar data file version not "
+                                      "supported")
+        if header['type'] not in _mgh_data_types:
+            raise ValueError('Unsupported MGH data type %d'
+                             % (header['type'],))
+        dtype = _mgh_data_types[header['type']]
+        n_voxels = int(np.prod(header['dims'][:3], dtype=np.int64))
+        n_frames = int(header['dims'][3])
+        start, stop = _check_frames(
+            slice(None) if frames is None else frames, n_frames)
+        # the frames are stored one after the other
+        offset = _mgh_data_offset + start * n_voxels * dtype.itemsize
+        shape = (stop - start, n_voxels)
+        if mmap and not compressed:
+            if shape[0] == 0 or n_voxels == 0:
+                data = np.zeros(shape, dtype)
+            else:
+                data = np.memmap(filepath, dtype, 'r', offset, shape)
+        else:
+            fobj.seek(offset)
+            data = np.empty(shape, dtype)
+            # read in chunks, GzipFile.readinto uses a temporary bytes copy
+            buf = memoryview(data.reshape(-1).view(np.uint8))
+            pos = 0
+            while pos < len(buf):
+                n_read = fobj.readinto(buf[pos:pos + _mgh_chunk_size])
+                if not n_read:
+                    raise ValueError('%s is truncated' % (filepath,))
+                pos += n_read
+            if dtype.byteorder == '>' and sys.byteorder == 'little':
+                data.byteswap(True)
+                data = data.view(dtype.newbyteorder('='))
     finally:
         fobj.close()
-
-    return scalar_data
+    return data.T, header
 
 
 def read_stc(filepath):
@@ -120,7 +209,8 @@ def read_stc(filepath):
     # read the number of timepts
     data_n = int(np.fromfile(fid, dtype=">u4", count=1))
 
-    if ((file_length / 4 - 4 - vertices_n) % (data_n * vertices_n)) != 0:
+    if data_n and \
+            ((file_length / 4 - 4 - vertices_n) % (data_n * vertices_n)) != 0:
         raise ValueError('incorrect stc file size')
 
     # read the data matrix
@@ -132,6 +222,173 @@ def read_stc(filepath):
     return stc
 
 
+def write_stc(filepath, vertices, data, tmin, tstep):
+    """Write an STC file
+
+    Parameters
+    ----------
+    filepath : str
+        Path to the STC file.
+    vertices : array of int
+        The vertex indices (0 based).
+    data : array, shape (n_vertices, n_times)
+        The data.
+    tmin : float
+        The first time point of the data in seconds.
+    tstep : float
+        Time between frames in seconds.
+    """
+    with StcWriter(filepath, vertices, tmin, tstep) as writer:
+        writer.append(data)
+
+
+class StcWriter(object):
+    """Write an STC file incrementally
+
+    The number of time points in the header is updated after the data of
+    each :meth:`append`, so that the file can be read with :func:`read_stc`
+    between appends and followed with :class:`StcTailReader` while it is
+    written.
+
+    Parameters
+    ----------
+    filepath : str
+        Path to the STC file, it is overwritten.
+    vertices : array of int
+        The vertex indices (0 based).
+    tmin : float
+        The first time point of the data in seconds.
+    tstep : float
+        Time between frames in seconds.
+
+    Attributes
+    ----------
+    n_times : int
+        The number of time points written so far.
+    """
+
+    def __init__(self, filepath, vertices, tmin, tstep):
+        self.vertices = np.asarray(vertices, int)
+        self.n_times = 0
+        self._fid = open(filepath, 'wb')
+        self._fid.write(
+            (np.array([tmin, tstep]) * 1000.).astype('>f4').tobytes())
+        self._fid.write(np.array([len(self.vertices)], '>u4').tobytes())
+        self._fid.write(self.vertices.astype('>u4').tobytes())
+        self._n_times_pos = self._fid.tell()
+        self._fid.write(np.array([0], '>u4').tobytes())
+        self._fid.flush()
+
+    def append(self, data):
+        """Append time points
+
+        Parameters
+        ----------
+        data : array, shape (n_vertices[, n_times])
+            The data of one or more time points.
+        """
+        data = np.asarray(data)
+        if data.ndim == 1:
+            data = data[:, np.newaxis]
+        if data.ndim != 2 or data.shape[0] != len(self.vertices):
+            raise ValueError('data must have shape (%d, n_times), got %s'
+                             % (len(self.vertices), data.shape))
+        self._fid.seek(0, 2)
+        self._fid.write(data.T.astype('>f4').tobytes())
+        self._fid.flush()
+        self.n_times += data.shape[1]
+        self._fid.seek(self._n_times_pos)
+        self._fid.write(np.array([self.n_times], '>u4').tobytes())
+        self._fid.flush()
+
+    def close(self):
+        """Close the file"""
+        self._fid.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class StcTailReader(object):
+    """Read the time points appended to an STC file since the last read
+
+    Parameters
+    ----------
+    filepath : str
+        Path to an STC file, e.g. one being written with :class:`StcWriter`.
+
+    Attributes
+    ----------
+    tmin : float | None
+        The first time point of the data in seconds.
+    tstep : float | None
+        Time between frames in seconds.
+    vertices : array of int | None
+        The vertex indices (0 based).
+    n_read : int
+        The number of time points read so far.
+
+    Notes
+    -----
+    The header is read by the first :meth:`read` that finds it complete,
+    before that the attributes are None.
+    """
+
+    def __init__(self, filepath):
+        self.filepath = filepath
+        self.tmin = self.tstep = self.vertices = None
+        self.n_read = 0
+
+    def _read_header(self, fid, file_length):
+        if file_length < 12:
+            return False
+        tmin, tstep = np.fromfile(fid, '>f4', 2) / 1000.
+        n_vertices = int(np.fromfile(fid, '>u4', 1))
+        if file_length < 4 * (n_vertices + 4):
+            return False
+        self.vertices = np.fromfile(fid, '>u4', n_vertices)
+        self.tmin, self.tstep = float(tmin), float(tstep)
+        return True
+
+    def read(self):
+        """Read the new time points
+
+        Returns
+        -------
+        data : array, shape (n_vertices, n_new)
+            The data of the time points appended since the last read.
+        times : array, shape (n_new,)
+            Their times in seconds.
+        """
+        with open(self.filepath, 'rb') as fid:
+            fid.seek(0, 2)
+            file_length = fid.tell()
+            fid.seek(0)
+            if self.vertices is None and \
+                    not self._read_header(fid, file_length):
+                return np.empty((0, 0), '>f4'), np.empty(0)
+            n_vertices = len(self.vertices)
+            data_pos = 4 * (n_vertices + 4)
+            fid.seek(data_pos - 4)
+            n_times = int(np.fromfile(fid, '>u4', 1))
+            # the data are written before the number of time points, but
+            # do not read beyond the end of the file in any case
+            if n_vertices:
+                n_times = min(n_times,
+                              (file_length - data_pos) // (4 * n_vertices))
+            n_new = max(n_times - self.n_read, 0)
+            fid.seek(data_pos + 4 * n_vertices * self.n_read)
+            data = np.fromfile(fid, '>f4', n_new * n_vertices)
+        data = data.reshape(n_new, n_vertices).T
+        times = self.tmin + self.tstep * np.arange(self.n_read,
+                                                   self.n_read + n_new)
+        self.n_read += n_new
+        return data, times
+
+
 @verbose
 def project_volume_data(filepath, hemi, reg_file=None, subject_id=None,
                         projmeth="frac", projsum="avg", projarg=[0, 1, .1],
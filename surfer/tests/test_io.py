@@ -0,0 +1,104 @@
+import os.path as op
+
+import numpy as np
+import nibabel as nib
+import pytest
+from numpy.testing import assert_allclose, assert_array_equal
+
+from surfer import io
+
+data_dir = op.join(op.dirname(__file__), '..', '..', 'examples',
+                   'example_data')
+
+
+def test_read_mgh(tmpdir):
+    """Test reading MGH and MGZ files."""
+    rng = np.random.RandomState(0)
+    for dtype in (np.float32, np.int32, np.int16, np.uint8):
+        data = (rng.rand(50, 2, 1, 5) * 100).astype(dtype)
+        flat = data.reshape(100, 5, order='F')
+        for ext in ('.mgh', '.mgz'):
+            fname = str(tmpdir.join('data' + ext))
+            nib.save(nib.MGHImage(data, np.eye(4)), fname)
+            assert_array_equal(io.read_scalar_data(fname),
+                               np.ravel(data, order='F'))
+            for mmap in (True, False):
+                read, header = io.read_mgh(fname, mmap=mmap)
+                assert read.shape == (100, 5)
+                assert_array_equal(read, flat)
+                assert_array_equal(header['dims'], [50, 2, 1, 5])
+                assert isinstance(read, np.memmap) == \
+                    (mmap and ext == '.mgh')
+                assert_array_equal(io.read_mgh(fname, slice(1, 3), mmap)[0],
+                                   flat[:, 1:3])
+                assert_array_equal(io.read_mgh(fname, -1, mmap)[0],
+                                   flat[:, -1:])
+            pytest.raises(ValueError, io.read_mgh, fname, 5)
+            pytest.raises(ValueError, io.read_mgh, fname, slice(0, 5, 2))
+
+    # compare with nibabel
+    fname = op.join(data_dir, 'lh.curv.fsaverage.mgz')
+    assert_array_equal(io.read_scalar_data(fname),
+                       np.asanyarray(nib.load(fname).dataobj).ravel('F'))
+    pytest.raises(ValueError, io.read_mgh, op.join(data_dir, 'lh.sig.nii.gz'))
+
+
+def test_read_scalar_data_frames(tmpdir):
+    """Test reading frames of surface time series."""
+    rng = np.random.RandomState(0)
+    data = rng.randn(30, 1, 1, 6).astype(np.float32)
+    flat = data.reshape(30, 6, order='F')
+    for ext, klass in (('.mgh', nib.MGHImage), ('.mgz', nib.MGHImage),
+                       ('.nii', nib.Nifti1Image),
+                       ('.nii.gz', nib.Nifti1Image)):
+        fname = str(tmpdir.join('lh.data' + ext))
+        nib.save(klass(data, np.eye(4)), fname)
+        assert_array_equal(io.read_scalar_data(fname),
+                           np.ravel(data, order='F'))
+        assert_array_equal(io.read_scalar_data(fname, slice(None)), flat)
+        assert_array_equal(io.read_scalar_data(fname, slice(2, 4)),
+                           flat[:, 2:4])
+        assert_array_equal(io.read_scalar_data(fname, 5), flat[:, 5:])
+        pytest.raises(ValueError, io.read_scalar_data, fname, 6)
+
+    # a 3D image has a single frame
+    fname = op.join(data_dir, 'lh.sig.nii.gz')
+    sig = io.read_scalar_data(fname)
+    assert_array_equal(io.read_scalar_data(fname, 0), sig[:, np.newaxis])
+    assert io.read_scalar_data(fname, slice(1, None)).shape == (len(sig), 0)
+
+
+def test_stc_streaming(tmpdir):
+    """Test writing and tailing STC files."""
+    stc = io.read_stc(op.join(data_dir, 'meg_source_estimate-lh.stc'))
+    fname = str(tmpdir.join('test-lh.stc'))
+    io.write_stc(fname, stc['vertices'], stc['data'], stc['tmin'],
+                 stc['tstep'])
+    stc_read = io.read_stc(fname)
+    for key in ('vertices', 'data'):
+        assert_array_equal(stc_read[key], stc[key])
+    for key in ('tmin', 'tstep'):
+        assert_allclose(stc_read[key], stc[key], rtol=1e-6)
+
+    # append frames while reading the new ones
+    fname = str(tmpdir.join('stream-lh.stc'))
+    reader = io.StcTailReader(fname)
+    with io.StcWriter(fname, stc['vertices'], stc['tmin'],
+                      stc['tstep']) as writer:
+        data, times = reader.read()
+        assert data.shape == (len(stc['vertices']), 0)
+        assert len(times) == 0
+        for start, stop in ((0, 1), (1, 1), (1, 3), (3, 4)):
+            if stop == start + 1:  # a single time point
+                writer.append(stc['data'][:, start])
+            else:
+                writer.append(stc['data'][:, start:stop])
+            data, times = reader.read()
+            assert_array_equal(data, stc['data'][:, start:stop])
+            assert_allclose(times, stc['tmin'] + stc['tstep'] *
+                            np.arange(start, stop), rtol=1e-6)
+            assert_array_equal(io.read_stc(fname)['data'],
+                               stc['data'][:, :stop])
+        assert writer.n_times == reader.n_read == 4
+        pytest.raises(ValueError, writer.append, stc['data'][1:])
+    assert_array_equal(reader.vertices, stc['vertices'])
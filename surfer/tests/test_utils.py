@@ -1,8 +1,14 @@
+import os
+
 import numpy as np
 import matplotlib as mpl
-from numpy.testing import assert_array_almost_equal, assert_array_equal
+import nibabel as nib
+import pytest
+from numpy.testing import (assert_array_almost_equal, assert_array_equal,
+                           assert_allclose)
+from scipy import sparse
 
-from surfer import utils
+from surfer import cm as surfer_cm, utils
 
 
 def _slow_compute_normals(rr, tris):
@@ -51,12 +57,228 @@ def test_surface():
         nn_fast = utils._compute_normals(surface.coords, surface.faces[:10000])
         assert_array_almost_equal(nn, nn_fast)
         assert 50 < np.linalg.norm(surface.coords, axis=-1).mean() < 100  # mm
+
+        # areas
+        assert surface.tri_area.shape == (len(surface.faces),)
+        assert surface.vertex_area.shape == (len(surface.coords),)
+        assert_allclose(surface.vertex_area.sum(), surface.tri_area.sum())
     surface = utils.Surface('fsaverage', 'lh', 'inflated',
                             subjects_dir=subj_dir, units='m')
     surface.load_geometry()
     assert 0.05 < np.linalg.norm(surface.coords, axis=-1).mean() < 0.1  # m
 
 
+@utils.requires_fsaverage()
+def test_geometry_cache():
+    """Test sharing the geometry of surfaces"""
+    subj_dir = utils._get_subjects_dir()
+    utils.clear_geometry_cache()
+    surfaces = [utils.Surface('fsaverage', 'lh', 'inflated', subj_dir)
+                for _ in range(2)]
+    for surface in surfaces:
+        surface.load_geometry()
+    for attr in ('coords', 'faces', 'nn'):
+        assert getattr(surfaces[0], attr) is getattr(surfaces[1], attr)
+        assert not getattr(surfaces[0], attr).flags.writeable
+    info = utils.geometry_cache_info()
+    assert len(info) == 1
+    assert info[0]['subject_id'] == 'fsaverage'
+    assert info[0]['surf'] == 'inflated'
+    assert info[0]['nbytes'] > surfaces[0].coords.nbytes
+    # different parameters are not shared
+    other = utils.Surface('fsaverage', 'lh', 'inflated', subj_dir, units='m')
+    other.load_geometry()
+    assert other.coords is not surfaces[0].coords
+    assert len(utils.geometry_cache_info()) == 2
+    # transforming a surface leaves the others untouched
+    coords = surfaces[1].coords.copy()
+    surfaces[0].apply_xfm(np.diag([2., 2., 2., 1.]))
+    assert_array_equal(surfaces[1].coords, coords)
+    # unused geometries are released, cleared ones are reloaded
+    del other
+    assert len(utils.geometry_cache_info()) == 1
+    assert utils.clear_geometry_cache(subject_id='sample') == 0
+    assert utils.clear_geometry_cache(subject_id='fsaverage') == 1
+    assert utils.geometry_cache_info() == []
+    surfaces[0].load_geometry()
+    assert surfaces[0].coords is not surfaces[1].coords
+    assert_array_equal(surfaces[0].coords, coords)
+
+
+def test_areas():
+    """Test triangle and vertex areas."""
+    # unit square split into two triangles
+    rr = np.array([[0., 0., 0.], [1., 0., 0.], [1., 1., 0.], [0., 1., 0.]])
+    tris = np.array([[0, 1, 2], [0, 2, 3]])
+    nn, tri_area = utils._compute_normals(rr, tris, return_tri_area=True)
+    assert_array_almost_equal(nn, utils._compute_normals(rr, tris))
+    assert_allclose(tri_area, [0.5, 0.5])
+    vertex_area = utils._compute_vertex_area(tris, tri_area, len(rr))
+    assert_allclose(vertex_area, [1. / 3, 1. / 6, 1. / 3, 1. / 6])
+
+
+def _grid_mesh(n=10):
+    """Make a flat triangulated grid with unit spacing."""
+    x, y = np.meshgrid(np.arange(n, dtype=float), np.arange(n, dtype=float))
+    rr = np.c_[x.ravel(), y.ravel(), np.zeros(n * n)]
+    idx = np.arange(n * n).reshape(n, n)[:-1, :-1].ravel()
+    tris = np.r_[np.c_[idx, idx + 1, idx + n + 1],
+                 np.c_[idx, idx + n + 1, idx + n]]
+    return rr, tris
+
+
+def test_geodesic(monkeypatch):
+    """Test geodesic distances and disks."""
+    rr, tris = _grid_mesh()
+    dist_graph = utils.mesh_dist(tris, rr)
+    assert dist_graph.shape == (100, 100)
+    assert_allclose(dist_graph[0, 1], 1.)
+    assert_allclose(dist_graph[0, 11], np.sqrt(2))
+    assert dist_graph[0, 10] == 1.
+
+    # multi-source distances
+    dist = utils.geodesic_distance(dist_graph, [0, 99])
+    assert_allclose(dist[[0, 99, 1, 98, 9]], [0, 0, 1, 1, 9])
+    dist = utils.geodesic_distance(dist_graph, 0, max_dist=2.)
+    assert_allclose(dist[[0, 1, 2]], [0, 1, 2])
+    assert np.isinf(dist[3])
+
+    # one disk per seed
+    disks, dists = utils.geodesic_disks(dist_graph, [0, 55], 1.)
+    assert len(disks) == len(dists) == 2
+    assert_array_equal(disks[0], [0, 1, 10])
+    assert_array_equal(disks[1], [45, 54, 55, 56, 65])
+    assert_allclose(dists[1], [1, 1, 0, 1, 1])
+    monkeypatch.setattr(utils, '_geodesic_chunk_size', 200)  # 2 seeds
+    seeds = [0, 55, 3, 99, 55]
+    chunked = utils.geodesic_disks(dist_graph, seeds, 2.)
+    for seed, disk, dist in zip(seeds, *chunked):
+        want = utils.geodesic_disks(dist_graph, seed, 2.)
+        assert_array_equal(disk, want[0][0])
+        assert_allclose(dist, want[1][0])
+
+
+def test_decimate_surface():
+    """Test decimating a surface by vertex clustering."""
+    rr, tris = _grid_mesh(21)
+    vertices, faces = utils.decimate_surface(rr, tris, 441)
+    assert_array_equal(vertices, np.arange(441))
+    assert_array_equal(faces, tris)
+    vertices, faces = utils.decimate_surface(rr, tris, 100)
+    # cells are 2x2 (surface area 400), so every other row and column
+    assert len(vertices) == 121
+    assert_array_equal(np.sort(vertices),
+                       np.arange(441).reshape(21, 21)[::2, ::2].ravel())
+    assert faces.min() == 0 and faces.max() == len(vertices) - 1
+    assert len(np.unique(np.sort(faces, axis=1), axis=0)) == len(faces)
+    area = utils._compute_normals(rr[vertices], faces, True)[1].sum()
+    assert_allclose(area, 400)
+
+
+def test_dilate_vertices():
+    """Test breadth-first dilation against repeated smoothing."""
+    rr, tris = _grid_mesh()
+    adj_mat = utils.mesh_edges(tris)
+    smooth_mat = utils.smoothing_matrix(np.arange(len(rr)), adj_mat, 1)
+    for seed, n_steps in ((0, 0), (0, 3), (45, 2), (55, 30)):
+        data = np.zeros(len(rr))
+        data[seed] = 1.
+        for _ in range(n_steps):
+            data = smooth_mat * data
+        want = np.where(data > 0)[0]
+        got = utils._dilate_vertices(adj_mat.tocsr(), seed, n_steps)
+        assert_array_equal(got, want)
+
+
+def test_smoothing_operator(caplog, monkeypatch):
+    """Test extending smoothing matrices by the missing steps."""
+    rr, tris = _grid_mesh()
+    adj_mat = utils.mesh_edges(tris)
+    vertices = np.arange(0, len(rr), 7)
+    smoother = utils._SmoothingOperator(vertices, adj_mat, n_keep=3)
+    caplog.set_level('INFO', 'surfer')
+    for steps, first_step in ((3, 1), (7, 4), (5, 4), (7, None), (None, 1),
+                              (2, 1)):
+        want = utils.smoothing_matrix(vertices, adj_mat, steps)
+        caplog.clear()
+        smooth_mat = smoother.matrix(steps)
+        assert smooth_mat.shape == (len(rr), len(vertices))
+        assert_allclose(smooth_mat.toarray(), want.toarray(), rtol=1e-12)
+        steps_done = [record.getMessage() for record in caplog.records
+                      if 'step' in record.getMessage()]
+        if first_step is None:  # kept, nothing is logged
+            assert caplog.records == []
+        else:
+            assert steps_done[0].endswith('step %d' % first_step)
+    assert list(smoother._mats) == [7, None, 2]
+
+    # applying the factors of the steps one by one
+    data = np.random.RandomState(0).randn(len(vertices), 3)
+    for steps in (1, 4, None):
+        want = utils.smoothing_matrix(vertices, adj_mat, steps) * data
+        assert_allclose(smoother.apply(data, steps), want, atol=1e-12)
+        assert_allclose(smoother.apply(data[:, 0], steps), want[:, 0],
+                        atol=1e-12)
+    smoother = utils._SmoothingOperator(vertices, adj_mat)
+    smoother._factor(59)
+    n_factors = len(smoother._factors)  # the last one repeats
+    assert_allclose(smoother.apply(data, 30),
+                    utils.smoothing_matrix(vertices, adj_mat, 30) * data)
+    assert len(smoother._factors) == n_factors < 30
+
+    # choosing between them
+    rr, tris = _grid_mesh(30)
+    adj_mat = utils.mesh_edges(tris)
+    vertices = np.arange(0, len(rr), 31)
+    smoother = utils._SmoothingOperator(vertices, adj_mat)
+    want = utils.smoothing_matrix(vertices, adj_mat, 10)
+    smooth_op = smoother.operator(10, n_frames=1)
+    assert not sparse.issparse(smooth_op)
+    assert len(smoother._mats) == 0
+    data = np.random.RandomState(0).randn(len(vertices), 2)
+    assert_allclose(smooth_op * data, want * data, atol=1e-12)
+    assert_allclose(smooth_op * data[:, 0], want * data[:, 0], atol=1e-12)
+    # the matrix is built once enough frames pay for it
+    n_frames = 2 ** np.arange(11)
+    choices = list()
+    for n in n_frames:
+        choices.append(sparse.issparse(smoother.operator(10, n_frames=n)))
+        smoother._mats.clear()
+    assert choices == sorted(choices)
+    assert not choices[0] and choices[-1]
+    assert sparse.issparse(smoother.operator(10, n_frames=1000))
+    assert sparse.issparse(smoother.operator(10, n_frames=1))  # kept
+    monkeypatch.setattr(utils, '_max_smoothing_nnz', 100)
+    smoother = utils._SmoothingOperator(vertices, adj_mat)
+    assert not sparse.issparse(smoother.operator(10, n_frames=1000))
+
+
+@utils.requires_fsaverage()
+def test_coord_to_label(tmpdir, monkeypatch):
+    """Test creating labels from coordinates."""
+    monkeypatch.chdir(str(tmpdir))
+    coords = [[-40, 10, 30], [-30, -20, 50]]
+    verts = utils.coord_to_label('fsaverage', coords, 'foo', n_steps=3)
+    assert len(verts) == 2
+    for ii, vv in enumerate(verts):
+        fname = str(tmpdir.join('foo_%d-lh.label' % ii))
+        ids = nib.freesurfer.read_label(fname)
+        assert_array_equal(ids, vv)
+    verts_one = utils.coord_to_label('fsaverage', coords[1], 'bar',
+                                     n_steps=3)
+    assert_array_equal(verts_one[0], verts[1])
+    assert tmpdir.join('bar-lh.label').check()
+
+    # geodesic disks, without writing files
+    disks = utils.coord_to_label('fsaverage', coords, None, radius_mm=5)
+    assert len(disks) == 2
+    assert not tmpdir.join('None-lh.label').check()
+    for disk, vv in zip(disks, verts):
+        assert np.in1d(disk, vv).any()  # both contain the closest vertex
+    with pytest.raises(ValueError, match='label names'):
+        utils.coord_to_label('fsaverage', coords, ['a'])
+
+
 def test_huge_cross():
     """Test cross product with lots of elements."""
     x = np.random.rand(100000, 3)
@@ -66,6 +288,96 @@ def test_huge_cross():
     assert_array_equal(z, zz)
 
 
+def test_thread_map():
+    """Test applying a function with a pool of threads."""
+    for n_jobs in (None, 1, 3):
+        assert utils._thread_map(np.sqrt, [4, 9, 16, 25], n_jobs) == \
+            [2, 3, 4, 5]
+    assert utils._thread_map(np.sqrt, [], 2) == []
+    with pytest.raises(IOError, match='missing'):
+        utils._thread_map(nib.freesurfer.read_morph_data,
+                          ['lh.curv.missing'] * 3, 3)
+
+
+def test_growable_array():
+    """Test growing an array along its last axis."""
+    data = np.arange(24.).reshape(4, 3, 2)
+    data.flags.writeable = False
+    growable = utils._GrowableArray(data)
+    expected = data
+    for n_new in (1, 0, 3, 1, 7):
+        new = np.random.RandomState(n_new).randn(4, 3, n_new)
+        expected = np.concatenate((expected, new), axis=-1)
+        assert_array_equal(growable.append(new), expected)
+    assert_array_equal(growable.array, expected)
+    assert growable._buffer.shape == (16, 4, 3)  # 2 -> 4 -> 8 -> 16
+    assert_array_equal(data, np.arange(24.).reshape(4, 3, 2))
+
+
+def test_ring_array():
+    """Test keeping the last time points of an array."""
+    data = np.arange(24.).reshape(4, 3, 2)
+    ring = utils._RingArray(data, 5)
+    expected = data
+    for n_new in (1, 0, 3, 1, 7, 4):
+        new = np.random.RandomState(n_new).randn(4, 3, n_new)
+        expected = np.concatenate((expected, new), axis=-1)
+        assert ring.append(new) is ring
+        assert ring.shape == (4, 3, min(expected.shape[-1], 5))
+        assert_array_equal(ring, expected[..., -5:])
+        assert ring.n_dropped == max(expected.shape[-1] - 5, 0)
+        assert_array_equal(ring.take(0), expected[..., -ring.n])
+        assert_array_equal(ring.take([ring.n - 1, 1]),
+                           expected[..., [-1, 1 - ring.n]])
+    assert ring._buffer.shape == (5, 4, 3)
+    assert_array_equal(utils._RingArray(data, 1), data[..., -1:])
+    pytest.raises(IndexError, ring.take, 5)
+    pytest.raises(ValueError, utils._RingArray, data, 0)
+
+
+def test_read_cached(tmpdir):
+    """Test reading files once until they change."""
+    fname = str(tmpdir.join('lh.thickness'))
+    nib.freesurfer.write_morph_data(fname, np.arange(10.))
+    data = utils._read_cached(nib.freesurfer.read_morph_data, fname)
+    assert_array_equal(data, np.arange(10.))
+    assert not data.flags.writeable
+    assert utils._read_cached(nib.freesurfer.read_morph_data, fname) is data
+    nib.freesurfer.write_morph_data(fname, np.ones(10))
+    os.utime(fname, (0, 0))  # make sure the modification time changes
+    data = utils._read_cached(nib.freesurfer.read_morph_data, fname)
+    assert_array_equal(data, np.ones(10))
+
+
+def test_chunked_percentile():
+    """Test computing percentiles of data read in chunks."""
+    rng = np.random.RandomState(0)
+    data = rng.randn(1000, 7)
+    q = [0, 2, 37.5, 50, 98, 100]
+    kwargs = dict(max_exact=100, chunk_size=512, n_bins=1024)
+    assert_allclose(utils.chunked_percentile(data, q, **kwargs),
+                    np.percentile(data, q), rtol=0, atol=1e-12)
+    assert_allclose(utils.chunked_percentile(data, 2, **kwargs),
+                    np.percentile(data, 2), rtol=0, atol=1e-12)
+    assert_allclose(utils.chunked_percentile(data, q, np.abs, **kwargs),
+                    np.percentile(np.abs(data), q), rtol=0, atol=1e-12)
+    assert_allclose(utils.chunked_percentile(data, q, lambda x: x[x > 0],
+                                             **kwargs),
+                    np.percentile(data[data > 0], q), rtol=0, atol=1e-12)
+    # bins with too many values are split again, e.g. for heavy tails,
+    # outliers and ties
+    kwargs.update(n_bins=16)
+    for data in (rng.rand(10000) ** 4, np.abs(rng.standard_cauchy(10000)),
+                 np.r_[rng.randn(10000), np.full(5, 1e6)],
+                 np.r_[np.zeros(5000), rng.rand(5000)]):
+        assert_allclose(utils.chunked_percentile(data, q, **kwargs),
+                        np.percentile(data, q), rtol=0, atol=1e-12)
+    assert utils.chunked_percentile(np.ones(1000), 50, **kwargs) == 1
+    pytest.raises(ValueError, utils.chunked_percentile, data, 101)
+    pytest.raises(ValueError, utils.chunked_percentile, -data, 50,
+                  lambda x: x[x > 0], **kwargs)
+
+
 def test_create_color_lut():
     """Test various ways of making a colormap."""
     # Test valid lut
@@ -86,6 +398,22 @@ def test_create_color_lut():
     # Test named pysurfer lut
     cmap_out = utils.create_color_lut("icefire_r")
     assert cmap_out.shape == (256, 4)
+    for n_colors in (256, 100):
+        cmap_in = surfer_cm.get_cmap("icefire_r")
+        want = (cmap_in(np.linspace(0, 1, n_colors)) * 255).astype(int)
+        cmap_out = utils.create_color_lut("icefire_r", n_colors)
+        assert_array_equal(cmap_out, want)
+        cmap_out[:] = 0  # results are cached, but copied
+        assert_array_equal(utils.create_color_lut("icefire_r", n_colors),
+                           want)
+    assert_array_equal(surfer_cm.get_lut("icefire_r"),
+                       surfer_cm.get_lut("icefire")[::-1])
+    pytest.raises(ValueError, surfer_cm.get_lut, "foo")
+    # the colormaps are module attributes
+    assert "rocket" in dir(surfer_cm)
+    assert surfer_cm.rocket is surfer_cm.get_cmap("rocket")
+    assert surfer_cm.icefire_r is surfer_cm.get_cmap("icefire_r")
+    assert isinstance(surfer_cm.mako_r, mpl.colors.ListedColormap)
 
     # Test matplotlib object lut
     cmap_in = mpl.colors.ListedColormap(["blue", "white", "red"])
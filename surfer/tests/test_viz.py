@@ -1,18 +1,22 @@
+import json
 import os
 import os.path as op
 from os.path import join as pjoin
 import sys
+import time
 import warnings
 
 import pytest
 from mayavi import mlab
 import nibabel as nib
 import numpy as np
-from numpy.testing import assert_array_equal, assert_array_less
+from numpy.testing import (assert_allclose, assert_array_equal,
+                           assert_array_less)
+from scipy import sparse
 
 from unittest import SkipTest
 
-from surfer import Brain, io, utils
+from surfer import Brain, BrainGrid, io, utils, viz
 from surfer.utils import requires_fsaverage, requires_imageio, requires_fs
 
 warnings.simplefilter('always')
@@ -208,6 +212,73 @@ def test_data_limits():
     surf_data = np.zeros(163842)
     pytest.raises(ValueError, brain.add_data, surf_data, 0, 0)
     brain.add_data(surf_data, 0, 1)
+    # robust limits over all time points
+    surf_data = np.tile(np.linspace(-1, 1, 163842)[:, np.newaxis], (1, 3))
+    brain.add_data(surf_data, 'robust_min', 'robust_max', time=np.arange(3),
+                   remove_existing=True)
+    data = brain.data_dict['lh']
+    assert_allclose([data['fmin'], data['fmax']], [-0.96, 0.96], atol=1e-4)
+    brain.add_data(surf_data, max='robust_max', center=0.,
+                   remove_existing=True)
+    assert_allclose(brain.data_dict['lh']['fmax'], 0.98, atol=1e-4)
+    pytest.raises(ValueError, brain.add_data, surf_data, 'actual_min')
+    brain.close()
+
+
+@requires_fsaverage()
+def test_frame_limits():
+    """Test colormap limits that follow the data over time."""
+    _set_backend()
+    brain = Brain(*std_args)
+    data = np.linspace(0, 1, 163842)[:, np.newaxis] * np.arange(1, 6)
+    pytest.raises(ValueError, brain.add_data, data[:, 0], frame_limits=1)
+    pytest.raises(ValueError, brain.add_data, data, frame_limits=1, mid=3)
+    brain.add_data(data, frame_limits=1)
+    layer = brain.data_dict['lh']
+    assert_allclose(layer['frame_limits'],
+                    np.c_[np.zeros(5), np.arange(1, 6) / 2., np.arange(1, 6)])
+    lut_manager = layer['surfaces'][0].module_manager.scalar_lut_manager
+    assert_allclose(lut_manager.data_range, [0, 1])
+    brain.set_data_time_index(3)
+    assert_allclose(lut_manager.data_range, [0, 4])
+    assert (layer['fmin'], layer['fmid'], layer['fmax']) == (0, 2, 4)
+    brain.set_data_time_index(3.5)
+    assert_allclose(lut_manager.data_range, [0, 4.5])
+    assert sorted(layer['frame_luts']) == [0, 3]
+    # centered window and robust limits
+    brain.add_data(data, 'robust_min', 'robust_max', frame_limits=3,
+                   remove_existing=True)
+    layer = brain.data_dict['lh']
+    assert_allclose(layer['frame_limits'][[0, 2], 2], [1.47, 2.94])
+    assert_allclose(layer['frame_limits'][:, 0],
+                    layer['frame_limits'][:, 2] / 49.)
+    # fixed limits replace them
+    lut_manager = layer['surfaces'][0].module_manager.scalar_lut_manager
+    brain.scale_data_colormap(0.1, 0.2, 0.3, False)
+    brain.set_data_time_index(4)
+    assert_allclose(lut_manager.data_range, [0.1, 0.3])
+    brain.close()
+
+
+@requires_fsaverage()
+def test_data_colormap():
+    """Test rescaling of the data colormap."""
+    _set_backend()
+    brain = Brain(*std_args)
+    brain.add_data(np.linspace(-1, 1, 163842), 0.2, 1, center=0.,
+                   transparent=True, colormap='RdBu_r')
+    data = brain.data_dict['lh']
+    orig_ctable = data['orig_ctable'].copy()
+    lut = viz._scale_mayavi_lut(orig_ctable, 0.2, 0.5, 1, True, center=0.)
+    assert_array_equal(orig_ctable, data['orig_ctable'])  # not modified
+    lut[:] = 0  # the cached LUT is not modified either
+    lut = viz._scale_mayavi_lut(orig_ctable, 0.2, 0.5, 1, True, center=0.)
+    assert lut.max() == 255
+    brain.scale_data_colormap(0.2, 0.5, 1, True, center=0.)
+    l_m = data['surfaces'][0].module_manager.scalar_lut_manager
+    l_m.lut.build()  # the table written in place must survive a rebuild
+    assert_array_equal(l_m.lut.table.to_array(), np.floor(lut + 0.5))
+    assert_array_equal(l_m.data_range, [-1, 1])
     brain.close()
 
 
@@ -275,6 +346,195 @@ def test_label():
     brain.close()
 
 
+@requires_fsaverage()
+def test_batch_updates(monkeypatch):
+    """Test suspending rendering for many updates."""
+    _set_backend()
+    brain = Brain(*std_args)
+    n_renders = [0]
+    force_render = viz._force_render
+
+    def _count_render(figures):
+        n_renders[0] += 1
+        force_render(figures)
+
+    monkeypatch.setattr(viz, '_force_render', _count_render)
+    brain.add_label('BA1')
+    assert n_renders[0] == 1
+    n_renders[0] = 0
+    with brain.batch_updates():
+        brain.add_label('BA6')
+        with brain.batch_updates():
+            brain.add_label('V1', color='steelblue')
+            brain.add_data(np.linspace(0, 1, 163842), 0, 1)
+            brain.scale_data_colormap(0.2, 0.5, 0.8, True)
+        assert brain._batch_depth == 1
+        assert n_renders[0] == 0
+    assert brain._batch_depth == 0
+    assert n_renders[0] == 1
+    with pytest.raises(RuntimeError, match='foo'):
+        with brain.batch_updates():
+            raise RuntimeError('foo')
+    assert brain._batch_depth == 0
+    brain.close()
+
+
+@requires_fsaverage()
+def test_lod():
+    """Test showing decimated surfaces while interacting."""
+    _set_backend()
+    brain = Brain(*std_args)
+    brain.add_label('BA1')
+    brain.add_data(np.linspace(0, 1, 163842), 0, 1)
+    hemi = brain.brains[0]
+    dataset = hemi._mesh_dataset
+    n_faces = dataset.number_of_polys
+    brain.enable_lod(5000)
+    hemi._on_interaction(True)
+    n_vertices = len(hemi._lod['vertices'])
+    assert 2500 < n_vertices < 10000
+    assert dataset.number_of_points == n_vertices
+    assert dataset.number_of_polys < n_faces / 10.
+    for ii in range(dataset.point_data.number_of_arrays):
+        array = dataset.point_data.get_array(ii)
+        assert array.number_of_tuples == n_vertices
+    brain.screenshot()  # always at full resolution
+    assert dataset.number_of_points == 163842
+    assert dataset.number_of_polys == n_faces
+    hemi._on_interaction(True)
+    brain.set_surf('white')  # decimates the new surface
+    assert dataset.number_of_points == 163842
+    hemi._on_interaction(True)
+    hemi._on_interaction(False)
+    assert dataset.point_data.get_array(0).number_of_tuples == 163842
+    brain.disable_lod()
+    hemi._on_interaction(True)
+    assert dataset.number_of_points == 163842
+    brain.close()
+
+
+@requires_fsaverage()
+def test_batch(tmpdir):
+    """Test rendering jobs from a manifest."""
+    from surfer._batch import run_batch, format_timings
+    _set_backend()
+    manifest = dict(
+        defaults=dict(subject_id='fsaverage', surf='inflated', size=300),
+        jobs=[dict(hemi='lh', labels=['BA1', dict(label='V1', color='r')],
+                   output=str(tmpdir.join('lh_labels.png'))),
+              dict(hemi='lh', annotations='aparc', morphometry='curv',
+                   output=str(tmpdir.join('sub', 'lh_aparc.png'))),
+              dict(hemi='rh', labels=['BA1'], views=['lat', 'med'],
+                   output=str(tmpdir.join('rh_labels.png'))),
+              dict(hemi='lh', labels=['foo'],
+                   output=str(tmpdir.join('lh_foo.png')))])
+    fname = str(tmpdir.join('manifest.json'))
+    with open(fname, 'w') as fid:
+        json.dump(manifest, fid)
+    timings = run_batch(fname)
+    assert [t['index'] for t in timings] == [0, 1, 2, 3]
+    assert [t['reused'] for t in timings] == [False, True, False, True]
+    assert [t['error'] is None for t in timings] == [True, True, True, False]
+    for timing in timings[:3]:
+        assert op.isfile(timing['output'])
+    assert '4 jobs, 1 failed' in format_timings(timings)
+    manifest['jobs'][0].pop('output')
+    with open(fname, 'w') as fid:
+        json.dump(manifest, fid)
+    with pytest.raises(ValueError, match='Job 0 is missing output'):
+        run_batch(fname)
+
+
+@requires_fsaverage()
+def test_clear_reset(tmpdir):
+    """Test clearing and resetting a Brain."""
+    _set_backend()
+    subjects_dir = str(tmpdir)
+    os.symlink(op.join(utils._get_subjects_dir(), 'fsaverage'),
+               op.join(subjects_dir, 'fsaverage'))
+    # an octahedron as a second subject
+    rr = np.array([[1, 0, 0], [-1, 0, 0], [0, 1, 0], [0, -1, 0],
+                   [0, 0, 1], [0, 0, -1]], float) * 50
+    tris = np.array([[0, 2, 4], [2, 1, 4], [1, 3, 4], [3, 0, 4],
+                     [2, 0, 5], [1, 2, 5], [3, 1, 5], [0, 3, 5]])
+    os.makedirs(op.join(subjects_dir, 'octa', 'surf'))
+    for surf in ('inflated', 'white'):
+        nib.freesurfer.write_geometry(
+            op.join(subjects_dir, 'octa', 'surf', 'lh.' + surf), rr, tris)
+    nib.freesurfer.write_morph_data(
+        op.join(subjects_dir, 'octa', 'surf', 'lh.curv'), rr[:, 0] / 50.)
+
+    brain = Brain(*std_args, subjects_dir=subjects_dir)
+    dataset = brain.brains[0]._mesh_dataset
+    n_arrays = dataset.point_data.number_of_arrays
+    brain.add_data(np.linspace(0, 1, 163842), 0, 1)
+    brain.add_label('BA1')
+    brain.add_annotation('aparc')
+    brain.add_morphometry('curv')
+    brain.add_contour_overlay(np.linspace(0, 1, 163842))
+    brain.add_overlay(np.linspace(-1, 1, 163842), name='foo')
+    brain.add_foci([[0, 0, 0]])
+    brain.add_text(0.1, 0.1, 'foo', 'foo')
+    brain.clear()
+    assert dataset.point_data.number_of_arrays == n_arrays
+    for attr in ('data_dict', 'labels_dict', 'foci_dict', 'overlays_dict',
+                 'texts_dict'):
+        assert len([v for v in getattr(brain, attr).values()
+                    if v is not None]) == 0
+    for attr in ('annot_list', 'morphometry_list', 'contour_list'):
+        assert len(getattr(brain, attr)) == 0
+    assert brain.n_times is None
+
+    brain.add_label('BA1')
+    brain.reset('octa')
+    assert brain.subject_id == brain.brains[0].subject_id == 'octa'
+    assert brain.surf == 'inflated'
+    assert dataset.number_of_points == 6
+    assert dataset.number_of_polys == 8
+    assert dataset.point_data.number_of_arrays == n_arrays
+    brain.add_data(np.arange(6.), 0, 5)
+    brain.reset(surf='white')
+    assert brain.surf == 'white'
+    assert len(brain.data_dict['lh'] or ()) == 0
+    brain.reset('fsaverage', 'inflated')
+    assert dataset.number_of_points == 163842
+    brain.add_label('BA1')
+    brain.close()
+
+
+@requires_fsaverage()
+def test_brain_grid(tmpdir):
+    """Test showing many subjects in a grid."""
+    _set_backend()
+    grid = BrainGrid([subject_id] * 3, 'lh', 'inflated', size=(100, 80),
+                     views='med', cortex='low_contrast', offscreen=True)
+    assert len(grid.brains) == 3
+    assert len(grid._figures) == 2 and len(grid._figures[0]) == 2
+    data = [np.linspace(0, 1, 163842), np.linspace(-1, 2, 163842),
+            np.linspace(0, 3, 163842)]
+    grid.add_data(data, thresh=0.5)
+    luts = list()
+    for brain in grid.brains:
+        layer = brain.data_dict['lh']
+        assert (layer['fmin'], layer['fmax']) == (-1, 3)
+        assert (layer['colorbars'][0] is not None) == \
+            (brain is grid.brains[-1])
+        luts.append(layer['surfaces'][0].module_manager.scalar_lut_manager
+                    .lut.table.to_array())
+    assert_array_equal(luts[0], luts[2])
+    grid.add_label('BA1')
+    image = grid.screenshot()
+    panel = grid.brains[0].screenshot()
+    assert image.shape == (2 * panel.shape[0], 2 * panel.shape[1], 3)
+    assert_array_equal(image[panel.shape[0]:, panel.shape[1]:], 0)
+    grid.save_image(str(tmpdir.join('grid.png')))
+    pytest.raises(ValueError, grid.add_data, data[:2])
+    grid.close()
+    pytest.raises(ValueError, BrainGrid, [subject_id], 'split', 'inflated')
+    pytest.raises(ValueError, BrainGrid, [subject_id], 'lh', 'inflated',
+                  views=['lat', 'med'])
+
+
 @requires_fsaverage()
 def test_meg_inverse():
     """Test plotting of MEG inverse solution."""
@@ -338,14 +598,357 @@ def test_meg_inverse():
     brain.close()
 
 
+@requires_fsaverage()
+def test_vector_glyphs():
+    """Test subsampled and thresholded glyphs of vector-valued data."""
+    _set_backend()
+    brain = Brain(*std_args)
+    stc = io.read_stc(pjoin(data_dir, 'meg_source_estimate-lh.stc'))
+    vertices = stc['vertices']
+    data = (brain.geo['lh'].nn[vertices][..., np.newaxis] *
+            stc['data'][:, np.newaxis])
+    magnitude = np.linalg.norm(data, axis=1)
+    thresh = np.median(magnitude)
+    brain.add_data(data, vertices=vertices, smoothing_steps=1,
+                   vector_spacing=10., vector_thresh=thresh)
+    layer = brain.data_dict['lh']
+    glyph_idx = layer['glyph_idx']
+    assert 0 < len(glyph_idx) < len(vertices)
+    glyphs = layer['glyphs'][0]
+    assert_allclose(glyphs.mlab_source.points,
+                    brain.geo['lh'].coords[vertices[glyph_idx]], rtol=1e-6)
+
+    # the glyph arrays are updated in place, keeping the colormap range
+    point_data = glyphs.mlab_source.dataset.point_data
+    l_m = glyphs.parent.vector_lut_manager
+    data_range = np.array(l_m.data_range)
+    for time_idx in (3, 0):
+        brain.set_data_time_index(time_idx)
+        values = magnitude[glyph_idx, time_idx]
+        vectors = data[glyph_idx, :, time_idx]
+        vectors[values < thresh] = 0
+        assert_allclose(point_data.vectors.to_array(), vectors)
+        assert_allclose(point_data.scalars.to_array(), values)
+        assert_allclose(l_m.data_range, data_range)
+    brain.close()
+
+
+@requires_fsaverage()
+def test_append_data(monkeypatch):
+    """Test appending time points to data layers."""
+    _set_backend()
+    brain = Brain(subject_id, 'both', 'inflated')
+    stc = io.read_stc(pjoin(data_dir, 'meg_source_estimate-lh.stc'))
+    vertices, data = stc['vertices'], stc['data']
+    time = stc['tmin'] + stc['tstep'] * np.arange(data.shape[1])
+    vector_data = (brain.geo['rh'].nn[vertices][..., np.newaxis] *
+                   data[:, np.newaxis])
+    brain.add_data(data[:, :2], vertices=vertices, smoothing_steps=1,
+                   time=time[:2], frame_limits=1, hemi='lh')
+    brain.add_data(vector_data[..., :2], vertices=vertices,
+                   smoothing_steps=1, time=time[:2], vector_spacing=10.,
+                   hemi='rh')
+    lh, rh = brain.data_dict['lh'], brain.data_dict['rh']
+    brain.append_data(data[:, 2], hemi='lh')
+    assert brain.n_times == 3
+    assert_allclose(brain._times, time[:3])
+    brain.set_data_time_index(2)  # rh still shows its last time point
+    assert lh['time_idx'] == rh['time_idx'] == 2
+    pytest.raises(ValueError, brain.append_data, vector_data[..., 2:],
+                  time=time[3:], hemi='rh')
+    pytest.raises(ValueError, brain.append_data, data[1:, 3], hemi='lh')
+    for bad_time in (brain._times[2], time[1]):  # not after the last one
+        pytest.raises(ValueError, brain.append_data, data[:, 3],
+                      time=bad_time, hemi='lh')
+    pytest.raises(ValueError, brain.append_data, vector_data[..., 2:],
+                  time=brain._times[2] - [0, 0.001], hemi='rh')  # decreasing
+    brain.append_data(vector_data[..., 2:], hemi='rh')
+    brain.append_data(data[:, 3], time=brain._times[3], hemi='lh')
+    assert brain.n_times == 4
+    assert_array_equal(lh['array'], data)
+    assert lh['frame_limits'].shape == (4, 3)
+    assert_allclose(lh['frame_limits'][:, 2], data.max(axis=0))
+    assert_allclose(rh['magnitude'], np.linalg.norm(vector_data, axis=1))
+    assert_array_equal(rh['glyph_array'], vector_data[rh['glyph_idx']])
+    brain.set_data_time_index(2.5)
+
+    # the data are kept in growing buffers, and time viewers follow
+    monkeypatch.setattr(viz.TimeViewer, 'configure_traits', lambda self: None)
+    viewer = viz.TimeViewer(brain)
+    assert viewer.max_time == 3
+    viewer.current_time = 3
+    for hemi, new in (('lh', data), ('rh', vector_data)):
+        brain.append_data(new, hemi=hemi)
+    assert viewer.max_time == viewer.current_time == 7
+    assert lh['time_idx'] == rh['time_idx'] == 7
+    assert_array_equal(lh['array'], np.concatenate((data, data), axis=1))
+    assert lh['buffers']['array']._buffer.shape == (8, len(vertices))
+    assert_allclose(lh['frame_limits'][:, 2], np.tile(data.max(axis=0), 2))
+    # a hemisphere behind the other one catches up a time point at a time
+    brain.append_data(data[:, :2], hemi='lh')
+    for time_idx in range(2):
+        brain.append_data(vector_data[..., time_idx], hemi='rh')
+    assert brain.n_times == 10
+    assert_allclose(rh['time'], lh['time'])
+    brain.add_data(data[:, 0], vertices=vertices, smoothing_steps=1,
+                   hemi='lh')  # no time axis
+    pytest.raises(ValueError, brain.append_data, data[:, 0], hemi='lh')
+    brain.close()
+
+
+@requires_fsaverage()
+def test_append_data_max_times(monkeypatch):
+    """Test appending time points to layers keeping the last ones."""
+    _set_backend()
+    brain = Brain(subject_id, 'lh', 'inflated')
+    stc = io.read_stc(pjoin(data_dir, 'meg_source_estimate-lh.stc'))
+    vertices, data = stc['vertices'], stc['data']
+    time = stc['tmin'] + stc['tstep'] * np.arange(data.shape[1])
+    pytest.raises(ValueError, brain.add_data, data[:, 0], vertices=vertices,
+                  max_times=2)
+    brain.add_data(data, vertices=vertices, smoothing_steps=1, time=time,
+                   frame_limits=1, max_times=3)
+    lh = brain.data_dict['lh']
+    assert brain.n_times == 3
+    assert_allclose(brain._times, time[1:])
+    assert_array_equal(lh['array'], data[:, 1:])
+    assert_allclose(lh['smoothed'], lh['smooth_mat'] * data[:, 1:])
+    brain.set_data_time_index(1.5)
+    brain.set_data_time_index(2)
+    monkeypatch.setattr(viz.TimeViewer, 'configure_traits', lambda self: None)
+    viewer = viz.TimeViewer(brain)
+    viewer.current_time = 1
+
+    # the time points shown are kept until they are dropped
+    buffer = lh['buffers']['smoothed']._buffer
+    for ii in range(4):
+        brain.append_data(data[:, ii])
+    assert brain.n_times == 3
+    assert_allclose(brain._times, stc['tmin'] + stc['tstep'] * np.arange(5, 8))
+    assert brain.data_time_index == viewer.current_time == 0
+    assert lh['shown'] == 4
+    assert_array_equal(lh['array'], data[:, 1:])
+    assert_allclose(lh['smoothed'], lh['smooth_mat'] * data[:, 1:])
+    assert lh['buffers']['smoothed']._buffer is buffer
+    assert_allclose(lh['frame_limits'][:, 2], data[:, 1:].max(axis=0))
+    viewer.current_time = 2
+    brain.append_data(data[:, :2])
+    assert brain.data_time_index == viewer.current_time == 2
+    assert lh['shown'] == 8
+    brain.set_data_smoothing_steps(2)
+    assert_allclose(lh['smoothed'],
+                    lh['smooth_mat'] * np.concatenate((data[:, 3:],
+                                                       data[:, :2]), axis=1))
+    brain.close()
+
+
+@requires_fsaverage()
+def test_smoothing_on_ingest():
+    """Test smoothing the time points of a layer when they are added."""
+    _set_backend()
+    brain = Brain(subject_id, 'lh', 'inflated')
+    stc = io.read_stc(pjoin(data_dir, 'meg_source_estimate-lh.stc'))
+    vertices, data = stc['vertices'], stc['data']
+    # building the matrix of many steps costs more than smoothing 2 frames
+    brain.add_data(data[:, :2], vertices=vertices, smoothing_steps=20)
+    lh = brain.data_dict['lh']
+    assert not sparse.issparse(lh['smooth_mat'])
+    assert_allclose(lh['smoothed'], lh['smooth_mat'] * data[:, :2])
+    brain.append_data(data[:, 2])
+    assert_allclose(lh['smoothed'], lh['smooth_mat'] * data[:, :3])
+    brain.set_data_time_index(2)
+    assert_allclose(brain._frames[(lh['layer_id'], 2, None)][0],
+                    lh['smoothed'][:, 2])
+    # the frames of a smoothing matrix are smoothed when they are shown
+    brain.set_data_smoothing_steps(1)
+    assert sparse.issparse(lh['smooth_mat'])
+    assert lh['smoothed'] is None
+    brain.set_data_smoothing_steps(20)
+    assert_allclose(lh['smoothed'], lh['smooth_mat'] * data[:, :3])
+    brain.append_data(data[:, 3])
+    assert_allclose(lh['smoothed'], lh['smooth_mat'] * data)
+    brain.close()
+
+
+@requires_fsaverage()
+def test_time_viewer_playback(monkeypatch):
+    """Test prefetching frames and playing the time points."""
+    _set_backend()
+    brain = Brain(subject_id, 'lh', 'inflated')
+    stc = io.read_stc(pjoin(data_dir, 'meg_source_estimate-lh.stc'))
+    vertices, data = stc['vertices'], stc['data']
+    brain.add_data(data, vertices=vertices, smoothing_steps=1)
+    lh = brain.data_dict['lh']
+    layer_id = lh['layer_id']
+
+    # frames are computed in a thread, kept in a bounded LRU cache
+    brain._frames_size = 3
+    brain._prefetch_frames([1, 2, 3, 0, 1.5])
+    deadline = time.time() + 10
+    while (layer_id, 1.5, 'quadratic') not in brain._frames and \
+            time.time() < deadline:
+        time.sleep(0.01)
+    assert list(brain._frames) == [(layer_id, 3, None), (layer_id, 0, None),
+                                   (layer_id, 1.5, 'quadratic')]
+    assert_allclose(brain._frames[(layer_id, 0, None)][0],
+                    lh['smooth_mat'] * data[:, 0])
+    brain.set_data_time_index(0)
+    assert list(brain._frames)[-1] == (layer_id, 0, None)
+    brain.set_data_smoothing_steps(2)  # the cached frames are outdated
+    assert list(brain._frames) == [(layer_id, 0, None)]
+    assert_allclose(brain._frames[(layer_id, 0, None)][0],
+                    lh['smooth_mat'] * data[:, 0])
+
+    # playing drops the time points it cannot keep up with
+    monkeypatch.setattr(viz.TimeViewer, 'configure_traits', lambda self: None)
+    viewer = viz.TimeViewer(brain)
+    now = [100.]
+    monkeypatch.setattr(time, 'time', lambda: now[0])
+    viewer.loop = False
+    viewer.playing = True
+    assert viewer._timer is not None
+    now[0] += 0.25
+    viewer._play_step()
+    assert viewer.current_time == brain.data_time_index == 2
+    assert viewer._next_time_indices() == [3, 1]
+    viewer.current_time = 1  # playing continues from the slider
+    viewer._play_step()
+    assert viewer.current_time == 1
+    now[0] += 1.
+    viewer._play_step()
+    assert viewer.current_time == 3
+    assert not viewer.playing
+    assert viewer._timer is None
+    viewer.loop = True
+    viewer.playing = True
+    assert viewer.current_time == 0
+    now[0] += 0.5
+    viewer._play_step()
+    assert viewer.current_time == 1
+    viewer.playing = False
+    assert viewer._timer is None
+    brain.close()
+    assert brain._prefetcher is None
+
+
+@requires_fsaverage()
+def test_prefetch_append(monkeypatch):
+    """Test prefetching frames while data are appended."""
+    _set_backend()
+    brain = Brain(subject_id, 'lh', 'inflated')
+    stc = io.read_stc(pjoin(data_dir, 'meg_source_estimate-lh.stc'))
+    vertices, data = stc['vertices'], stc['data'][:, :4]
+    brain.add_data(data, vertices=vertices, smoothing_steps=1, max_times=3)
+    lh = brain.data_dict['lh']
+    layer_id = lh['layer_id']
+
+    def wait_for(key):
+        deadline = time.time() + 10
+        while key not in brain._frames and time.time() < deadline:
+            time.sleep(0.01)
+
+    # the rings shift while the request is pending
+    with brain._frames_lock:
+        brain._prefetch_frames([0, 1, 2])
+        time.sleep(0.05)
+        for time_idx in range(4):
+            brain.append_data(data[:, time_idx])
+    wait_for((layer_id, 6, None))
+    for time_idx in range(3):
+        assert_allclose(brain._frames[(layer_id, 4 + time_idx, None)][0],
+                        lh['smooth_mat'] * data[:, 1 + time_idx])
+
+    # a frame that cannot be computed is skipped
+    get_layer_frame = viz._get_layer_frame
+    failed = []
+
+    def fail_once(frame):
+        if not failed:
+            failed.append(frame)
+            raise RuntimeError('the data changed')
+        return get_layer_frame(frame)
+
+    monkeypatch.setattr(viz, '_get_layer_frame', fail_once)
+    brain._invalidate_frames()
+    brain._prefetch_frames([0, 1])
+    wait_for((layer_id, 5, None))
+    assert failed
+    assert list(brain._frames) == [(layer_id, 5, None)]
+    assert brain._prefetcher._thread.is_alive()
+    brain.close()
+
+
+@requires_fsaverage()
+def test_time_viewer_updates(monkeypatch):
+    """Test coalescing time viewer updates."""
+    _set_backend()
+    brain = Brain(subject_id, 'lh', 'inflated')
+    stc = io.read_stc(pjoin(data_dir, 'meg_source_estimate-lh.stc'))
+    vertices, data = stc['vertices'], stc['data']
+    brain.add_data(data, vertices=vertices, smoothing_steps=1)
+    lh = brain.data_dict['lh']
+    smooth_mat = lh['smooth_mat']
+    monkeypatch.setattr(viz.TimeViewer, 'configure_traits', lambda self: None)
+    viewer = viz.TimeViewer(brain)
+
+    # only the last value of each trait is applied
+    for time_idx in (1, 3, 2):
+        viewer.current_time = time_idx
+    for smoothing_steps in (3, 2):
+        viewer.smoothing_steps = smoothing_steps
+    viewer.fmax = 100.
+    assert list(viewer._pending) == ['current_time', 'smoothing_steps',
+                                     'colormap']
+    assert brain.data_time_index == 0
+    assert lh['smoothing_steps'] == 1
+    viewer._flush_updates()
+    assert viewer._update_timer is None
+    assert brain.data_time_index == 2
+    assert lh['smoothing_steps'] == 2
+    assert lh['fmax'] == 100.
+    assert list(lh['smoother']._mats) == [1, 2]
+
+    # smoothing matrices are reused
+    viewer.smoothing_steps = 1
+    viewer._flush_updates()
+    assert lh['smooth_mat'] is smooth_mat
+    assert list(lh['smoother']._mats) == [2, 1]
+    calls = list()
+    monkeypatch.setattr(brain, 'set_data_smoothing_steps', calls.append)
+    viewer.smoothing_steps = -1
+    viewer._flush_updates()
+    assert calls == [None]
+    brain.close()
+
+
 @requires_fsaverage()
 def test_morphometry():
     """Test plotting of morphometry."""
     _set_backend()
     brain = Brain(*std_args)
     brain.add_morphometry("curv")
+    surf = brain.morphometry_list[0]['surface']
     brain.add_morphometry("sulc", grayscale=True)
     brain.add_morphometry("thickness")
+    # the pipeline is reused and shows the new data
+    assert len(brain.morphometry_list) == 1
+    morph = brain.morphometry_list[0]
+    assert morph['surface'] is surf
+    assert morph['measure'] == 'thickness'
+    lut_manager = surf.module_manager.scalar_lut_manager
+    assert lut_manager.lut_mode == 'pink'
+    subject_dir = pjoin(utils._get_subjects_dir(), subject_id)
+    thickness = nib.freesurfer.read_morph_data(
+        pjoin(subject_dir, 'surf', 'lh.thickness'))
+    cortex = utils._read_label_mask(
+        pjoin(subject_dir, 'label', 'lh.cortex.label'), len(thickness))
+    assert_array_equal(brain.brains[0]._mesh_dataset.point_data.get_array(
+        morph['array_id']).to_array(), thickness)
+    assert_array_equal(lut_manager.data_range,
+                       np.percentile(thickness[cortex], [2, 98]))
+    brain.add_morphometry("curv", remove_existing=False)
+    assert len(brain.morphometry_list) == 2
+    assert brain.morphometry_list[1]['surface'] is not surf
     brain.close()
 
 
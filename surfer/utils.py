@@ -1,4 +1,4 @@
-from collections import Sequence
+from collections import OrderedDict, Sequence
 from distutils.version import LooseVersion
 import logging
 import warnings
@@ -6,7 +6,9 @@ import sys
 import os
 from os import path as op
 import inspect
-from functools import wraps
+from functools import partial, wraps
+import threading
+import weakref
 
 import mayavi
 from mayavi import mlab
@@ -79,6 +81,14 @@ class Surface(object):
         If None, do not change coordinates (default).
     units : str
         Can be 'm' or 'mm' (default).
+    tri_area : array, shape (n_faces,)
+        Area of each triangle, computed when the geometry is loaded.
+    vertex_area : array, shape (n_vertices,)
+        Area associated with each vertex, computed on first access.
+    adjacency : sparse matrix, shape (n_vertices, n_vertices)
+        Adjacency matrix of the mesh, computed on first access.
+    dist_graph : sparse matrix, shape (n_vertices, n_vertices)
+        Edge lengths of the mesh, computed on first access.
     """
 
     def __init__(self, subject_id, hemi, surf, subjects_dir=None,
@@ -107,32 +117,39 @@ class Surface(object):
         self.coords = None
         self.faces = None
         self.nn = None
+        self._geometry = None
         self.units = _check_units(units)
+        self._reset_cache()
 
         subjects_dir = _get_subjects_dir(subjects_dir)
         self.data_path = op.join(subjects_dir, subject_id)
 
     def load_geometry(self):
+        """Load the coordinates, faces and normals of the surface.
+
+        The arrays are read-only and shared with all other Surface objects
+        of the same subject, hemisphere, surface, offset and units (see
+        :func:`geometry_cache_info`).
+        """
         surf_path = op.join(self.data_path, "surf",
                             "%s.%s" % (self.hemi, self.surf))
-        coords, faces = nib.freesurfer.read_geometry(surf_path)
-        if self.units == 'm':
-            coords /= 1000.
-        if self.offset is not None:
-            if self.hemi == 'lh':
-                coords[:, 0] -= (np.max(coords[:, 0]) + self.offset)
-            else:
-                coords[:, 0] -= (np.min(coords[:, 0]) + self.offset)
-        nn = _compute_normals(coords, faces)
-
-        if self.coords is None:
-            self.coords = coords
-            self.faces = faces
-            self.nn = nn
-        else:
-            self.coords[:] = coords
-            self.faces[:] = faces
-            self.nn[:] = nn
+        key = (op.dirname(op.abspath(self.data_path)), self.subject_id,
+               self.hemi, self.surf, self.offset, self.units)
+        geometry = _get_geometry(key, surf_path)
+        # rebind (rather than overwrite) the arrays, they may be shared
+        self._geometry = geometry
+        self.coords = geometry.coords
+        self.faces = geometry.faces
+        self.nn = geometry.nn
+        self._reset_cache()
+        self._tri_area = geometry.tri_area
+
+    def _reset_cache(self):
+        """Forget quantities derived from the current geometry."""
+        self._tri_area = None
+        self._vertex_area = None
+        self._dist_graph = None
+        self._adjacency = None
 
     @property
     def x(self):
@@ -146,6 +163,41 @@ class Surface(object):
     def z(self):
         return self.coords[:, 2]
 
+    @property
+    def tri_area(self):
+        """Area of each triangle (in squared units of the surface)."""
+        if self._tri_area is None:
+            _, self._tri_area = _compute_normals(self.coords, self.faces,
+                                                 return_tri_area=True)
+        return self._tri_area
+
+    @property
+    def vertex_area(self):
+        """Area associated with each vertex (in squared units).
+
+        Each vertex is assigned a third of the area of every triangle it
+        belongs to, so that ``vertex_area.sum() == tri_area.sum()``. Use it
+        as weights for reductions over vertices, e.g. area-weighted means.
+        """
+        if self._vertex_area is None:
+            self._vertex_area = _compute_vertex_area(
+                self.faces, self.tri_area, len(self.coords))
+        return self._vertex_area
+
+    @property
+    def adjacency(self):
+        """Sparse vertex adjacency matrix of the mesh in CSR format."""
+        if self._adjacency is None:
+            self._adjacency = mesh_edges(self.faces).tocsr()
+        return self._adjacency
+
+    @property
+    def dist_graph(self):
+        """Sparse graph of the mesh edge lengths (see :func:`mesh_dist`)."""
+        if self._dist_graph is None:
+            self._dist_graph = mesh_dist(self.faces, self.coords)
+        return self._dist_graph
+
     def load_curvature(self):
         """Load in curvature values from the ?h.curv file."""
         curv_path = op.join(self.data_path, "surf", "%s.curv" % self.hemi)
@@ -174,6 +226,149 @@ class Surface(object):
         """Apply an affine transformation matrix to the x,y,z vectors."""
         self.coords = np.dot(np.c_[self.coords, np.ones(len(self.coords))],
                              mtx.T)[:, :3]
+        self._geometry = None  # the coordinates are no longer shared
+        # the transformation may scale the surface
+        self._reset_cache()
+
+
+###############################################################################
+# Geometry shared between Surface objects
+
+_geometry_registry = weakref.WeakValueDictionary()
+_geometry_lock = threading.Lock()
+
+
+class _Geometry(object):
+    """Read-only arrays of a surface file, shared through the registry."""
+
+    def __init__(self, key, coords, faces, nn, tri_area, mtime):
+        self.key = key
+        self.coords = coords
+        self.faces = faces
+        self.nn = nn
+        self.tri_area = tri_area
+        self.mtime = mtime
+        for arr in (coords, faces, nn, tri_area):
+            arr.flags.writeable = False
+
+    @property
+    def nbytes(self):
+        return sum(arr.nbytes for arr in
+                   (self.coords, self.faces, self.nn, self.tri_area))
+
+
+def _get_geometry(key, surf_path):
+    """Get the geometry of a surface file from the registry or load it."""
+    mtime = os.stat(surf_path).st_mtime
+    with _geometry_lock:
+        geometry = _geometry_registry.get(key)
+    if geometry is not None and geometry.mtime == mtime:
+        return geometry
+    _, _, hemi, _, offset, units = key
+    coords, faces = nib.freesurfer.read_geometry(surf_path)
+    if units == 'm':
+        coords /= 1000.
+    if offset is not None:
+        if hemi == 'lh':
+            coords[:, 0] -= (np.max(coords[:, 0]) + offset)
+        else:
+            coords[:, 0] -= (np.min(coords[:, 0]) + offset)
+    nn, tri_area = _compute_normals(coords, faces, return_tri_area=True)
+    geometry = _Geometry(key, coords, faces, nn, tri_area, mtime)
+    with _geometry_lock:
+        _geometry_registry[key] = geometry
+    return geometry
+
+
+def geometry_cache_info():
+    """Get the surfaces that are currently shared between Surface objects.
+
+    Surface geometries are kept in memory as long as a
+    :class:`~surfer.Surface` (e.g., of a :class:`~surfer.Brain`) uses them,
+    and loading the same surface again reuses the same read-only arrays.
+
+    Returns
+    -------
+    info : list of dict
+        For each surface, the ``subjects_dir``, ``subject_id``, ``hemi``,
+        ``surf``, ``offset`` and ``units`` it was loaded with, and
+        ``nbytes``, the memory used by its coordinates, faces, normals and
+        triangle areas.
+    """
+    with _geometry_lock:
+        geometries = list(_geometry_registry.values())
+    info = list()
+    for geometry in geometries:
+        entry = dict(zip(('subjects_dir', 'subject_id', 'hemi', 'surf',
+                          'offset', 'units'), geometry.key))
+        entry['nbytes'] = geometry.nbytes
+        info.append(entry)
+    return info
+
+
+def clear_geometry_cache(subject_id=None, subjects_dir=None):
+    """Stop sharing the geometry of surfaces that were loaded before.
+
+    Surfaces that are loaded afterwards are read from disk again. Surface
+    objects that already use a geometry keep their arrays.
+
+    Parameters
+    ----------
+    subject_id : str | None
+        Only forget the surfaces of this subject (default: all subjects).
+    subjects_dir : str | None
+        Only forget the surfaces of this subjects directory (default: all).
+
+    Returns
+    -------
+    n_cleared : int
+        The number of surfaces that were forgotten.
+    """
+    if subjects_dir is not None:
+        subjects_dir = op.abspath(subjects_dir)
+    with _geometry_lock:
+        keys = [key for key in list(_geometry_registry.keys())
+                if subjects_dir in (None, key[0]) and
+                subject_id in (None, key[1])]
+        for key in keys:
+            _geometry_registry.pop(key, None)
+    return len(keys)
+
+
+_file_cache = OrderedDict()
+_file_cache_size = 32
+_file_cache_lock = threading.Lock()
+
+
+def _read_cached(read_func, fname, *args):
+    """Read a file with ``read_func(fname, *args)`` unless it was read before.
+
+    The results of the last reads are kept until the file changes on disk.
+    They are shared by all callers, so arrays are made read-only.
+    """
+    fname = op.abspath(fname)
+    key = (read_func, fname) + args
+    mtime = os.stat(fname).st_mtime
+    with _file_cache_lock:
+        entry = _file_cache.pop(key, None)
+        if entry is not None and entry[0] == mtime:
+            _file_cache[key] = entry  # most recently used
+            return entry[1]
+    data = read_func(fname, *args)
+    if isinstance(data, np.ndarray):
+        data.flags.writeable = False
+    with _file_cache_lock:
+        _file_cache[key] = (mtime, data)
+        while len(_file_cache) > _file_cache_size:
+            _file_cache.popitem(last=False)
+    return data
+
+
+def _read_label_mask(fname, n_vertices):
+    """Read a label file as a boolean mask of the surface vertices."""
+    mask = np.zeros(n_vertices, bool)
+    mask[nib.freesurfer.read_label(fname)] = True
+    return mask
 
 
 def _fast_cross_3d(x, y):
@@ -213,8 +408,12 @@ def _fast_cross_3d(x, y):
         return np.cross(x, y)
 
 
-def _compute_normals(rr, tris):
-    """Efficiently compute vertex normals for triangulated surface"""
+def _compute_normals(rr, tris, return_tri_area=False):
+    """Efficiently compute vertex normals for triangulated surface
+
+    If ``return_tri_area`` is True, the triangle areas (which are obtained
+    from the same cross products) are returned as well.
+    """
     # first, compute triangle normals
     r1 = rr[tris[:, 0], :]
     r2 = rr[tris[:, 1], :]
@@ -223,6 +422,8 @@ def _compute_normals(rr, tris):
 
     #   Triangle normals and areas
     size = np.sqrt(np.sum(tri_nn * tri_nn, axis=1))
+    if return_tri_area:
+        tri_area = size / 2.
     zidx = np.where(size == 0)[0]
     size[zidx] = 1.0  # prevent ugly divide-by-zero
     tri_nn /= size[:, np.newaxis]
@@ -241,9 +442,20 @@ def _compute_normals(rr, tris):
     size = np.sqrt(np.sum(nn * nn, axis=1))
     size[size == 0] = 1.0  # prevent ugly divide-by-zero
     nn /= size[:, np.newaxis]
+    if return_tri_area:
+        return nn, tri_area
     return nn
 
 
+def _compute_vertex_area(tris, tri_area, npts):
+    """Distribute triangle areas equally onto their three vertices"""
+    vertex_area = np.zeros(npts)
+    for verts in tris.T:  # note this only loops 3x (number of verts per tri)
+        vertex_area += np.bincount(verts, tri_area, minlength=npts)
+    vertex_area /= 3.
+    return vertex_area
+
+
 ###############################################################################
 # LOGGING (courtesy of mne-python)
 
@@ -485,6 +697,308 @@ def mesh_edges(faces):
     return edges
 
 
+def mesh_dist(faces, coords):
+    """Compute a sparse graph of the mesh edge lengths
+
+    Parameters
+    ----------
+    faces : array of shape [n_triangles x 3]
+        The mesh faces
+    coords : array of shape [n_vertices x 3]
+        The mesh vertex coordinates
+
+    Returns
+    -------
+    dist : sparse matrix in CSR format
+        The Euclidean length of each mesh edge, with the adjacency structure
+        of :func:`mesh_edges`.
+    """
+    edges = mesh_edges(faces).tocoo()
+    dist = np.sqrt(np.sum((coords[edges.row] - coords[edges.col]) ** 2,
+                          axis=1))
+    dist = sparse.csr_matrix((dist, (edges.row, edges.col)),
+                             shape=edges.shape)
+    return dist
+
+
+def geodesic_distance(dist_graph, vertices, max_dist=np.inf):
+    """Compute the geodesic distance to the closest of a set of vertices
+
+    Distances are computed along the mesh edges with a single multi-source
+    Dijkstra search, which stops expanding once ``max_dist`` is exceeded.
+
+    Parameters
+    ----------
+    dist_graph : sparse matrix
+        The mesh edge lengths (see :func:`mesh_dist`).
+    vertices : int | array of int
+        The source vertices.
+    max_dist : float
+        Distance beyond which the search is stopped (default: no limit).
+
+    Returns
+    -------
+    dist : array of shape [n_vertices]
+        The distance of each vertex to the closest source vertex. Vertices
+        further away than ``max_dist`` have a distance of ``np.inf``.
+    """
+    from scipy.sparse import csgraph
+    vertices = np.unique(np.atleast_1d(vertices).astype(int))
+    try:
+        dist = csgraph.dijkstra(dist_graph, directed=False, indices=vertices,
+                                limit=max_dist, min_only=True)
+    except TypeError:  # scipy < 1.3 has no min_only
+        dist = csgraph.dijkstra(dist_graph, directed=False, indices=vertices,
+                                limit=max_dist)
+        dist = dist.min(axis=0)
+    return dist
+
+
+# the number of distances computed at once by geodesic_disks (64 MB)
+_geodesic_chunk_size = 2 ** 23
+
+
+def geodesic_disks(dist_graph, vertices, radius):
+    """Find the vertices within a geodesic radius of each of several seeds
+
+    Parameters
+    ----------
+    dist_graph : sparse matrix
+        The mesh edge lengths (see :func:`mesh_dist`).
+    vertices : int | array of int
+        The seed vertices (one disk is returned for each).
+    radius : float
+        The radius of the disks, in the units of the mesh coordinates.
+
+    Returns
+    -------
+    disks : list of array of int
+        For each seed, the sorted indices of the vertices inside the disk.
+    dists : list of array
+        For each seed, the geodesic distance of these vertices to the seed.
+    """
+    from scipy.sparse import csgraph
+    vertices = np.atleast_1d(vertices).astype(int)
+    if vertices.size == 0:
+        return [], []
+    # one search per seed, stopped at the radius; dijkstra returns dense
+    # (n_seeds, n_vertices) distances, so the seeds are done in chunks
+    n_chunk = max(_geodesic_chunk_size // dist_graph.shape[0], 1)
+    disks, dists = list(), list()
+    for start in range(0, len(vertices), n_chunk):
+        dist = csgraph.dijkstra(dist_graph, directed=False,
+                                indices=vertices[start:start + n_chunk],
+                                limit=radius)
+        for d in dist:
+            disks.append(np.where(d <= radius)[0])
+            dists.append(d[disks[-1]])
+    return disks, dists
+
+
+def decimate_surface(coords, faces, n_vertices):
+    """Decimate a triangulated surface by vertex clustering
+
+    The surface is divided into cubic cells sized such that each cell covers
+    about ``area / n_vertices`` of the surface. The vertices in a cell are
+    merged into the one closest to their centroid, so the decimated mesh
+    uses a subset of the original vertices and data defined on the original
+    mesh can be shown on it by indexing.
+
+    Parameters
+    ----------
+    coords : array, shape (n_vertices, 3)
+        The vertex coordinates.
+    faces : array, shape (n_faces, 3)
+        The triangles.
+    n_vertices : int
+        The (approximate) number of vertices to keep.
+
+    Returns
+    -------
+    vertices : array of int
+        The indices of the vertices that are kept.
+    faces : array, shape (n_decimated_faces, 3)
+        The decimated triangles, indexing into ``vertices``.
+    """
+    coords = np.asarray(coords, float)
+    faces = np.asarray(faces)
+    if n_vertices >= len(coords):
+        return np.arange(len(coords)), faces.copy()
+    tri_area = _compute_normals(coords, faces, return_tri_area=True)[1]
+    size = np.sqrt(tri_area.sum() / n_vertices)
+    vertices, labels = _cluster_points(coords, size)
+
+    # drop collapsed and duplicate triangles
+    faces = labels[faces]
+    faces = faces[(faces[:, 0] != faces[:, 1]) & (faces[:, 1] != faces[:, 2]) &
+                  (faces[:, 0] != faces[:, 2])]
+    n_lab = np.int64(len(vertices))
+    sorted_faces = np.sort(faces, axis=1).astype(np.int64)
+    keys = (sorted_faces[:, 0] * n_lab + sorted_faces[:, 1]) * n_lab + \
+        sorted_faces[:, 2]
+    faces = faces[np.sort(np.unique(keys, return_index=True)[1])]
+    return vertices, faces
+
+
+def _cluster_points(coords, size):
+    """Cluster points in cubic cells, keeping the one closest to the centroid
+
+    Returns the indices of the kept points (one per cell) and, for each
+    point, the index of its cell in the former.
+    """
+    coords = np.asarray(coords, float)
+    cells = np.floor((coords - coords.min(0)) / size).astype(np.int64)
+    n_cells = cells.max(0) + 1
+    cells = (cells[:, 0] * n_cells[1] + cells[:, 1]) * n_cells[2] + cells[:, 2]
+    _, labels = np.unique(cells, return_inverse=True)
+    counts = np.bincount(labels)
+    centroids = np.array([np.bincount(labels, cc) for cc in coords.T]).T
+    centroids /= counts[:, np.newaxis]
+    dist = np.sum((coords - centroids[labels]) ** 2, axis=1)
+    order = np.lexsort((dist, labels))
+    return order[np.r_[0, np.cumsum(counts)[:-1]]], labels
+
+
+def chunked_percentile(data, q, transform=None, max_exact=2 ** 21,
+                       chunk_size=2 ** 20, n_bins=2 ** 16):
+    """Compute percentiles of large arrays with bounded memory.
+
+    Small inputs use :func:`numpy.percentile` (which partially sorts the
+    data). Larger inputs, e.g. memory-mapped ``(n_vertices, n_times)``
+    data, are read in chunks: a first pass gets the range of the values,
+    a second one their histogram, and a third one collects the values of
+    the histogram bins that contain the requested order statistics. A bin
+    that holds more than ``chunk_size`` values (e.g. when a few outliers
+    widen the range) is split by a histogram of its own in the next pass
+    instead, until its values fit in a chunk. The result is exact.
+
+    Parameters
+    ----------
+    data : array
+        The data (of any shape, all values are used).
+    q : float | array of float
+        Percentile(s) to compute, between 0 and 100.
+    transform : callable | None
+        If not None, a function applied to each (flattened) chunk of the
+        data, returning the 1D array of values to use, e.g. to only use
+        positive values or absolute values.
+    max_exact : int
+        Inputs with more elements use the chunked algorithm.
+    chunk_size : int
+        The number of elements read at once.
+    n_bins : int
+        The number of histogram bins.
+
+    Returns
+    -------
+    percentile : float | array of float
+        The percentiles, using linear interpolation like
+        :func:`numpy.percentile`.
+    """
+    data = np.asarray(data).reshape(-1)
+    q = np.asarray(q, float)
+    if np.any(q < 0) or np.any(q > 100):
+        raise ValueError('Percentiles must be in the range [0, 100]')
+    if data.size <= max_exact:
+        values = data if transform is None else transform(data)
+        if values.size == 0:
+            raise ValueError('Cannot compute percentiles of empty data')
+        return np.percentile(values, q)
+
+    def _chunks():
+        for start in range(0, data.size, chunk_size):
+            chunk = np.asarray(data[start:start + chunk_size])
+            yield chunk if transform is None else transform(chunk)
+
+    def _in_range(values, key):  # [lo, hi), or [lo, hi] if closed
+        lo, hi, closed = key
+        mask = (values >= lo) & ((values < hi) | (closed & (values == hi)))
+        return values[mask]
+
+    def _bin(values, edges):  # the bins of _in_range, [lo, hi] for the last
+        n = len(edges) - 1
+        if edges[-1] == edges[0]:
+            return np.zeros(len(values), np.int64)
+        bins = ((values - edges[0]) * (n / (edges[-1] - edges[0])))
+        bins = np.clip(bins.astype(np.int64), 0, n - 1)
+        # the rounding of the scaling can miss the edges
+        wrong = (values < edges[bins]) | \
+            ((values >= edges[bins + 1]) & (bins < n - 1))
+        if wrong.any():
+            bins[wrong] = np.minimum(np.searchsorted(
+                edges, values[wrong], 'right') - 1, n - 1)
+        return bins
+
+    # First pass: number of values and their range
+    n_values, lo, hi = 0, np.inf, -np.inf
+    for chunk in _chunks():
+        if chunk.size > 0:
+            n_values += chunk.size
+            lo, hi = min(lo, chunk.min()), max(hi, chunk.max())
+    if n_values == 0:
+        raise ValueError('Cannot compute percentiles of empty data')
+    positions = (n_values - 1) * q / 100.
+    ranks = np.unique(np.r_[np.floor(positions), np.ceil(positions)]
+                      .astype(np.int64))
+    if lo == hi:
+        return np.full(q.shape, lo)[()]
+
+    # Then histograms of the values in ranges that contain order statistics
+    # (the whole range first), refined with a histogram of the bin of an
+    # order statistic until the values of the bin fit in a chunk, so that
+    # they can be collected in the same pass as the next histograms
+    order_stats = dict()
+    ranges = {(lo, hi, True): dict((rank, rank) for rank in ranks)}
+    collect = dict()
+    while ranges or collect:
+        edges = dict((key, np.linspace(key[0], key[1], n_bins + 1))
+                     for key in ranges)
+        counts = dict((key, np.zeros(n_bins, np.int64)) for key in ranges)
+        extrema = dict((key, [np.inf, -np.inf]) for key in ranges)
+        bin_values = dict((key, []) for key in collect)
+        for chunk in _chunks():
+            for key in ranges:
+                values = _in_range(chunk, key)
+                if values.size > 0:
+                    counts[key] += np.bincount(_bin(values, edges[key]),
+                                               minlength=n_bins)
+                    extrema[key] = [min(extrema[key][0], values.min()),
+                                    max(extrema[key][1], values.max())]
+            for key in collect:
+                bin_values[key].append(_in_range(chunk, key))
+        for key, offsets in collect.items():
+            values = np.partition(np.concatenate(bin_values[key]),
+                                  sorted(set(offsets.values())))
+            for rank, offset in offsets.items():
+                order_stats[rank] = values[offset]
+        next_ranges, collect = dict(), dict()
+        for key, offsets in ranges.items():
+            if extrema[key][0] == extrema[key][1]:  # equal values
+                for rank in offsets:
+                    order_stats[rank] = extrema[key][0]
+                continue
+            n_cum = np.cumsum(counts[key])
+            for rank, offset in offsets.items():
+                b = np.searchsorted(n_cum, offset, 'right')
+                sub_key = (edges[key][b], edges[key][b + 1],
+                           key[2] and b == n_bins - 1)
+                target = collect if counts[key][b] <= chunk_size \
+                    else next_ranges
+                target.setdefault(sub_key, dict())[rank] = \
+                    offset - (n_cum[b] - counts[key][b])
+        ranges = next_ranges
+    lower = np.array([order_stats[r] for r in
+                      np.floor(positions).astype(np.int64).ravel()])
+    upper = np.array([order_stats[r] for r in
+                      np.ceil(positions).astype(np.int64).ravel()])
+    weight = (positions - np.floor(positions)).ravel()
+    out = lower + (upper - lower) * weight
+    return out.reshape(q.shape)[()]
+
+
+_color_lut_cache = dict()
+
+
 def create_color_lut(cmap, n_colors=256, center=None):
     """Return a colormap suitable for setting as a Mayavi LUT.
 
@@ -529,14 +1043,21 @@ def create_color_lut(cmap, n_colors=256, center=None):
         else:
             cmap = "icefire"
 
-    surfer_cmaps = ["rocket", "mako", "icefire", "vlag"]
-    surfer_cmaps += [name + "_r" for name in surfer_cmaps]
+    # LUTs of named colormaps do not change, so only compute them once
+    key = (cmap, int(n_colors)) if isinstance(cmap, string_types) else None
+    if key in _color_lut_cache:
+        return _color_lut_cache[key].copy()
 
     if not isinstance(cmap, string_types) and isinstance(cmap, Sequence):
         colors = list(map(mpl.colors.colorConverter.to_rgba, cmap))
         cmap = mpl.colors.ListedColormap(colors)
-    elif cmap in surfer_cmaps:
-        cmap = getattr(surfer_cm, cmap)
+    elif cmap in surfer_cm.cmap_names:
+        # Sample the table like matplotlib.colors.ListedColormap would
+        table = surfer_cm.get_lut(cmap)
+        idx = (np.linspace(0, 1, n_colors) * len(table)).astype(int)
+        idx = np.minimum(idx, len(table) - 1)
+        table = np.c_[table[idx], np.ones(len(idx))]
+        cmap = None
     else:
         try:
             # Try to get a named matplotlib colormap
@@ -548,8 +1069,13 @@ def create_color_lut(cmap, n_colors=256, center=None):
             raise ValueError("Input %r was not valid for making a lut" % cmap)
 
     # Convert from a matplotlib colormap to a lut array
-    lut = (cmap(np.linspace(0, 1, n_colors)) * 255).astype(np.int)
+    if cmap is not None:
+        table = cmap(np.linspace(0, 1, n_colors))
+    lut = (table * 255).astype(np.int)
 
+    if key is not None:
+        _color_lut_cache[key] = lut
+        lut = lut.copy()
     return lut
 
 
@@ -579,69 +1105,237 @@ def smoothing_matrix(vertices, adj_mat, smoothing_steps=20, verbose=None):
     smooth_mat : sparse matrix
         smoothing matrix with size N x len(vertices)
     """
-    from scipy import sparse
-
-    logger.info("Updating smoothing matrix, be patient..")
-
-    e = adj_mat.copy()
-    e.data[e.data == 2] = 1
-    n_vertices = e.shape[0]
-    e = e + sparse.eye(n_vertices, n_vertices)
-    idx_use = vertices
-    smooth_mat = 1.0
-    n_iter = smoothing_steps if smoothing_steps is not None else 1000
-    for k in range(n_iter):
-        e_use = e[:, idx_use]
+    return _SmoothingOperator(vertices, adj_mat).matrix(smoothing_steps)
+
+
+# the costs of smoothing estimated by _SmoothingOperator.operator: on a
+# triangle mesh, a vertex has about this many neighbors, so that ring k
+# around it has 6 k vertices and the data of a vertex spread over the
+# 1 + 3 k (k + 1) vertices of k rings (a hexagonal number) after k steps
+_mesh_neighbors = 6
+# multiplying a factor with a product costs about one operation for each
+# neighbor and the vertex itself per non-zero of the result
+_product_cost_per_nnz = _mesh_neighbors + 1
+# smoothing matrices with more (estimated) non-zeros are never built by
+# operator (512 MB in COO format)
+_max_smoothing_nnz = 2 ** 25
+
+
+class _SmoothingOperator(object):
+    """Smoothing matrices of a set of vertices for any number of steps.
+
+    Each smoothing step multiplies the data by a normalized adjacency
+    matrix, the factor of the step (see :func:`smoothing_matrix`). The
+    factors are computed once: they only differ until the smoothed data
+    fill the mesh, and then the last one repeats.
+
+    The smoothing matrix, i.e. the product of the factors, is extended
+    from the kept matrix with the closest smaller number of steps instead
+    of being built from scratch, and the matrices of the last ``n_keep``
+    step counts used are kept. As the product fills in quickly with the
+    number of steps, :meth:`operator` can instead apply the factors one
+    after the other to the data (:meth:`apply`).
+    """
 
-        data1 = e_use * np.ones(len(idx_use))
-        idx_use = np.where(data1)[0]
-        scale_mat = sparse.dia_matrix((1 / data1[idx_use], 0),
-                                      shape=(len(idx_use), len(idx_use)))
+    def __init__(self, vertices, adj_mat, n_keep=4):
+        from scipy import sparse
+        e = adj_mat.copy()
+        e.data[e.data == 2] = 1
+        n_vertices = e.shape[0]
+        self._e = e + sparse.eye(n_vertices, n_vertices)
+        self.vertices = vertices
+        self.n_keep = n_keep
+        self._mats = OrderedDict()  # steps -> (vertices used, matrix)
+        self._idx = [np.asarray(vertices)]  # vertices used after each step
+        self._factors = list()
+        self._lock = threading.Lock()
 
-        smooth_mat = scale_mat * e_use[idx_use, :] * smooth_mat
+    @property
+    def shape(self):
+        return (self._e.shape[0], len(self.vertices))
+
+    def _factor(self, step):
+        """Get the vertices used after a step (from 0) and its factor"""
+        from scipy import sparse
+        with self._lock:  # data may be smoothed in a thread
+            while len(self._factors) <= step:
+                if len(self._factors) > 0 and \
+                        len(self._idx[-2]) >= self.shape[0]:
+                    # the mesh is filled
+                    return self._idx[-1], self._factors[-1]
+                idx_use = self._idx[-1]
+                e_use = self._e[:, idx_use]
+
+                data1 = e_use * np.ones(len(idx_use))
+                idx_use = np.where(data1)[0]
+                scale_mat = sparse.dia_matrix(
+                    (1 / data1[idx_use], 0),
+                    shape=(len(idx_use), len(idx_use)))
+                self._factors.append(scale_mat * e_use[idx_use, :])
+                self._idx.append(idx_use)
+            return self._idx[step + 1], self._factors[step]
+
+    def _n_steps(self, smoothing_steps):
+        """Get the number of steps, the steps to fill the mesh for None"""
+        if smoothing_steps is not None:
+            return smoothing_steps
+        for step in range(1000):
+            if len(self._factor(step)[0]) >= self.shape[0]:
+                break
+        return step + 1
+
+    def matrix(self, smoothing_steps=20):
+        """Get the smoothing matrix of a number of steps.
 
-        logger.info("Smoothing matrix creation, step %d" % (k + 1))
-        if smoothing_steps is None and len(idx_use) >= n_vertices:
-            break
+        Parameters
+        ----------
+        smoothing_steps : int or None
+            number of smoothing steps, None to smooth until the whole mesh
+            is filled (see :func:`smoothing_matrix`)
+
+        Returns
+        -------
+        smooth_mat : sparse matrix
+            smoothing matrix with size N x len(vertices), in COO format
+        """
+        from scipy import sparse
+        entry = self._mats.pop(smoothing_steps, None)
+        if entry is None:
+            logger.info("Updating smoothing matrix, be patient..")
+            start, smooth_mat = 0, 1.0
+            done = [steps for steps in self._mats
+                    if steps is not None and smoothing_steps is not None and
+                    steps < smoothing_steps]
+            if done:
+                start = max(done)
+                idx_use, smooth_mat = self._mats[start]
+                smooth_mat = smooth_mat.tocsr()[idx_use]
+            for step in range(start, self._n_steps(smoothing_steps)):
+                idx_use, factor = self._factor(step)
+                smooth_mat = factor * smooth_mat
+                logger.info("Smoothing matrix creation, step %d" % (step + 1))
+
+            # Make sure the smoothing matrix has the right number of rows
+            # and is in COO format
+            smooth_mat = smooth_mat.tocoo()
+            smooth_mat = sparse.coo_matrix((smooth_mat.data,
+                                            (idx_use[smooth_mat.row],
+                                             smooth_mat.col)),
+                                           shape=self.shape)
+            entry = (idx_use, smooth_mat)
+        self._mats[smoothing_steps] = entry  # most recently used
+        while len(self._mats) > self.n_keep:
+            self._mats.popitem(last=False)
+        return entry[1]
+
+    def apply(self, data, smoothing_steps=20):
+        """Smooth data by applying the factors of the steps one by one.
 
-    # Make sure the smoothing matrix has the right number of rows
-    # and is in COO format
-    smooth_mat = smooth_mat.tocoo()
-    smooth_mat = sparse.coo_matrix((smooth_mat.data,
-                                    (idx_use[smooth_mat.row],
-                                     smooth_mat.col)),
-                                   shape=(n_vertices,
-                                          len(vertices)))
+        Parameters
+        ----------
+        data : array, shape (len(vertices),) or (len(vertices), n)
+            The data of the vertices.
+        smoothing_steps : int or None
+            number of smoothing steps, see :meth:`matrix`
+
+        Returns
+        -------
+        smoothed : array, shape (N,) or (N, n)
+            The smoothed data of the whole mesh, equal to
+            ``smoother.matrix(smoothing_steps) * data``.
+        """
+        smoothed = np.asarray(data)
+        for step in range(self._n_steps(smoothing_steps)):
+            idx_use, factor = self._factor(step)
+            smoothed = factor * smoothed
+        out = np.zeros(self.shape[:1] + smoothed.shape[1:], smoothed.dtype)
+        out[idx_use] = smoothed
+        return out
+
+    def operator(self, smoothing_steps=20, n_frames=1):
+        """Get the cheapest way to smooth a number of frames.
+
+        The smoothing matrix costs building the product of the factors,
+        estimated from the number of vertices reached in each step, after
+        which each frame costs the non-zeros of the product. Applying the
+        factors costs their non-zeros for each frame.
 
-    return smooth_mat
+        Parameters
+        ----------
+        smoothing_steps : int or None
+            number of smoothing steps, see :meth:`matrix`
+        n_frames : int
+            The number of frames (data vectors) expected to be smoothed.
+
+        Returns
+        -------
+        smooth_mat : sparse matrix | LinearOperator
+            The smoothing matrix, or an operator that applies the factors
+            (see :meth:`apply`). Both smooth data with ``smooth_mat * data``.
+        """
+        from scipy.sparse.linalg import LinearOperator
+        if smoothing_steps in self._mats:
+            return self.matrix(smoothing_steps)
+        n_steps = self._n_steps(smoothing_steps)
+        apply_nnz = build_nnz = 0
+        for step in range(n_steps):
+            idx_use, factor = self._factor(step)
+            apply_nnz += factor.nnz
+            if step == 0:  # the product is the factor
+                product_nnz = factor.nnz
+                continue
+            n_rings = step + 1  # reached from each vertex, see _mesh_neighbors
+            product_nnz = min(len(self.vertices) *
+                              (1 + _mesh_neighbors // 2 *
+                               n_rings * (n_rings + 1)),
+                              len(idx_use) * len(self.vertices))
+            build_nnz += _product_cost_per_nnz * product_nnz
+        if product_nnz <= _max_smoothing_nnz and \
+                build_nnz + n_frames * product_nnz <= n_frames * apply_nnz:
+            return self.matrix(smoothing_steps)
+        apply = partial(self.apply, smoothing_steps=smoothing_steps)
+        return LinearOperator(self.shape, matvec=apply, matmat=apply,
+                              dtype=np.float64)
 
 
 @verbose
 def coord_to_label(subject_id, coord, label, hemi='lh', n_steps=30,
                    map_surface='white', coord_as_vert=False, units='mm',
-                   verbose=None):
+                   radius_mm=None, verbose=None):
     """Create label from MNI coordinate
 
     Parameters
     ----------
     subject_id : string
         Use if file is in register with subject's orig.mgz
-    coord : numpy array of size 3 | int
-        One coordinate in MNI space or the vertex index.
-    label : str
-        Label name
+    coord : numpy array of size 3 or n x 3 | int | array of int
+        One or several coordinates in MNI space or vertex indices.
+        One label is created for each coordinate.
+    label : str | list of str | None
+        Label name. If several coordinates are given, this can be a list
+        with one name per coordinate; a single name is then suffixed with
+        the coordinate index. If None, no label file is written.
     hemi : [lh, rh]
         Hemisphere target
     n_steps : int
-        Number of dilation iterations
+        Number of dilation iterations (ignored if ``radius_mm`` is given)
     map_surface : str
         The surface name used to find the closest point
     coord_as_vert : bool
         whether the coords parameter should be interpreted as vertex ids
     units : str
         Can be 'm' or 'mm' (default).
+    radius_mm : float | None
+        If not None, the label is the disk of vertices whose geodesic
+        distance (along ``map_surface``) to the closest vertex is at most
+        ``radius_mm`` millimeters, instead of ``n_steps`` dilations.
     verbose : bool, str, int, or None
         If not None, override default verbose level (see surfer.verbose).
+
+    Returns
+    -------
+    vertices : list of array of int
+        The vertices of the label created for each coordinate.
     """
     geo = Surface(subject_id, hemi, map_surface, units=units)
     geo.load_geometry()
@@ -651,26 +1345,185 @@ def coord_to_label(subject_id, coord, label, hemi='lh', n_steps=30,
     if geo.units == 'm':
         coords = coords * 1000
     if coord_as_vert:
-        coord = coords[coord]
-
-    n_vertices = len(coords)
-    adj_mat = mesh_edges(geo.faces)
-    foci_vtxs = find_closest_vertices(coords, [coord])
-    data = np.zeros(n_vertices)
-    data[foci_vtxs] = 1.
-    smooth_mat = smoothing_matrix(np.arange(n_vertices), adj_mat, 1)
+        coord = coords[np.atleast_1d(coord)]
+    coord = np.atleast_2d(coord)
+
+    if label is None or isinstance(label, string_types):
+        if len(coord) == 1 or label is None:
+            names = [label] * len(coord)
+        else:
+            names = ['%s_%d' % (label, ii) for ii in range(len(coord))]
+    else:
+        names = list(label)
+        if len(names) != len(coord):
+            raise ValueError('Got %d label names for %d coordinates'
+                             % (len(names), len(coord)))
+
+    foci_vtxs = find_closest_vertices(coords, coord)
+    if radius_mm is not None:
+        radius = radius_mm / 1000. if geo.units == 'm' else radius_mm
+        label_vtxs = geodesic_disks(geo.dist_graph, foci_vtxs, radius)[0]
+    else:
+        label_vtxs = [_dilate_vertices(geo.adjacency, vtx, n_steps)
+                      for vtx in foci_vtxs]
+
+    # Write labels
+    for name, this_coord, idx in zip(names, coord, label_vtxs):
+        if name is None:
+            continue
+        label_fname = name + '-' + hemi + '.label'
+        logger.info("Saving label : %s" % label_fname)
+        _write_label(label_fname, idx, coords[idx],
+                     'label at %s from subject %s' % (this_coord, subject_id))
+    return label_vtxs
+
+
+def _dilate_vertices(adjacency, vertices, n_steps):
+    """Grow a set of vertices by n_steps neighborhoods (breadth-first)"""
+    in_label = np.zeros(adjacency.shape[0], bool)
+    in_label[vertices] = True
+    frontier = np.atleast_1d(vertices)
     for _ in range(n_steps):
-        data = smooth_mat * data
-    idx = np.where(data.ravel() > 0)[0]
-    # Write label
-    label_fname = label + '-' + hemi + '.label'
-    logger.info("Saving label : %s" % label_fname)
-    f = open(label_fname, 'w')
-    f.write('#label at %s from subject %s\n' % (coord, subject_id))
-    f.write('%d\n' % len(idx))
-    for i in idx:
-        x, y, z = coords[i]
-        f.write('%d  %f  %f  %f 0.000000\n' % (i, x, y, z))
+        neighbors = adjacency[frontier].indices
+        frontier = np.unique(neighbors[~in_label[neighbors]])
+        if frontier.size == 0:
+            break
+        in_label[frontier] = True
+    return np.where(in_label)[0]
+
+
+def _write_label(fname, vertices, coords, comment):
+    """Write a FreeSurfer label file (with zero values)"""
+    with open(fname, 'w') as fid:
+        fid.write('#%s\n' % comment)
+        fid.write('%d\n' % len(vertices))
+        np.savetxt(fid, np.c_[vertices, coords, np.zeros(len(vertices))],
+                   fmt='%d  %f  %f  %f %f')
+
+
+def _thread_map(func, items, n_jobs=None):
+    """Apply a function to each item with a pool of threads.
+
+    This is meant for reading files: nibabel and numpy release the GIL
+    for most of the I/O and decoding work. Results are returned in the
+    order of ``items``, and the first exception is re-raised. If
+    ``n_jobs`` is None, up to 4 threads are used depending on the number
+    of CPUs.
+    """
+    items = list(items)
+    if n_jobs is None:
+        from multiprocessing import cpu_count
+        n_jobs = min(4, cpu_count())
+    n_jobs = min(int(n_jobs), len(items))
+    if n_jobs <= 1:
+        return [func(item) for item in items]
+    from multiprocessing.pool import ThreadPool
+    pool = ThreadPool(n_jobs)
+    try:
+        return pool.map(func, items, chunksize=1)
+    finally:
+        pool.close()
+        pool.join()
+
+
+class _GrowableArray(object):
+    """An array that grows along its last axis by amortized doubling.
+
+    The data are kept in a buffer with room for more time points, which is
+    reallocated with twice the size when it is full, so that appending k
+    time points costs O(k) on average. The buffer has the last axis first,
+    so that appended time points are contiguous in memory, and ``array`` is
+    a view of its filled part with the last axis moved back. The initial
+    array is used as the first buffer: it is full, so it is copied by the
+    first append and never written to.
+    """
+
+    def __init__(self, array):
+        self._buffer = np.moveaxis(array, -1, 0)
+        self.n = len(self._buffer)
+
+    @property
+    def array(self):
+        return np.moveaxis(self._buffer[:self.n], 0, -1)
+
+    def append(self, array):
+        """Append along the last axis and return the new view."""
+        array = np.moveaxis(array, -1, 0)
+        n_new = len(array)
+        if n_new == 0:
+            return self.array
+        if self.n + n_new > len(self._buffer):
+            capacity = max(2 * len(self._buffer), self.n + n_new)
+            buffer = np.empty((capacity,) + self._buffer.shape[1:],
+                              np.result_type(self._buffer, array))
+            buffer[:self.n] = self._buffer[:self.n]
+            self._buffer = buffer
+        self._buffer[self.n:self.n + n_new] = array
+        self.n += n_new
+        return self.array
+
+
+class _RingArray(object):
+    """The last time points of an array, in a fixed-size circular buffer.
+
+    Appending to a full buffer overwrites the oldest time points, so the
+    memory used is constant. Time points are indexed logically, from the
+    oldest one kept (0) to the newest; logical index i is stored in buffer
+    row (start + i) % size, with the last axis first as in
+    :class:`_GrowableArray`. :meth:`take` reads time points directly,
+    ``np.asarray(ring)`` copies all of them in logical order.
+    """
+
+    def __init__(self, array, size):
+        size = int(size)
+        if size < 1:
+            raise ValueError('The ring size must be positive, got %d' % size)
+        array = np.moveaxis(np.asarray(array), -1, 0)
+        self.n_dropped = max(len(array) - size, 0)
+        array = array[self.n_dropped:]
+        self._buffer = np.empty((size,) + array.shape[1:], array.dtype)
+        self._buffer[:len(array)] = array
+        self._start = 0
+        self.n = len(array)
+
+    @property
+    def shape(self):
+        return self._buffer.shape[1:] + (self.n,)
+
+    @property
+    def ndim(self):
+        return self._buffer.ndim
+
+    def __array__(self, dtype=None):
+        array = self.take(np.arange(self.n))
+        return array if dtype is None else array.astype(dtype)
+
+    def take(self, idx):
+        """Get time points by logical index (an int or array of ints)."""
+        idx = np.asarray(idx)
+        if np.any((idx < 0) | (idx >= self.n)):
+            raise IndexError('time index out of range for %d time points'
+                             % self.n)
+        rows = self._buffer[(self._start + idx) % len(self._buffer)]
+        return rows if idx.ndim == 0 else np.moveaxis(rows, 0, -1)
+
+    def append(self, array):
+        """Append along the last axis, dropping the oldest time points."""
+        array = np.moveaxis(np.asarray(array), -1, 0)
+        size = len(self._buffer)
+        n_drop = max(self.n + len(array) - size, 0)
+        if len(array) >= size:
+            self._buffer[:] = array[len(array) - size:]
+            self._start = 0
+        else:  # write in at most two pieces
+            end = (self._start + self.n) % size
+            n_first = min(len(array), size - end)
+            self._buffer[end:end + n_first] = array[:n_first]
+            self._buffer[:len(array) - n_first] = array[n_first:]
+            self._start = (self._start + n_drop) % size
+        self.n += len(array) - n_drop
+        self.n_dropped += n_drop
+        return self
 
 
 def _get_subjects_dir(subjects_dir=None, raise_error=True):
@@ -1,10 +1,15 @@
+from collections import OrderedDict
+from contextlib import contextmanager
 from copy import deepcopy
+from functools import partial
 import logging
 from math import floor
 import os
 from os.path import join as pjoin
+import threading
 import warnings
 from warnings import warn
+import weakref
 
 import numpy as np
 
@@ -19,6 +24,7 @@ from mayavi.core.ui.mayavi_scene import MayaviScene
 from traits.api import (HasTraits, Range, Int, Float,
                         Bool, Enum, on_trait_change, Instance)
 from tvtk.api import tvtk
+from tvtk.array_handler import array2vtk
 from pyface.api import GUI
 from traitsui.api import View, Item, Group, VGroup, HGroup, VSplit, HSplit
 
@@ -48,6 +54,10 @@ rh_viewdict = {'lateral': {'v': (180., -90.), 'r': -90.},
                'parietal': {'v': (-60., 60.), 'r': -49.106}}
 viewdicts = dict(lh=lh_viewdict, rh=rh_viewdict)
 
+# the number of smoothing matrices kept per data layer, for switching
+# between step counts with Brain.set_data_smoothing_steps
+_smooth_mats_size = 4
+
 
 def make_montage(filename, fnames, orientation='h', colorbar=None,
                  border_size=15):
@@ -173,6 +183,143 @@ def _prepare_data(data):
     return data
 
 
+def _threshold_vectors(vectors, values, thresh):
+    """Zero the vectors whose value is below thresh, hiding their glyphs."""
+    if thresh is not None:
+        vectors = vectors * (values >= thresh)[:, np.newaxis]
+    return vectors
+
+
+def _take_frame(array, idx, interpolation):
+    """Get a time point of a layer array, interpolating float indices."""
+    from scipy.interpolate import interp1d
+    ring = isinstance(array, utils._RingArray)
+    if not isinstance(idx, float):
+        return array.take(idx) if ring else array[..., idx]
+    times = np.arange(array.shape[-1])
+    if ring:  # interpolate locally instead of copying the whole ring
+        times = times[max(int(idx) - 2, 0):int(idx) + 4]
+        array = array.take(times)
+    return interp1d(times, array, interpolation, axis=-1,
+                    assume_sorted=True)(idx)
+
+
+def _smoothed_on_ingest(smooth_mat, max_times):
+    """Whether the time points of a layer are smoothed when they are added.
+
+    They are when they are kept in rings, and when the smoothing factors are
+    applied to them, as applying them once to each time point costs less
+    than building the smoothing matrix (see utils._SmoothingOperator).
+    """
+    from scipy import sparse
+    return smooth_mat is not None and (max_times is not None or
+                                       not sparse.issparse(smooth_mat))
+
+
+def _take_layer_frame(data, layer_time_idx, interpolation):
+    """Copy what computing a frame of a layer needs from its data"""
+    if data['array'].ndim == 2:
+        values = data['array']
+        vectors = None
+    else:
+        values = data['magnitude']
+        vectors = data['glyph_array']
+    frame = dict(smooth_mat=data['smooth_mat'], glyph_idx=data['glyph_idx'],
+                 vector_thresh=data['vector_thresh'], smoothed=None,
+                 values=None, vectors=None)
+    # ring buffers are overwritten in place, so the frames are copied
+    if data.get('smoothed') is not None:  # smoothed on ingest
+        frame['smoothed'] = np.array(_take_frame(
+            data['smoothed'], layer_time_idx, interpolation))
+    if frame['smoothed'] is None or vectors is not None:
+        frame['values'] = np.array(_take_frame(values, layer_time_idx,
+                                               interpolation))
+    if vectors is not None:
+        frame['vectors'] = np.array(_take_frame(vectors, layer_time_idx,
+                                                interpolation))
+    return frame
+
+
+def _get_layer_frame(frame):
+    """Get the scalars, vectors and vector values of a layer frame
+
+    The frame is taken from the data of the layer by _take_layer_frame.
+    """
+    values = frame['values']
+    vectors = frame['vectors']
+    if vectors is None:
+        vector_values = None
+    else:
+        if frame['glyph_idx'] is None:
+            vector_values = values.copy()
+        else:
+            vector_values = values[frame['glyph_idx']]
+        vectors = _threshold_vectors(vectors, vector_values,
+                                     frame['vector_thresh'])
+    scalar_data = frame['smoothed']
+    if scalar_data is None:
+        scalar_data = values
+        if frame['smooth_mat'] is not None:
+            scalar_data = frame['smooth_mat'] * scalar_data
+    return scalar_data, vectors, vector_values
+
+
+class _FramePrefetcher(object):
+    """Compute the frames of the data layers of a Brain in a thread.
+
+    Only the last request is kept: the time indices of earlier requests
+    that were not computed yet are dropped. The frames are stored in the
+    frame cache of the Brain, so that showing them only uploads them.
+    """
+
+    def __init__(self, brain):
+        self._brain = weakref.ref(brain)
+        self._request = None
+        self._stopped = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run,
+                                        name='surfer-prefetch')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def request(self, time_indices, interpolation):
+        with self._condition:
+            self._request = (list(time_indices), interpolation)
+            self._condition.notify()
+
+    def stop(self):
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while self._request is None and not self._stopped:
+                    self._condition.wait()
+                if self._stopped:
+                    return
+                time_indices, interpolation = self._request
+                self._request = None
+            brain = self._brain()
+            if brain is None:
+                return
+            with brain._frames_lock:
+                layers = [data for hemi in ('lh', 'rh')
+                          for data in brain._data_dicts[hemi]
+                          if data['array'].ndim > 1]
+            for time_idx in time_indices:
+                if self._request is not None or self._stopped:
+                    break  # a newer request
+                for data in layers:
+                    try:
+                        brain._get_frame(data, time_idx, interpolation)
+                    except Exception as exp:  # e.g. the layer was removed
+                        logger.debug('Could not prefetch time index %s: %s'
+                                     % (time_idx, exp))
+            del brain
+
+
 def _force_render(figures):
     """Ensure plots are updated before properties are used"""
     if not isinstance(figures, list):
@@ -189,6 +336,17 @@ def _force_render(figures):
     _gui.process_events()
 
 
+def _image_figure(image):
+    """Create a matplotlib figure showing an image at its size."""
+    # adapted from matplotlib.image.imsave
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    fig = Figure(frameon=False)
+    FigureCanvasAgg(fig)
+    fig.figimage(image, resize=True)
+    return fig
+
+
 def _make_viewer(figure, n_row, n_col, title, scene_size, offscreen,
                  interaction='trackball'):
     """Triage viewer creation
@@ -398,6 +556,9 @@ class Brain(object):
             raise ValueError('interaction must be "trackball" or "terrain", '
                              'got "%s"' % (interaction,))
         self._units = _check_units(units)
+        self._batch_depth = 0
+        self._batch_views = None
+        self._lod_n_vertices = None
         col_dict = dict(lh=1, rh=1, both=1, split=2)
         n_col = col_dict[hemi]
         if hemi not in col_dict.keys():
@@ -417,7 +578,6 @@ class Brain(object):
 
         # load geometry for one or both hemispheres as necessary
         offset = None if (not offset or hemi != 'both') else 0.0
-        self.geo = dict()
         if hemi in ['split', 'both']:
             geo_hemis = ['lh', 'rh']
         elif hemi == 'lh':
@@ -427,15 +587,9 @@ class Brain(object):
         else:
             raise ValueError('bad hemi value')
         geo_kwargs, geo_reverse, geo_curv = self._get_geo_params(cortex, alpha)
-        for h in geo_hemis:
-            # Initialize a Surface object as the geometry
-            geo = Surface(subject_id, h, surf, subjects_dir, offset,
-                          units=self._units)
-            # Load in the geometry and (maybe) curvature
-            geo.load_geometry()
-            if geo_curv:
-                geo.load_curvature()
-            self.geo[h] = geo
+        self._geo_curv = geo_curv
+        self.geo = self._load_surfaces(subject_id, geo_hemis, surf,
+                                       subjects_dir, offset)
 
         # deal with making figures
         self._set_window_properties(size, background, foreground)
@@ -499,6 +653,15 @@ class Brain(object):
         self.texts_dict = dict()
         self._times = None
         self.n_times = None
+        self._time_start = 0  # the time points dropped by ring buffers
+        # LRU cache of the values shown by data layers, keyed by layer,
+        # time point and interpolation, see _get_frame
+        self._frames = OrderedDict()
+        self._frames_size = 32
+        self._frames_lock = threading.RLock()
+        self._frames_generation = 0
+        self._prefetcher = None
+        self._time_viewers = weakref.WeakSet()
 
     @property
     def data_dict(self):
@@ -518,19 +681,18 @@ class Brain(object):
     # HELPERS
     def _toggle_render(self, state, views=None):
         """Turn rendering on (True) or off (False)"""
+        if self._batch_depth > 0:
+            return views  # batch_updates renders once when it exits
         figs = [fig for fig_row in self._figures for fig in fig_row]
         if views is None:
             views = [None] * len(figs)
-        for vi, (_f, view) in enumerate(zip(figs, views)):
+            if state is False:
+                views = self._save_views(figs)
+        for _f, view in zip(figs, views):
             # Testing backend doesn't have these options
             if mlab.options.backend == 'test':
                 continue
 
-            if state is False and view is None:
-                views[vi] = (mlab.view(figure=_f), mlab.roll(figure=_f),
-                             _f.scene.camera.parallel_scale
-                             if _f.scene is not None else False)
-
             if _f.scene is not None:
                 _f.scene.disable_render = not state
 
@@ -544,6 +706,17 @@ class Brain(object):
             _force_render(self._figures)
         return views
 
+    def _save_views(self, figs):
+        """Get the camera view, roll and scale of each figure."""
+        views = [None] * len(figs)
+        # Testing backend doesn't have these options
+        if mlab.options.backend != 'test':
+            for vi, _f in enumerate(figs):
+                views[vi] = (mlab.view(figure=_f), mlab.roll(figure=_f),
+                             _f.scene.camera.parallel_scale
+                             if _f.scene is not None else False)
+        return views
+
     def _set_window_properties(self, size, background, foreground):
         """Set window properties that are used elsewhere."""
         # old option "size" sets both width and height
@@ -720,6 +893,34 @@ class Brain(object):
                 elif hasattr(bar, 'Show'):
                     bar.Show(show)
 
+    @contextmanager
+    def batch_updates(self):
+        """Context manager to suspend rendering while updating the Brain.
+
+        Calls like :meth:`add_data`, :meth:`add_label` or
+        :meth:`scale_data_colormap` normally redraw all views when they
+        finish. Inside this context rendering is suspended, and the views
+        are restored and rendered once when the (outermost) context exits.
+        Contexts can be nested. Screenshots should be taken after the
+        context has exited.
+
+        Examples
+        --------
+        >>> with brain.batch_updates():  # doctest: +SKIP
+        ...     for label in labels:
+        ...         brain.add_label(label)
+        """
+        if self._batch_depth == 0:
+            self._batch_views = self._toggle_render(False)
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                views, self._batch_views = self._batch_views, None
+                self._toggle_render(True, views)
+
     def _get_one_brain(self, d, name):
         """Helper for various properties"""
         if len(self.brains) > 1:
@@ -800,7 +1001,8 @@ class Brain(object):
             hemi = [hemi]
         return hemi
 
-    def _read_scalar_data(self, source, hemi, name=None, cast=True):
+    def _read_scalar_data(self, source, hemi, name=None, cast=True,
+                          frames=None):
         """Load in scalar data from an image stored in a file or an array
 
         Parameters
@@ -813,11 +1015,15 @@ class Brain(object):
             either to cast float data into 64bit datatype as a
             workaround. cast=True can fix a rendering problem with
             certain versions of Mayavi
+        frames : int | slice | None
+            If not None, the frames to read from a file, see
+            :func:`surfer.io.read_scalar_data`.
 
         Returns
         -------
         scalar_data : numpy array
-            flat numpy array of scalar data
+            flat numpy array of scalar data, or an array of shape
+            (n_vertices, n_frames) if frames is not None
         name : str
             if no name was provided, deduces the name if filename was given
             as a source
@@ -831,7 +1037,7 @@ class Brain(object):
                 if basename.startswith("%s." % hemi):
                     basename = basename[3:]
                 name = os.path.splitext(basename)[0]
-            scalar_data = io.read_scalar_data(source)
+            scalar_data = io.read_scalar_data(source, frames)
         else:
             # Can't think of a good way to check that this will work nicely
             scalar_data = source
@@ -851,27 +1057,29 @@ class Brain(object):
 
         # Get data with a range that will make sense for automatic thresholding
         if sign == "neg":
-            range_data = np.abs(scalar_data[np.where(scalar_data < 0)])
+            def range_data(x):
+                return -x[x < 0]
         elif sign == "pos":
-            range_data = scalar_data[np.where(scalar_data > 0)]
+            def range_data(x):
+                return x[x > 0]
         else:
-            range_data = np.abs(scalar_data)
+            range_data = np.abs
 
         # Get a numeric value for the scalar minimum
         if min is None:
             min = "robust_min"
         if min == "robust_min":
-            min = np.percentile(range_data, 2)
+            min = utils.chunked_percentile(scalar_data, 2, range_data)
         elif min == "actual_min":
-            min = range_data.min()
+            min = range_data(scalar_data).min()
 
         # Get a numeric value for the scalar maximum
         if max is None:
             max = "robust_max"
         if max == "robust_max":
-            max = np.percentile(scalar_data, 98)
+            max = utils.chunked_percentile(scalar_data, 98)
         elif max == "actual_max":
-            max = range_data.max()
+            max = range_data(scalar_data).max()
 
         return min, max
 
@@ -951,7 +1159,9 @@ class Brain(object):
                  time_label="time index=%d", colorbar=True,
                  hemi=None, remove_existing=False, time_label_size=14,
                  initial_time=None, scale_factor=None, vector_alpha=None,
-                 mid=None, center=None, transparent=False, verbose=None):
+                 mid=None, center=None, transparent=False, frame_limits=None,
+                 vector_spacing=None, vector_thresh=None, max_times=None,
+                 verbose=None):
         """Display data from a numpy array on the surface.
 
         This provides a similar interface to
@@ -974,12 +1184,15 @@ class Brain(object):
             If vectors with no time dimension are desired, consider using a
             singleton (e.g., ``np.newaxis``) to create a "time" dimension
             and pass ``time_label=None``.
-        min : float
-            min value in colormap (uses real min if None)
+        min : float | 'robust_min'
+            min value in colormap (uses real min if None). If 'robust_min',
+            use the 2nd percentile of all values (see
+            :func:`surfer.utils.chunked_percentile`).
         mid : float
             intermediate value in colormap (middle between min and max if None)
-        max : float
-            max value in colormap (uses real max if None)
+        max : float | 'robust_max'
+            max value in colormap (uses real max if None). If 'robust_max',
+            use the 98th percentile of all values.
         thresh : None or float
             if not None, values below thresh will not be visible
         center : float or None
@@ -1027,6 +1240,28 @@ class Brain(object):
         vector_alpha : float | None
             alpha level to control opacity of the arrows. Only used for
             vector-valued data. If None (default), ``alpha`` is used.
+        frame_limits : int | None
+            If not None, the colormap limits follow the data over time: min
+            and max are computed for each time point (the actual values if
+            None, percentiles if 'robust_min' or 'robust_max', numbers are
+            kept fixed), averaged over a centered window of ``frame_limits``
+            time points (1 to use each time point alone), and mid is their
+            midpoint if None. The limits of all time points are computed
+            here and applied when the time index changes.
+        vector_spacing : float | None
+            Only used for vector-valued data. If not None, show the arrows
+            of a spatial subsample of the vertices, keeping one vertex per
+            cube of ``vector_spacing`` mm. The subsample is computed once,
+            and only its vectors are processed when the time index changes.
+        vector_thresh : float | None
+            Only used for vector-valued data. If not None, hide the arrows
+            with a magnitude below ``vector_thresh``.
+        max_times : int | None
+            If not None, keep only the last ``max_times`` time points, in
+            fixed-size buffers that :meth:`append_data` overwrites from the
+            oldest time point on, so that the memory used stays constant.
+            The data is smoothed when it is added, and the time indices
+            refer to the time points kept.
         verbose : bool, str, int, or None
             If not None, override default verbose level (see surfer.verbose).
 
@@ -1039,22 +1274,35 @@ class Brain(object):
         in which case only as many smoothing steps are applied until the whole
         surface is filled with non-zeros.
 
+        When applying the smoothing steps to each time point costs less than
+        building the smoothing matrix (e.g. for many smoothing steps and few
+        time points), the time points are smoothed step by step when they
+        are added, and ``smooth_mat`` in :attr:`data` is a
+        :class:`scipy.sparse.linalg.LinearOperator` instead of a sparse
+        matrix. Both smooth data of the vertices with ``smooth_mat * data``.
+
         Due to a Mayavi (or VTK) alpha rendering bug, ``vector_alpha`` is
         clamped to be strictly < 1.
         """
         hemi = self._check_hemi(hemi)
         array = np.asarray(array)
-
-        if center is None:
-            if min is None:
-                min = array.min() if array.size > 0 else 0
-            if max is None:
-                max = array.max() if array.size > 0 else 1
-        else:
-            if min is None:
-                min = 0
-            if max is None:
-                max = np.abs(center - array).max() if array.size > 0 else 1
+        if frame_limits is not None and array.ndim == 1:
+            raise ValueError('frame_limits can only be used for data with a '
+                             'time dimension')
+        if max_times is not None:
+            if array.ndim == 1:
+                raise ValueError('max_times can only be used for data with a '
+                                 'time dimension')
+            max_times = int(max_times)
+            if max_times < 1:
+                raise ValueError('max_times must be positive, got %d'
+                                 % max_times)
+            if time is not None and len(time) == array.shape[-1]:
+                time = np.asarray(time)[-max_times:]
+            array = array[..., -max_times:]
+        limit_args = (min, mid, max, center, frame_limits)
+
+        min, max = _get_data_limits(array, min, max, center)
         if mid is None:
             mid = (min + max) / 2.
         _check_limits(min, mid, max, extra='')
@@ -1065,14 +1313,17 @@ class Brain(object):
                 raise ValueError("len(data) < nvtx (%s < %s): the vertices "
                                  "parameter must not be None"
                                  % (len(array), self.geo[hemi].x.shape[0]))
-            adj_mat = utils.mesh_edges(self.geo[hemi].faces)
-            smooth_mat = utils.smoothing_matrix(vertices, adj_mat,
-                                                smoothing_steps)
+            smoother = utils._SmoothingOperator(
+                vertices, self.geo[hemi].adjacency, _smooth_mats_size)
+            # a matrix, or an operator when building one costs more
+            smooth_mat = smoother.operator(
+                smoothing_steps, array.shape[-1] if array.ndim > 1 else 1)
         else:
-            smooth_mat = None
+            smoother = smooth_mat = None
 
         magnitude = None
         magnitude_max = None
+        glyph_idx = None
         if array.ndim == 3:
             if array.shape[1] != 3:
                 raise ValueError('If array has 3 dimensions, array.shape[1] '
@@ -1089,6 +1340,14 @@ class Brain(object):
             if self._units == 'm':
                 scale_factor = scale_factor / 1000.
             magnitude_max = magnitude.max()
+            if vector_spacing is not None:
+                coords = self.geo[hemi].coords
+                if vertices is not None:
+                    coords = coords[vertices]
+                if self._units == 'm':
+                    vector_spacing = vector_spacing / 1000.
+                glyph_idx = np.sort(
+                    utils._cluster_points(coords, vector_spacing)[0])
         elif array.ndim not in (1, 2):
             raise ValueError('array has must have 1, 2, or 3 dimensions, '
                              'got (%s)' % (array.ndim,))
@@ -1109,7 +1368,16 @@ class Brain(object):
                     scale_factor=scale_factor,
                     transparent=False, time=0, time_idx=0,
                     vertices=vertices, smooth_mat=smooth_mat,
-                    layer_id=layer_id, magnitude=magnitude)
+                    layer_id=layer_id, magnitude=magnitude,
+                    frame_limits=None, frame_luts=dict(), glyph_idx=glyph_idx,
+                    vector_thresh=vector_thresh, buffers=None,
+                    max_times=max_times, time_start=self._time_start,
+                    shown=self._time_start, smoother=smoother,
+                    smoothed=None)
+        if array.ndim == 3:
+            # the vectors of the shown glyphs, interpolated over time
+            data['glyph_array'] = \
+                array if glyph_idx is None else array[glyph_idx]
 
         # clean up existing data
         if remove_existing:
@@ -1166,7 +1434,8 @@ class Brain(object):
                 s, ct, bar, gl = brain['brain'].add_data(
                     array, min, mid, max, thresh, lut, colormap, alpha,
                     colorbar, layer_id, smooth_mat, magnitude, magnitude_max,
-                    scale_factor, vertices, vector_alpha)
+                    scale_factor, vertices, vector_alpha, glyph_idx,
+                    vector_thresh)
                 surfs.append(s)
                 bars.append(bar)
                 glyphs.append(gl)
@@ -1182,12 +1451,183 @@ class Brain(object):
 
         self._data_dicts[hemi].append(data)
 
-        self.scale_data_colormap(min, mid, max, transparent, center, alpha)
-
+        datas = [d for d in (self.data_dict['lh'], self.data_dict['rh'])
+                 if d is not None]
+        self._scale_data_colormap(datas, min, mid, max, transparent, center,
+                                  alpha)
+        if frame_limits is not None:
+            data['limit_args'] = limit_args
+            data['frame_extrema'] = _get_frame_extrema(
+                array if magnitude is None else magnitude,
+                limit_args[0], limit_args[2], center)
+            data['frame_limits'] = _get_frame_limits(
+                data['frame_extrema'], limit_args[1], frame_limits)
+        smoothed = None
+        if array.ndim > 1 and _smoothed_on_ingest(smooth_mat, max_times):
+            smoothed = smooth_mat * (array if magnitude is None else magnitude)
+        if max_times is not None:
+            # keep the time points in rings, see utils._RingArray
+            data['buffers'] = dict(
+                (key, utils._RingArray(data[key], max_times))
+                for key in ('time', 'array', 'magnitude', 'glyph_array',
+                            'frame_extrema') if data.get(key) is not None)
+            if smoothed is not None:
+                smoothed = data['buffers']['smoothed'] = \
+                    utils._RingArray(smoothed, max_times)
+        with self._frames_lock:  # the layer may be prefetched already
+            if max_times is not None:
+                for key in ('array', 'magnitude', 'glyph_array'):
+                    if key in data['buffers']:
+                        data[key] = data['buffers'][key]
+            data['smoothed'] = smoothed
+            self._invalidate_frames()  # IDs of removed layers are reused
+        for d in datas:
+            if d['frame_limits'] is not None:
+                self._set_frame_limits(d, d['time_idx'])
         if initial_time_index is not None:
             self.set_data_time_index(initial_time_index)
         self._toggle_render(True, views)
 
+    def append_data(self, array, time=None, hemi=None):
+        """Append time points to the data added last with :meth:`add_data`.
+
+        The display is not changed, use e.g. :meth:`set_data_time_index` to
+        show the new time points.
+
+        Parameters
+        ----------
+        array : numpy array, shape (n_vertices[, 3][, n_new])
+            The data of the new time points, with the vertex (and vector)
+            dimensions of the data layer. The time dimension can be omitted
+            for a single time point.
+        time : numpy array | None
+            The times of the new time points. If None, continue the time
+            points with the last time step.
+        hemi : str | None
+            If None, it is assumed to belong to the hemisphere being
+            shown. If two hemispheres are being shown, an error will
+            be thrown.
+
+        Notes
+        -----
+        When data is shown for both hemispheres, append the same time
+        points to both. Until then, the hemisphere with fewer time points
+        shows its last time point at the later time indices.
+        """
+        hemi = self._check_hemi(hemi)
+        data = self.data_dict[hemi]
+        if data is None or data['array'].ndim == 1:
+            raise ValueError('No data with a time dimension was added for '
+                             'hemisphere %s' % (hemi,))
+        array = np.asarray(array)
+        if array.ndim == data['array'].ndim - 1:
+            array = array[..., np.newaxis]
+        if array.shape[:-1] != data['array'].shape[:-1]:
+            raise ValueError('array must have shape %s + (n_new,), got %s'
+                             % (data['array'].shape[:-1], array.shape))
+        n_new = array.shape[-1]
+        n_old = data['array'].shape[-1]
+        # the position of the new time points in the shared ones
+        pos = data['time_start'] + n_old - self._time_start
+        if pos < 0:
+            raise ValueError('The time points of hemisphere %s were dropped '
+                             'from the time points shared by all layers'
+                             % (hemi,))
+        if time is None:
+            # continue the time points shared by all layers
+            n_extra = pos + n_new - self.n_times
+            time = self._times[pos:pos + n_new]
+            if n_extra > 0:
+                step = self._times[-1] - self._times[-2] \
+                    if self.n_times > 1 else 1
+                time = np.concatenate((time, self._times[-1] +
+                                       step * np.arange(1, n_extra + 1)))
+        time = np.atleast_1d(time)
+        if time.shape != (n_new,):
+            raise ValueError('time has shape %s, but need shape %s '
+                             '(array.shape[-1])' % (time.shape, (n_new,)))
+        n_shared = min(pos + n_new, self.n_times)
+        if not np.array_equal(time[:n_shared - pos],
+                              self._times[pos:n_shared]):
+            raise ValueError("Not all time values are consistent with "
+                             "previously set times.")
+        if not np.all(np.diff(np.r_[self._times[pos - 1:pos], time]) > 0):
+            raise ValueError('time values must be increasing, and later '
+                             'than the time points of the layer, got %s'
+                             % (time,))
+
+        # grow the arrays of the layer in place, see utils._GrowableArray
+        if data['buffers'] is None:
+            data['buffers'] = dict()
+        for key in ('time', 'array', 'magnitude', 'glyph_array', 'smoothed',
+                    'frame_extrema'):
+            if key not in data['buffers'] and data.get(key) is not None:
+                data['buffers'][key] = utils._GrowableArray(data[key])
+        new = dict(time=time, array=array)
+        if data['magnitude'] is not None:
+            new['magnitude'] = np.linalg.norm(array, axis=1)
+            new['glyph_array'] = array if data['glyph_idx'] is None \
+                else array[data['glyph_idx']]
+        if data['smoothed'] is not None:
+            new['smoothed'] = data['smooth_mat'] * new.get('magnitude', array)
+        if data['frame_limits'] is not None:
+            fmin, fmid, fmax, center, window = data['limit_args']
+            new['frame_extrema'] = _get_frame_extrema(
+                new.get('magnitude', array), fmin, fmax, center)
+            # the window of the shown time point may include the new ones
+            shown = data['shown'] - data['time_start']
+            shown = np.arange(int(np.floor(shown)), int(np.ceil(shown)) + 1)
+            old_limits = data['frame_limits'][shown]
+        n_dropped = data['buffers']['array'].n_dropped \
+            if data['max_times'] is not None else 0
+        with self._frames_lock:  # the prefetched frames are outdated
+            for key, value in new.items():
+                data[key] = data['buffers'][key].append(value)
+            if data['max_times'] is not None:
+                data['time'] = np.asarray(data['time'])
+                if data['frame_limits'] is not None:
+                    data['frame_extrema'] = np.asarray(data['frame_extrema'])
+                n_dropped = data['buffers']['array'].n_dropped - n_dropped
+                data['time_start'] += n_dropped
+            time_start = self._time_start
+            if data['time_start'] + len(data['time']) > \
+                    self._time_start + self.n_times:
+                self._times = data['time']
+                self._time_start = data['time_start']
+                self.n_times = len(data['time'])
+            self._invalidate_frames()
+        limits_changed = False
+        if data['frame_limits'] is not None:
+            data['frame_limits'] = _get_frame_limits(
+                data['frame_extrema'], fmid, window)
+            data['frame_luts'].clear()
+            shown -= n_dropped
+            limits_changed = np.any(shown < 0) or not np.array_equal(
+                old_limits, data['frame_limits'][shown])
+
+        # keep showing the same time points, and update the layers that
+        # showed their last one or lost the one they showed
+        update = list()
+        for layer_hemi in ('lh', 'rh'):
+            for layer in self._data_dicts[layer_hemi]:
+                if layer['array'].ndim == 1:
+                    continue
+                layer['time_idx'] = max(layer['time_idx'] - self._time_start +
+                                        time_start, 0)
+                if self._layer_time_index(layer, layer['time_idx']) + \
+                        layer['time_start'] != layer['shown']:
+                    update.append((layer_hemi, layer))
+        if update:
+            views = self._toggle_render(False)
+            for layer_hemi, layer in update:
+                self._set_layer_time_index(layer_hemi, layer,
+                                           layer['time_idx'], 'quadratic')
+            self._toggle_render(True, views)
+        if limits_changed and all(layer is not data for _, layer in update):
+            self._set_frame_limits(data, data['shown'] - data['time_start'])
+        for viewer in list(self._time_viewers):
+            viewer._update_time_range()
+
     def add_annotation(self, annot, borders=True, alpha=1, hemi=None,
                        remove_existing=True):
         """Add an annotation file.
@@ -1244,12 +1684,9 @@ class Brain(object):
                         raise ValueError('Annotation file %s does not exist'
                                          % filepath)
                     filepaths += [filepath]
-            annots = []
-            for hemi, filepath in zip(hemis, filepaths):
-                # Read in the data
-                labels, cmap, _ = nib.freesurfer.read_annot(
-                    filepath, orig_ids=True)
-                annots.append((labels, cmap))
+            # Read in the data
+            annots = [annot_data[:2] for annot_data in utils._thread_map(
+                partial(nib.freesurfer.read_annot, orig_ids=True), filepaths)]
         else:
             annots = [annot] if len(hemis) == 1 else annot
             annot = 'annotation'
@@ -1449,10 +1886,12 @@ class Brain(object):
                     for data in self._data_dicts[hemi]:
                         brain.remove_data(data['layer_id'])
             self._data_dicts[hemi] = []
+        self._invalidate_frames()
 
         # if no data is left, reset time properties
         if all(len(brain.data) == 0 for brain in self.brains):
             self.n_times = self._times = None
+            self._time_start = 0
 
     def remove_foci(self, name=None):
         """Remove foci added with ``Brain.add_foci()``.
@@ -1513,6 +1952,83 @@ class Brain(object):
             for brain, array_id in data['array_ids']:
                 brain._remove_scalar_data(array_id)
 
+    def clear(self):
+        """Remove everything that was added to the surfaces
+
+        Data, labels, annotations, foci, contours, morphometry, overlays and
+        texts are removed, while the figures and surfaces are kept, so that
+        the Brain can be reused (see also :meth:`reset`).
+        """
+        views = self._toggle_render(False)
+        self.remove_data()
+        self.remove_labels()
+        self.remove_foci()
+        for a in self.annot_list:
+            a['brain']._remove_scalar_data(a['array_id'])
+        for layer in self.morphometry_list + self.contour_list:
+            if layer['colorbar'] is not None:
+                layer['colorbar'].visible = False
+            layer['brain']._remove_scalar_data(layer['array_id'])
+        for overlays in self.overlays_dict.values():
+            for overlay in overlays:
+                overlay.remove()
+        for text in self.texts_dict.values():
+            text['text'].remove()
+        self.annot_list = []
+        self.morphometry_list = []
+        self.contour_list = []
+        self.overlays_dict = dict()
+        self.texts_dict = dict()
+        self._toggle_render(True, views)
+
+    def reset(self, subject_id=None, surf=None):
+        """Clear the Brain and restore the original views
+
+        This is much faster than creating a new Brain, because the figures
+        and the visualization pipeline are reused.
+
+        Parameters
+        ----------
+        subject_id : str | None
+            If not None, show the surfaces of this subject instead.
+        surf : str | None
+            If not None, show this surface (e.g., 'white') instead.
+        """
+        with self.batch_updates():
+            self.clear()
+            if subject_id is not None and subject_id != self.subject_id:
+                self._set_subject(subject_id, surf)
+            elif surf is not None:
+                self.set_surf(surf)
+            for brain in self._brain_list:
+                self.show_view(self._original_views[brain['row']],
+                               row=brain['row'], col=brain['col'])
+
+    def _load_surfaces(self, subject_id, hemis, surf, subjects_dir, offset):
+        """Load the geometry and (maybe) curvature of the hemispheres."""
+        def _load(hemi):
+            geo = Surface(subject_id, hemi, surf, subjects_dir, offset,
+                          units=self._units)
+            geo.load_geometry()
+            if self._geo_curv:
+                geo.load_curvature()
+            return geo
+        # both hemispheres are read concurrently
+        return dict(zip(hemis, utils._thread_map(_load, hemis)))
+
+    def _set_subject(self, subject_id, surf=None):
+        """Show the surfaces of another subject."""
+        surf = self.surf if surf is None else surf
+        offset = list(self.geo.values())[0].offset
+        self.geo = self._load_surfaces(subject_id, list(self.geo), surf,
+                                       self.subjects_dir, offset)
+        self.subject_id = subject_id
+        self.surf = surf
+        for brain in self.brains:
+            brain._set_geometry(subject_id, self.geo[brain.hemi])
+        if self._lod_n_vertices is not None:
+            self.enable_lod(self._lod_n_vertices)
+
     def add_morphometry(self, measure, grayscale=False, hemi=None,
                         remove_existing=True, colormap=None,
                         min=None, max=None, colorbar=True):
@@ -1550,16 +2066,27 @@ class Brain(object):
                     'Could not find %s in subject directory' % morph_file)
             morph_files += [morph_file]
 
+        # Read in the morphometric data and a cortex mask for robust range,
+        # both are cached until the files change
+        def _read(hemi_file):
+            hemi, morph_file = hemi_file
+            label_file = pjoin(self.subjects_dir, self.subject_id, 'label',
+                               '%s.cortex.label' % hemi)
+            cortex = utils._read_cached(utils._read_label_mask, label_file,
+                                        len(self.geo[hemi].coords))
+            morph_data = utils._read_cached(nib.freesurfer.read_morph_data,
+                                            morph_file)
+            return morph_data, cortex
+        morph_datas = utils._thread_map(_read, zip(hemis, morph_files))
+
         views = self._toggle_render(False)
+        # Existing overlays are reused (by swapping their data) if possible
+        old_morphs = list()
         if remove_existing is True:
-            # Get rid of any old overlays
-            for m in self.morphometry_list:
-                if m["colorbar"] is not None:
-                    m['colorbar'].visible = False
-                m['brain']._remove_scalar_data(m['array_id'])
+            old_morphs = self.morphometry_list
             self.morphometry_list = []
 
-        for hemi, morph_file in zip(hemis, morph_files):
+        for hemi, (morph_data, cortex) in zip(hemis, morph_datas):
 
             if colormap is None:
                 # Preset colormaps
@@ -1572,15 +2099,8 @@ class Brain(object):
                                     sulc="RdBu",
                                     thickness="pink")[measure]
 
-            # Read in the morphometric data
-            morph_data = nib.freesurfer.read_morph_data(morph_file)
-
-            # Get a cortex mask for robust range
-            self.geo[hemi].load_label("cortex")
-            ctx_idx = self.geo[hemi].labels["cortex"]
-
             # Get the display range
-            min_default, max_default = np.percentile(morph_data[ctx_idx],
+            min_default, max_default = np.percentile(morph_data[cortex],
                                                      [2, 98])
             if min is None:
                 min = min_default
@@ -1597,8 +2117,22 @@ class Brain(object):
 
             for brain in self.brains:
                 if brain.hemi == hemi:
-                    self.morphometry_list.append(brain.add_morphometry(
-                        morph_data, colormap, measure, min, max, colorbar))
+                    old = [m for m in old_morphs if m['brain'] is brain]
+                    if old:
+                        old_morphs.remove(old[0])
+                        morph = brain.set_morphometry(
+                            old[0], morph_data, colormap, measure, min, max,
+                            colorbar)
+                    else:
+                        morph = brain.add_morphometry(
+                            morph_data, colormap, measure, min, max,
+                            colorbar)
+                    self.morphometry_list.append(morph)
+        # Get rid of any old overlays that were not reused
+        for m in old_morphs:
+            if m["colorbar"] is not None:
+                m['colorbar'].visible = False
+            m['brain']._remove_scalar_data(m['array_id'])
         self._toggle_render(True, views)
 
     def add_foci(self, coords, coords_as_verts=False, map_surface=None,
@@ -1817,7 +2351,14 @@ class Brain(object):
         roll : float
             camera roll returned from mlab.roll
         """
-        return self.brain_matrix[row][col].show_view(view, roll, distance)
+        brain = self.brain_matrix[row][col]
+        out = brain.show_view(view, roll, distance)
+        if self._batch_depth > 0:
+            # keep the new view when batch_updates restores the views
+            figs = [fig for fig_row in self._figures for fig in fig_row]
+            fi = figs.index(brain._f)
+            self._batch_views[fi] = self._save_views([brain._f])[0]
+        return out
 
     def set_distance(self, distance=None):
         """Set view distances for all brain plots to the same value
@@ -1865,27 +2406,67 @@ class Brain(object):
         views = self._toggle_render(False)
 
         # load new geometry
-        for geo in self.geo.values():
-            try:
-                geo.surf = surf
-                geo.load_geometry()
-            except IOError:  # surface file does not exist
+        geos = list(self.geo.values())
+        for geo in geos:
+            geo.surf = surf
+        try:
+            utils._thread_map(Surface.load_geometry, geos)
+        except IOError:  # surface file does not exist
+            for geo in geos:
                 geo.surf = self.surf
-                self._toggle_render(True)
-                raise
+                geo.load_geometry()
+            self._toggle_render(True)
+            raise
 
-        # update mesh objects (they use a reference to geo.coords)
+        # update mesh objects (load_geometry gives new arrays)
         for brain in self.brains:
+            brain._set_lod(False)
             brain._geo_mesh.data.points = self.geo[brain.hemi].coords
+            brain._geo_mesh.data.point_data.normals = self.geo[brain.hemi].nn
             brain.update_surf()
 
         self.surf = surf
+        if self._lod_n_vertices is not None:  # decimate the new surface
+            self.enable_lod(self._lod_n_vertices)
         self._toggle_render(True, views)
 
         for brain in self.brains:
             if brain._f.scene is not None:
                 brain._f.scene.reset_zoom()
 
+    def enable_lod(self, n_vertices=20000):
+        """Show decimated surfaces while rotating or zooming the views
+
+        While the user interacts with a view, the surface is replaced by a
+        decimated version of itself (see :func:`surfer.utils.decimate_surface`)
+        and all data, labels and annotations are shown on that mesh. The full
+        resolution surface is shown again as soon as the interaction ends,
+        and always used for screenshots and saved images.
+
+        Parameters
+        ----------
+        n_vertices : int
+            The approximate number of vertices of the decimated surfaces.
+        """
+        for hemi, geo in self.geo.items():
+            vertices, faces = utils.decimate_surface(geo.coords, geo.faces,
+                                                     n_vertices)
+            logger.info('%s: using %d vertices and %d faces while '
+                        'interacting' % (hemi, len(vertices), len(faces)))
+            for brain in self.brains:
+                if brain.hemi == hemi:
+                    brain.enable_lod(vertices, faces)
+        self._lod_n_vertices = n_vertices
+
+    def disable_lod(self):
+        """Always show the full resolution surfaces
+
+        See :meth:`enable_lod`.
+        """
+        for brain in self.brains:
+            brain.disable_lod()
+        self._lod_n_vertices = None
+
     @property
     def _brain_color(self):
         geo_actor = self._brain_list[0]['brain']._geo_surf.actor
@@ -1944,64 +2525,95 @@ class Brain(object):
             sets the overall opacity of colors, maintains transparent regions
         verbose : bool, str, int, or None
             If not None, override default verbose level (see surfer.verbose).
+
+        Notes
+        -----
+        The limits are used for all time points, even if the data were
+        added with ``frame_limits``.
         """
+        datas = [data for data in (self.data_dict['lh'], self.data_dict['rh'])
+                 if data is not None]
+        for data in datas:
+            data['frame_limits'] = None  # use fixed limits from now on
+            data['frame_luts'].clear()
+        views = self._toggle_render(False)
+        self._scale_data_colormap(datas, fmin, fmid, fmax, transparent,
+                                  center, alpha)
+        self._toggle_render(True, views)
+
+    def _scale_data_colormap(self, datas, fmin, fmid, fmax, transparent,
+                             center, alpha, lut=None):
+        """Scale the colormap of data layers, without rendering."""
         divergent = center is not None
 
         # Get the original colormap
-        for h in ['lh', 'rh']:
-            data = self.data_dict[h]
-            if data is not None:
-                table = data["orig_ctable"].copy()
-                break
-
-        lut = _scale_mayavi_lut(table, fmin, fmid, fmax, transparent,
-                                center, alpha)
+        if lut is None:
+            lut = _scale_mayavi_lut(datas[0]["orig_ctable"], fmin, fmid,
+                                    fmax, transparent, center, alpha)
 
         # Get the effective background color as 255-based 4-element array
         bgcolor = self._brain_color
+        if divergent:
+            data_range = np.array([center - fmax, center + fmax])
+        else:
+            data_range = np.array([fmin, fmax])
+
+        # if there is any transparent color in the lut, the colorbar shows
+        # the colors blended with the background; this table is the same for
+        # all surfaces, so it is only built once
+        cbar_lut = None
+        if np.any(lut[:, -1] < 255):
+            alphas = lut[:, -1][:, np.newaxis] / 255.
+            use_lut = lut.copy()
+            use_lut[:, -1] = 255.
+            cbar_vals = (use_lut * alphas) + bgcolor * (1 - alphas)
 
-        views = self._toggle_render(False)
         # Use the new colormap
-        for hemi in ['lh', 'rh']:
-            data = self.data_dict[hemi]
-            if data is not None:
-                for surf in data['surfaces']:
-                    cmap = surf.module_manager.scalar_lut_manager
-                    cmap.load_lut_from_list(lut / 255.)
-                    if divergent:
-                        cmap.data_range = np.array([center-fmax, center+fmax])
-                    else:
-                        cmap.data_range = np.array([fmin, fmax])
-
-                    # if there is any transparent color in the lut
-                    if np.any(lut[:, -1] < 255):
-                        # Update the colorbar to deal with transparency
-                        cbar_lut = tvtk.LookupTable()
-                        cbar_lut.deep_copy(surf.module_manager
-                                           .scalar_lut_manager.lut)
-                        alphas = lut[:, -1][:, np.newaxis] / 255.
-                        use_lut = lut.copy()
-                        use_lut[:, -1] = 255.
-                        vals = (use_lut * alphas) + bgcolor * (1 - alphas)
-                        cbar_lut.table.from_array(vals)
-                        cmap.scalar_bar.lookup_table = cbar_lut
-                        cmap.scalar_bar.use_opacity = 1
-
-                # Update the data properties
-                data.update(fmin=fmin, fmid=fmid, fmax=fmax, center=center,
-                            transparent=transparent)
-                # And the hemisphere properties to match
-                for glyph in data['glyphs']:
-                    if glyph is not None:
-                        l_m = glyph.parent.vector_lut_manager
-                        l_m.load_lut_from_list(lut / 255.)
-                        if divergent:
-                            l_m.data_range = np.array(
-                                    [center-fmax, center+fmax])
-                        else:
-                            l_m.data_range = np.array([fmin, fmax])
-
-        self._toggle_render(True, views)
+        for data in datas:
+            for surf in data['surfaces']:
+                cmap = surf.module_manager.scalar_lut_manager
+                _set_lut(cmap, lut)
+                cmap.data_range = data_range
+
+                if cbar_lut is None and np.any(lut[:, -1] < 255):
+                    # Update the colorbar to deal with transparency
+                    cbar_lut = tvtk.LookupTable()
+                    cbar_lut.deep_copy(cmap.lut)
+                    cbar_lut.table.from_array(cbar_vals)
+                if cbar_lut is not None:
+                    cmap.scalar_bar.lookup_table = cbar_lut
+                    cmap.scalar_bar.use_opacity = 1
+
+            # Update the data properties
+            data.update(fmin=fmin, fmid=fmid, fmax=fmax, center=center,
+                        transparent=transparent, alpha=alpha)
+            # And the hemisphere properties to match
+            for glyph in data['glyphs']:
+                if glyph is not None:
+                    l_m = glyph.parent.vector_lut_manager
+                    _set_lut(l_m, lut)
+                    l_m.data_range = data_range
+
+    def _set_frame_limits(self, data, time_idx):
+        """Scale the colormap of a layer to the limits of a time index."""
+        limits = data['frame_limits']
+        lut = None
+        if isinstance(time_idx, float):
+            times = np.arange(len(limits))
+            fmin, fmid, fmax = [np.interp(time_idx, times, lims)
+                                for lims in limits.T]
+        else:
+            fmin, fmid, fmax = limits[time_idx]
+            lut = data['frame_luts'].get(time_idx)
+        if lut is None:
+            lut = _scale_mayavi_lut(data['orig_ctable'], fmin, fmid, fmax,
+                                    data['transparent'], data['center'],
+                                    data['alpha'])
+            if not isinstance(time_idx, float):
+                data['frame_luts'][time_idx] = lut
+        self._scale_data_colormap([data], fmin, fmid, fmax,
+                                  data['transparent'], data['center'],
+                                  data['alpha'], lut)
 
     def set_data_time_index(self, time_idx, interpolation='quadratic'):
         """Set the data time index to show
@@ -2017,7 +2629,6 @@ class Brain(object):
             'cubic', default 'quadratic'). Interpolation is only used for
             non-integer indexes.
         """
-        from scipy.interpolate import interp1d
         if self.n_times is None:
             raise RuntimeError('cannot set time index with no time data')
         if time_idx < 0 or time_idx >= self.n_times:
@@ -2028,49 +2639,74 @@ class Brain(object):
             for data in self._data_dicts[hemi]:
                 if data['array'].ndim == 1:
                     continue  # skip data without time axis
-
-                # interpolation
-                if data['array'].ndim == 2:
-                    scalar_data = data['array']
-                    vectors = None
-                else:
-                    scalar_data = data['magnitude']
-                    vectors = data['array']
-                if isinstance(time_idx, float):
-                    times = np.arange(self.n_times)
-                    scalar_data = interp1d(
-                        times, scalar_data, interpolation, axis=1,
-                        assume_sorted=True)(time_idx)
-                    if vectors is not None:
-                        vectors = interp1d(
-                            times, vectors, interpolation, axis=2,
-                            assume_sorted=True)(time_idx)
-                else:
-                    scalar_data = scalar_data[:, time_idx]
-                    if vectors is not None:
-                        vectors = vectors[:, :, time_idx]
-
-                vector_values = scalar_data.copy()
-                if data['smooth_mat'] is not None:
-                    scalar_data = data['smooth_mat'] * scalar_data
-                for brain in self.brains:
-                    if brain.hemi == hemi:
-                        brain.set_data(data['layer_id'], scalar_data,
-                                       vectors, vector_values)
-                del brain
-                data["time_idx"] = time_idx
-
-                # Update time label
-                if data["time_label"]:
-                    if isinstance(time_idx, float):
-                        ifunc = interp1d(times, data['time'])
-                        time = ifunc(time_idx)
-                    else:
-                        time = data["time"][time_idx]
-                    self.update_text(data["time_label"](time), "time_label")
-
+                self._set_layer_time_index(hemi, data, time_idx,
+                                           interpolation)
         self._toggle_render(True, views)
 
+    def _layer_time_index(self, data, time_idx):
+        """Get the index of a time index in the time points of a layer"""
+        # layers are shifted by the time points they dropped, and show
+        # their first or last time point out of their range
+        layer_time_idx = time_idx + self._time_start - data['time_start']
+        return min(max(layer_time_idx, 0), data['array'].shape[-1] - 1)
+
+    def _get_frame(self, data, time_idx, interpolation):
+        """Get the values a layer shows at a time index, see _frames"""
+        with self._frames_lock:
+            layer_time_idx = self._layer_time_index(data, time_idx)
+            key = (data['layer_id'], layer_time_idx + data['time_start'],
+                   interpolation if isinstance(layer_time_idx, float)
+                   else None)
+            frame = self._frames.pop(key, None)
+            if frame is not None:
+                self._frames[key] = frame  # most recently used
+                return layer_time_idx, frame
+            generation = self._frames_generation
+            # the data may change in another thread while smoothing
+            frame = _take_layer_frame(data, layer_time_idx, interpolation)
+        frame = _get_layer_frame(frame)
+        with self._frames_lock:
+            # the data may have changed while the frame was computed
+            if generation == self._frames_generation:
+                self._frames[key] = frame
+                while len(self._frames) > self._frames_size:
+                    self._frames.popitem(last=False)
+        return layer_time_idx, frame
+
+    def _invalidate_frames(self):
+        """Drop the frames computed before the data changed"""
+        with self._frames_lock:
+            self._frames.clear()
+            self._frames_generation += 1
+
+    def _prefetch_frames(self, time_indices, interpolation='quadratic'):
+        """Compute the frames of time indices in a background thread"""
+        if self._prefetcher is None:
+            self._prefetcher = _FramePrefetcher(self)
+        self._prefetcher.request(time_indices, interpolation)
+
+    def _set_layer_time_index(self, hemi, data, time_idx, interpolation):
+        """Show a time index of a data layer with a time axis"""
+        layer_time_idx, (scalar_data, vectors, vector_values) = \
+            self._get_frame(data, time_idx, interpolation)
+        for brain in self.brains:
+            if brain.hemi == hemi:
+                brain.set_data(data['layer_id'], scalar_data,
+                               vectors, vector_values)
+        data["time_idx"] = time_idx
+        data["shown"] = layer_time_idx + data['time_start']
+        if data['frame_limits'] is not None:
+            self._set_frame_limits(data, layer_time_idx)
+
+        # Update time label
+        if data["time_label"]:
+            if isinstance(layer_time_idx, float):
+                time = np.interp(layer_time_idx,
+                                 np.arange(len(data['time'])), data['time'])
+            else:
+                time = data["time"][layer_time_idx]
+            self.update_text(data["time_label"](time), "time_label")
+
     @property
     def data_time_index(self):
         """Retrieve the currently displayed data time index
@@ -2105,27 +2741,46 @@ class Brain(object):
         views = self._toggle_render(False)
         for hemi in ['lh', 'rh']:
             data = self.data_dict[hemi]
-            if data is not None:
-                adj_mat = utils.mesh_edges(self.geo[hemi].faces)
-                smooth_mat = utils.smoothing_matrix(data["vertices"],
-                                                    adj_mat, smoothing_steps)
-                data["smooth_mat"] = smooth_mat
+            if data is not None and \
+                    data["smoothing_steps"] != smoothing_steps:
+                # the matrices of the last step counts used are kept, and
+                # extended by the missing steps
+                if data["smoother"] is None:
+                    data["smoother"] = utils._SmoothingOperator(
+                        data["vertices"], self.geo[hemi].adjacency,
+                        _smooth_mats_size)
+                smooth_mat = data["smoother"].operator(
+                    smoothing_steps, data["array"].shape[-1]
+                    if data["array"].ndim > 1 else 1)
+                smoothed = None
+                if data["array"].ndim > 1 and \
+                        _smoothed_on_ingest(smooth_mat, data["max_times"]):
+                    values = data["array"] if data["array"].ndim == 2 \
+                        else data["magnitude"]
+                    smoothed = smooth_mat * np.asarray(values)
+                    if data["max_times"] is not None:
+                        smoothed = utils._RingArray(smoothed,
+                                                    data["max_times"])
+                with self._frames_lock:
+                    data["smooth_mat"] = smooth_mat
+                    data["smoothed"] = smoothed
+                    if data["buffers"] is not None:  # see append_data
+                        data["buffers"].pop("smoothed", None)
+                        if data["max_times"] is not None:
+                            data["buffers"]["smoothed"] = smoothed
+                    self._invalidate_frames()
+                # Update data properties
+                data["smoothing_steps"] = smoothing_steps
 
                 # Redraw
                 if data["array"].ndim == 1:
-                    plot_data = data["array"]
-                elif data["array"].ndim == 2:
-                    plot_data = data["array"][:, data["time_idx"]]
-                else:  # vector-valued
-                    plot_data = data["magnitude"][:, data["time_idx"]]
-
-                plot_data = data["smooth_mat"] * plot_data
-                for brain in self.brains:
-                    if brain.hemi == hemi:
-                        brain.set_data(data['layer_id'], plot_data)
-
-                # Update data properties
-                data["smoothing_steps"] = smoothing_steps
+                    plot_data = data["smooth_mat"] * data["array"]
+                    for brain in self.brains:
+                        if brain.hemi == hemi:
+                            brain.set_data(data['layer_id'], plot_data)
+                else:
+                    self._set_layer_time_index(hemi, data, data["time_idx"],
+                                               'quadratic')
         self._toggle_render(True, views)
 
     def index_for_time(self, time, rounding='closest'):
@@ -2233,6 +2888,9 @@ class Brain(object):
 
     def close(self):
         """Close all figures and cleanup data structure."""
+        if self._prefetcher is not None:
+            self._prefetcher.stop()
+            self._prefetcher = None
         for ri, ff in enumerate(self._figures):
             for ci, f in enumerate(ff):
                 if f is not None:
@@ -2275,6 +2933,7 @@ class Brain(object):
         script plotting commands.
         """
         brain = self.brain_matrix[row, col]
+        brain._set_lod(False)
         ftype = filename[filename.rfind('.') + 1:]
         good_ftypes = ['png', 'jpg', 'bmp', 'tiff', 'ps',
                        'eps', 'pdf', 'rib', 'oogl', 'iv', 'vrml', 'obj']
@@ -2287,13 +2946,7 @@ class Brain(object):
 
     def _screenshot_figure(self, mode='rgb', antialiased=False):
         """Create a matplolib figure from the current screenshot."""
-        # adapted from matplotlib.image.imsave
-        from matplotlib.backends.backend_agg import FigureCanvasAgg
-        from matplotlib.figure import Figure
-        fig = Figure(frameon=False)
-        FigureCanvasAgg(fig)
-        fig.figimage(self.screenshot(mode, antialiased), resize=True)
-        return fig
+        return _image_figure(self.screenshot(mode, antialiased))
 
     def save_image(self, filename, mode='rgb', antialiased=False):
         """Save view from all panels to disk
@@ -2393,6 +3046,7 @@ class Brain(object):
         script plotting commands.
         """
         brain = self.brain_matrix[row, col]
+        brain._set_lod(False)
         if mlab.options.backend != 'test':
             return mlab.screenshot(brain._f, mode, antialiased)
         else:
@@ -2765,10 +3419,320 @@ class Brain(object):
                 print("\n\nError occured when exporting movie\n\n")
 
 
+class BrainGrid(object):
+    """Show the same hemisphere of many subjects in a grid of panels
+
+    Each subject gets its own :class:`Brain` in one panel of a grid of
+    scenes. The surfaces of all subjects are read concurrently, data added
+    through the grid share one colormap, and :meth:`screenshot` renders
+    each panel once into a single image.
+
+    Parameters
+    ----------
+    subject_ids : list of str
+        The subjects to show, in row-major order.
+    hemi : str
+        Hemisphere to show, 'lh', 'rh' or 'both'.
+    surf : str
+        FreeSurfer surface mesh name (ie 'white', 'inflated', etc.).
+    n_col : int | None
+        Number of columns of the grid. If None, use about as many columns
+        as rows.
+    views : str
+        The view to use in all panels.
+    size : float or pair of floats
+        The size of each panel, in pixels.
+    n_jobs : int | None
+        The number of threads used to read the surfaces. If None, use up
+        to 4 threads depending on the number of CPUs.
+    **kwargs
+        Other parameters passed to :class:`Brain` (e.g., ``cortex``,
+        ``background`` or ``subjects_dir``), used for all subjects.
+
+    Attributes
+    ----------
+    brains : list of Brain
+        The Brain of each subject.
+    """
+
+    def __init__(self, subject_ids, hemi, surf, n_col=None, views='lat',
+                 size=300, title='PySurfer', offscreen='auto',
+                 interaction='trackball', n_jobs=None, **kwargs):
+        subject_ids = list(subject_ids)
+        if len(subject_ids) == 0:
+            raise ValueError('subject_ids must contain at least one subject')
+        if hemi not in ('lh', 'rh', 'both'):
+            raise ValueError('hemi must be "lh", "rh" or "both", not %s'
+                             % (hemi,))
+        if not isinstance(views, string_types):
+            raise ValueError('views must be the name of a single view, '
+                             'got %s' % (views,))
+        n_col = int(np.ceil(np.sqrt(len(subject_ids)))) if n_col is None \
+            else int(n_col)
+        if n_col < 1:
+            raise ValueError('n_col must be positive, got %s' % (n_col,))
+        n_row = int(np.ceil(len(subject_ids) / float(n_col)))
+        subjects_dir = _get_subjects_dir(kwargs.pop('subjects_dir', None))
+        units = _check_units(kwargs.get('units', 'mm'))
+        offset = 0.0 if (kwargs.get('offset', True) and hemi == 'both') \
+            else None
+        try:
+            width, height = size
+        except (TypeError, ValueError):
+            width, height = size, size
+
+        # Read the surfaces in parallel, the Brains below get the same
+        # arrays from the geometry registry (see Surface.load_geometry)
+        def _load(subject_hemi):
+            surface = Surface(subject_hemi[0], subject_hemi[1], surf,
+                              subjects_dir, offset, units=units)
+            surface.load_geometry()
+            return surface
+        hemis = ['lh', 'rh'] if hemi == 'both' else [hemi]
+        surfaces = utils._thread_map(
+            _load, [(s, h) for s in subject_ids for h in hemis], n_jobs)
+
+        figures, self._v = _make_viewer(None, n_row, n_col, title,
+                                        (height * n_row, width * n_col),
+                                        offscreen, interaction)
+        self._figures = figures
+        self.brains = list()
+        for si, subject_id in enumerate(subject_ids):
+            ri, ci = divmod(si, n_col)
+            self.brains.append(Brain(
+                subject_id, hemi, surf, figure=figures[ri][ci], views=views,
+                size=(width, height), subjects_dir=subjects_dir,
+                interaction=interaction, **kwargs))
+        self._bg_color = self.brains[0]._bg_color
+        for si in range(len(subject_ids), n_row * n_col):
+            f = figures[si // n_col][si % n_col]
+            if f.scene is not None:
+                f.scene.background = self._bg_color
+        del surfaces
+
+    @contextmanager
+    def batch_updates(self):
+        """Postpone the rendering of all panels (see Brain.batch_updates)"""
+        batches = [brain.batch_updates() for brain in self.brains]
+        for batch in batches:
+            batch.__enter__()
+        try:
+            yield
+        finally:
+            for batch in batches[::-1]:
+                batch.__exit__(None, None, None)
+
+    def _add_to_all(self, method, args, kwargs):
+        """Call a Brain method for each subject."""
+        with self.batch_updates():
+            for brain in self.brains:
+                getattr(brain, method)(*args, **kwargs)
+
+    def add_data(self, data, min=None, max=None, mid=None, center=None,
+                 colorbar=True, **kwargs):
+        """Display data on the surface of each subject
+
+        All panels use the same colormap, so the LUT is computed once.
+
+        Parameters
+        ----------
+        data : list of array
+            The data of each subject (see :meth:`Brain.add_data`).
+        min, max, mid, center : float | None
+            The colormap limits. If None, they are computed from the data of
+            all subjects like :meth:`Brain.add_data` does for one subject.
+        colorbar : bool
+            Whether to show the colorbar, in the last panel.
+        **kwargs
+            Other parameters passed to :meth:`Brain.add_data`.
+        """
+        data = [np.asarray(array) for array in data]
+        if len(data) != len(self.brains):
+            raise ValueError('data must have one array per subject (%d), '
+                             'got %d' % (len(self.brains), len(data)))
+        min, max = _get_data_limits(
+            np.concatenate([array.ravel() for array in data]), min, max,
+            center)
+        with self.batch_updates():
+            for bi, (brain, array) in enumerate(zip(self.brains, data)):
+                brain.add_data(array, min=min, max=max, mid=mid,
+                               center=center, colorbar=colorbar and
+                               bi == len(self.brains) - 1, **kwargs)
+
+    def add_morphometry(self, measure, **kwargs):
+        """Add a morphometry overlay to each subject
+
+        See :meth:`Brain.add_morphometry` for the parameters.
+        """
+        self._add_to_all('add_morphometry', (measure,), kwargs)
+
+    def add_annotation(self, annot, **kwargs):
+        """Add an annotation file to each subject
+
+        See :meth:`Brain.add_annotation` for the parameters.
+        """
+        self._add_to_all('add_annotation', (annot,), kwargs)
+
+    def add_label(self, label, **kwargs):
+        """Add a label (by name) to each subject
+
+        See :meth:`Brain.add_label` for the parameters.
+        """
+        self._add_to_all('add_label', (label,), kwargs)
+
+    def screenshot(self, mode='rgb', antialiased=False):
+        """Render all panels into one image
+
+        Parameters
+        ----------
+        mode : string
+            Either 'rgb' or 'rgba' for values to return.
+        antialiased : bool
+            Antialias the image (see :func:`mayavi.mlab.screenshot`
+            for details; default False).
+
+        Returns
+        -------
+        screenshot : array
+            Image pixel values, with empty panels filled with the
+            background color.
+        """
+        images = [brain.screenshot(mode, antialiased)
+                  for brain in self.brains]
+        height = min(image.shape[0] for image in images)
+        width = min(image.shape[1] for image in images)
+        n_row, n_col = len(self._figures), len(self._figures[0])
+        fill = list(self._bg_color) + [0.] * (images[0].shape[2] - 3)
+        if images[0].dtype == np.uint8:
+            fill = np.round(np.array(fill) * 255)
+        data = np.empty((n_row * height, n_col * width, images[0].shape[2]),
+                        images[0].dtype)
+        data[:] = fill
+        for si, image in enumerate(images):
+            ri, ci = divmod(si, n_col)
+            data[ri * height:(ri + 1) * height,
+                 ci * width:(ci + 1) * width] = image[:height, :width]
+        return data
+
+    def save_image(self, filename, mode='rgb', antialiased=False):
+        """Save all panels to one image file
+
+        Parameters
+        ----------
+        filename : string
+            Path to the new image file.
+        mode : string
+            Either 'rgb' (default) to render solid background, or 'rgba' to
+            include alpha channel for transparent background.
+        antialiased : bool
+            Antialias the image (see :func:`mayavi.mlab.screenshot`
+            for details; see default False).
+        """
+        _image_figure(self.screenshot(mode, antialiased)).savefig(filename)
+
+    def close(self):
+        """Close all figures."""
+        for brain in self.brains:
+            brain.close()
+        n_col = len(self._figures[0])
+        for si in range(len(self.brains), len(self._figures) * n_col):
+            f = self._figures[si // n_col][si % n_col]
+            if f is not None:  # empty panels
+                mlab.close(f)
+        self._figures = [[None] * n_col for _ in self._figures]
+        if self._v is not None:
+            self._v.dispose()
+            self._v = None
+
+
+def _get_data_limits(array, min, max, center):
+    """Get the colormap limits of add_data, filling in the defaults."""
+    if center is None:
+        values = None  # use the data
+        if min is None:
+            min = array.min() if array.size > 0 else 0
+        if max is None:
+            max = array.max() if array.size > 0 else 1
+    else:
+        def values(x):  # distance from the center
+            return np.abs(center - x).ravel()
+        if min is None:
+            min = 0
+        if max is None:
+            max = values(array).max() if array.size > 0 else 1
+    if min == 'robust_min':
+        min = utils.chunked_percentile(array, 2, values)
+    if max == 'robust_max':
+        max = utils.chunked_percentile(array, 98, values)
+    for key, value in (('min', min), ('max', max)):
+        if isinstance(value, string_types):
+            raise ValueError('%s must be a number, None or "robust_%s", '
+                             'got "%s"' % (key, key, value))
+    return min, max
+
+
+def _get_frame_extrema(array, min, max, center):
+    """Get the colormap min and max of each time point, shape (2, n_times)."""
+    values = array.reshape(-1, array.shape[-1])
+    if center is not None:
+        values = np.abs(center - values)  # distance from the center
+    limits = list()
+    for key, value, q in (('min', min, 2), ('max', max, 98)):
+        if value is None:
+            if center is not None and key == 'min':
+                value = np.zeros(values.shape[1])
+            else:
+                value = getattr(values, key)(axis=0)
+        elif value == 'robust_' + key:
+            value = np.percentile(values, q, axis=0)
+        elif isinstance(value, string_types):
+            raise ValueError('%s must be a number, None or "robust_%s", '
+                             'got "%s"' % (key, key, value))
+        else:
+            value = np.full(values.shape[1], value, float)
+        limits.append(value)
+    return np.array(limits)
+
+
+def _get_frame_limits(extrema, mid, window):
+    """Get the colormap limits (fmin, fmid, fmax) of each time point."""
+    fmin, fmax = extrema
+    window = int(window)
+    if window < 1:
+        raise ValueError('frame_limits must be a positive integer, got %s'
+                         % (window,))
+    if window > 1:  # average over a centered window
+        kernel = np.ones(window)
+        norm = np.convolve(np.ones(len(fmin)), kernel, 'same')
+        fmin = np.convolve(fmin, kernel, 'same') / norm
+        fmax = np.convolve(fmax, kernel, 'same') / norm
+    # constant time points still need an increasing colormap
+    span = fmax.max() - fmin.min()
+    fmax = np.maximum(fmax, fmin + 1e-6 * (span if span > 0 else 1.))
+    fmid = (fmin + fmax) / 2. if mid is None else np.full(len(fmin), mid)
+    bad = ~((fmin < fmid) & (fmid < fmax))
+    if bad.any():
+        raise ValueError('mid (%s) must be between the min and max of each '
+                         'time point, got %d time point(s) where it is not'
+                         % (mid, bad.sum()))
+    return np.array([fmin, fmid, fmax]).T
+
+
+def _interp_lut(lut_table, x):
+    """Linearly interpolate all channels of a LUT at fractional indices."""
+    lut_table = np.asarray(lut_table, float)
+    n_colors = lut_table.shape[0]
+    x = np.clip(x, 0, n_colors - 1)
+    if n_colors == 1:
+        return np.repeat(lut_table, len(x), axis=0)
+    lo = np.minimum(x.astype(int), n_colors - 2)
+    w = (x - lo)[:, np.newaxis]
+    return lut_table[lo] + (lut_table[lo + 1] - lut_table[lo]) * w
+
+
 def _scale_sequential_lut(lut_table, fmin, fmid, fmax):
     """Scale a sequential colormap."""
 
-    lut_table_new = lut_table.copy()
     n_colors = lut_table.shape[0]
     n_colors2 = n_colors // 2
 
@@ -2777,22 +3741,13 @@ def _scale_sequential_lut(lut_table, fmin, fmid, fmax):
     fmid_idx = int(np.round(n_colors * ((fmid - fmin) /
                                         (fmax - fmin))) - 1)
 
-    # morph each color channel so that fmid gets assigned the middle color of
-    # the original table and the number of colors to the left and right are
+    # morph the colors so that fmid gets assigned the middle color of the
+    # original table and the number of colors to the left and right are
     # stretched or squeezed such that they correspond to the distance of fmid
     # to fmin and fmax, respectively
-    for i in range(4):
-        part1 = np.interp(np.linspace(0, n_colors2 - 1, fmid_idx + 1),
-                          np.arange(n_colors),
-                          lut_table[:, i])
-        lut_table_new[:fmid_idx + 1, i] = part1
-        part2 = np.interp(np.linspace(n_colors2, n_colors - 1,
-                                      n_colors - fmid_idx - 1),
-                          np.arange(n_colors),
-                          lut_table[:, i])
-        lut_table_new[fmid_idx + 1:, i] = part2
-
-    return lut_table_new
+    x = np.r_[np.linspace(0, n_colors2 - 1, fmid_idx + 1),
+              np.linspace(n_colors2, n_colors - 1, n_colors - fmid_idx - 1)]
+    return _interp_lut(lut_table, x).astype(lut_table.dtype)
 
 
 def _check_limits(fmin, fmid, fmax, extra='f'):
@@ -2833,6 +3788,12 @@ def _get_fill_colors(cols, n_fill):
     return fillcols
 
 
+# Scaled LUTs keyed on the original table and the scaling parameters, so that
+# dragging the TimeViewer sliders back and forth does not recompute them
+_lut_cache = OrderedDict()
+_LUT_CACHE_SIZE = 32
+
+
 @verbose
 def _scale_mayavi_lut(lut_table, fmin, fmid, fmax, transparent,
                       center=None, alpha=1.0, verbose=None):
@@ -2894,6 +3855,13 @@ def _scale_mayavi_lut(lut_table, fmin, fmid, fmax, transparent,
         logger.info("colormap sequential: [%0.2e, %0.2e, %0.2e] %s"
                     % (fmin, fmid, fmax, trstr[transparent]))
 
+    key = (lut_table.shape, lut_table.dtype.str, lut_table.tobytes(),
+           fmin, fmid, fmax, center, bool(transparent), float(alpha))
+    if key in _lut_cache:
+        lut_table = _lut_cache.pop(key)
+        _lut_cache[key] = lut_table  # most recently used goes last
+        return lut_table.copy()
+    lut_table = lut_table.copy()
     n_colors = lut_table.shape[0]
 
     # Add transparency if needed
@@ -2944,15 +3912,32 @@ def _scale_mayavi_lut(lut_table, fmin, fmid, fmax, transparent,
     # exactly the fault lies, so simply stick with the constant table size
     n_colors = lut_table.shape[0]
     if n_colors != 256:
-        lut = np.zeros((256, 4))
-        x = np.linspace(1, n_colors, 256)
-        for chan in range(4):
-            lut[:, chan] = np.interp(x,
-                                     np.arange(1, n_colors+1),
-                                     lut_table[:, chan])
-        lut_table = lut
+        lut_table = _interp_lut(lut_table, np.linspace(0, n_colors - 1, 256))
+
+    _lut_cache[key] = lut_table
+    while len(_lut_cache) > _LUT_CACHE_SIZE:
+        _lut_cache.popitem(last=False)
+    return lut_table.copy()
 
-    return lut_table
+
+def _set_lut(lut_manager, lut):
+    """Upload a (n_colors, 4) LUT with values in [0, 255] to a LUT manager.
+
+    When the number of colors does not change the values are written into
+    the existing VTK table, which avoids the per-color Python loop of
+    ``load_lut_from_list``.
+    """
+    vtk_lut = lut_manager.lut
+    table = vtk_lut.table.to_array()
+    if table.shape != lut.shape:
+        lut_manager.load_lut_from_list(lut / 255.)
+        return
+    table[:] = np.clip(np.floor(lut + 0.5), 0, 255)
+    vtk_lut.table.modified()
+    # setting a value through VTK marks the table as user-defined (otherwise
+    # the next build() would overwrite it) and updates the special colors
+    vtk_lut.set_table_value(0, table[0] / 255.)
+    lut_manager.render()
 
 
 class _Hemisphere(object):
@@ -2973,6 +3958,10 @@ class _Hemisphere(object):
         self._backend = backend
         self.data = {}
         self._mesh_clones = {}  # surface mesh data-sources
+        self._n_arrays = 0  # number of arrays added to the mesh
+        self._lod = None  # decimated mesh used during interaction
+        self._lod_full = None  # full resolution data while the LOD is shown
+        self._lod_observers = []
 
         # mlab pipeline mesh and surface for geomtery
         meshargs = dict(scalars=geo.bin_curv) if geo_curv else dict()
@@ -2999,7 +3988,7 @@ class _Hemisphere(object):
         self._geo_surf.actor.property.backface_culling = True
         if lut is not None:
             lut_manager = self._geo_surf.module_manager.scalar_lut_manager
-            lut_manager.load_lut_from_list(lut / 255.)
+            _set_lut(lut_manager, lut)
         if geo_curv and geo_reverse:
             curv_bar = mlab.scalarbar(self._geo_surf)
             curv_bar.reverse_lut = True
@@ -3107,8 +4096,12 @@ class _Hemisphere(object):
 
     def _add_scalar_data(self, data):
         """Add scalar values to dataset"""
-        array_id = self._mesh_dataset.point_data.add_array(data)
-        self._mesh_dataset.point_data.get_array(array_id).name = array_id
+        self._set_lod(False)
+        # array indices change when arrays are removed, so use unique names
+        self._n_arrays += 1
+        array_id = 'array_%d' % self._n_arrays
+        index = self._mesh_dataset.point_data.add_array(data)
+        self._mesh_dataset.point_data.get_array(index).name = array_id
         self._mesh_dataset.point_data.update()
 
         # build visualization pipeline
@@ -3124,6 +4117,7 @@ class _Hemisphere(object):
 
     def _remove_scalar_data(self, array_id):
         """Removes scalar data"""
+        self._set_lod(False)
         self._mesh_clones.pop(array_id).remove()
         self._mesh_dataset.point_data.remove_array(array_id)
 
@@ -3148,7 +4142,7 @@ class _Hemisphere(object):
 
         # Scale colormap used for the glyphs
         l_m = quiver.parent.vector_lut_manager
-        l_m.load_lut_from_list(lut / 255.)
+        _set_lut(l_m, lut)
         l_m.data_range = np.array([fmin, fmax])
         return quiver
 
@@ -3196,7 +4190,8 @@ class _Hemisphere(object):
     @verbose
     def add_data(self, array, fmin, fmid, fmax, thresh, lut, colormap, alpha,
                  colorbar, layer_id, smooth_mat, magnitude, magnitude_max,
-                 scale_factor, vertices, vector_alpha):
+                 scale_factor, vertices, vector_alpha, glyph_idx=None,
+                 vector_thresh=None):
         """Add data to the brain"""
         # Calculate initial data to plot
         if array.ndim == 1:
@@ -3221,7 +4216,14 @@ class _Hemisphere(object):
         scale_factor_norm = None
         if array.ndim == 3:
             scale_factor_norm = scale_factor / magnitude_max
-            vectors = array[:, :, 0].copy()
+            vectors = array[:, :, 0]
+            if glyph_idx is not None:
+                vectors = vectors[glyph_idx]
+                vector_values = vector_values[glyph_idx]
+                vertices = glyph_idx if vertices is None else \
+                    np.asarray(vertices)[glyph_idx]
+            vectors = _threshold_vectors(vectors, vector_values,
+                                         vector_thresh).copy()
             glyphs = self._add_vector_data(
                 vectors, vector_values, fmin, fmid, fmax,
                 scale_factor_norm, vertices, vector_alpha, lut)
@@ -3244,7 +4246,7 @@ class _Hemisphere(object):
         # apply look up table if given
         if lut is not None:
             l_m = surf.module_manager.scalar_lut_manager
-            l_m.load_lut_from_list(lut / 255.)
+            _set_lut(l_m, lut)
 
         # Get the original colormap table
         orig_ctable = \
@@ -3274,7 +4276,7 @@ class _Hemisphere(object):
 
         # Set the color table
         l_m = surf.module_manager.scalar_lut_manager
-        l_m.load_lut_from_list(cmap / 255.)
+        _set_lut(l_m, cmap)
 
         # Set the brain attributes
         return dict(surface=surf, name=annot, colormap=cmap, brain=self,
@@ -3318,6 +4320,29 @@ class _Hemisphere(object):
         return dict(surface=surf, colorbar=bar, measure=measure, brain=self,
                     array_id=array_id)
 
+    def set_morphometry(self, morph, morph_data, colormap, measure,
+                        min, max, colorbar):
+        """Show other data in an existing morphometry overlay"""
+        self._set_lod(False)
+        self._mesh_dataset.point_data.get_array(
+            morph['array_id']).from_array(morph_data)
+        with warnings.catch_warnings(record=True):  # traits
+            self._mesh_clones[morph['array_id']].update()
+        surf = morph['surface']
+        surf.name = measure
+        lut_manager = surf.module_manager.scalar_lut_manager
+        lut_manager.lut_mode = colormap
+        lut_manager.data_range = np.array([min, max])
+        bar = morph['colorbar']
+        if colorbar and bar is None:
+            bar = mlab.scalarbar(surf)
+            bar.label_text_property.color = self._fg_color
+            bar.scalar_bar_representation.position2 = .8, 0.09
+        elif bar is not None:
+            bar.visible = colorbar
+        return dict(surface=surf, colorbar=bar, measure=measure, brain=self,
+                    array_id=morph['array_id'])
+
     def add_foci(self, foci_coords, scale_factor, color, alpha, name):
         """Add spherical foci, possibly mapping to displayed surf"""
         # Create the visualization
@@ -3340,7 +4365,7 @@ class _Hemisphere(object):
                 reset_zoom=False)
         if lut is not None:
             l_m = surf.module_manager.scalar_lut_manager
-            l_m.load_lut_from_list(lut / 255.)
+            _set_lut(l_m, lut)
 
         # Set the colorbar and range correctly
         with warnings.catch_warnings(record=True):  # traits
@@ -3371,6 +4396,7 @@ class _Hemisphere(object):
 
     def set_data(self, layer_id, values, vectors=None, vector_values=None):
         """Set displayed data values and vectors."""
+        self._set_lod(False)
         data = self.data[layer_id]
         self._mesh_dataset.point_data.get_array(
             data['array_id']).from_array(values)
@@ -3379,21 +4405,20 @@ class _Hemisphere(object):
         if vectors is not None:
             q = data['glyphs']
 
-            # extract params that will change after calling .update()
-            l_m = q.parent.vector_lut_manager
-            data_range = np.array(l_m.data_range)
-            lut = l_m.lut.table.to_array().copy()
-
-            # Update glyphs
-            q.mlab_source.vectors = vectors
-            q.mlab_source.scalars = vector_values
-            q.mlab_source.update()
-
-            # Update changed parameters, and glyph scaling
+            # Update the glyph source arrays in place. Marking only the
+            # arrays as modified re-executes the VTK pipeline without the
+            # Mayavi data_changed events, which would reset the LUT range.
+            point_data = q.mlab_source.dataset.point_data
+            for arr, new in ((point_data.vectors, vectors),
+                             (point_data.scalars, vector_values)):
+                arr.to_array()[:] = new
+                arr.modified()
+            # the glyphs are scaled relative to the largest vector (which
+            # Mayavi would set on update)
+            q.glyph.glyph.range = \
+                (0., np.sqrt(np.max(np.sum(vectors * vectors, axis=1))))
             q.glyph.glyph.scale_factor = (data['scale_factor_norm'] *
                                           values.max())
-            l_m.load_lut_from_list(lut / 255.)
-            l_m.data_range = data_range
 
     def _orient_lights(self):
         """Set lights to come from same direction relative to brain."""
@@ -3410,6 +4435,90 @@ class _Hemisphere(object):
             for mesh in self._mesh_clones.values():
                 mesh.update()
 
+    def _set_geometry(self, subject_id, geo):
+        """Show a new geometry, which may have a different triangulation."""
+        self._set_lod(False)
+        self.subject_id = subject_id
+        dataset = self._mesh_dataset
+        dataset.points = geo.coords
+        dataset.polys = geo.faces
+        point_data = dataset.point_data
+        if self._using_lut:
+            point_data.get_array('scalars').from_array(geo.bin_curv)
+        point_data.normals = geo.nn
+        self.update_surf()
+
+    def enable_lod(self, vertices, faces):
+        """Show a decimated mesh while the user interacts with the view.
+
+        ``vertices`` are the indices of the vertices kept in the decimated
+        mesh and ``faces`` its triangles (see :func:`decimate_surface`).
+        """
+        self.disable_lod()
+        polys = tvtk.CellArray()
+        polys.from_array(faces)
+        self._lod = dict(vertices=vertices, polys=polys)
+        scene = self._f.scene
+        if scene is not None and scene.interactor is not None:
+            style = scene.interactor.interactor_style
+            for event, state in (('StartInteractionEvent', True),
+                                 ('EndInteractionEvent', False)):
+                callback = partial(self._on_interaction, state)
+                self._lod_observers.append(
+                    (style, style.add_observer(event, callback)))
+
+    def disable_lod(self):
+        """Always show the full resolution mesh."""
+        self._set_lod(False)
+        for style, observer in self._lod_observers:
+            style.remove_observer(observer)
+        self._lod_observers = []
+        self._lod = None
+
+    def _on_interaction(self, state, obj=None, event=None):
+        self._set_lod(state)
+
+    def _set_lod(self, state):
+        """Swap the mesh and its point data to (or from) the decimated mesh.
+
+        All surfaces of this hemisphere (data, labels, annotations, ...)
+        are views on the same dataset, so they are all swapped at once.
+        """
+        if self._lod is None or state == (self._lod_full is not None):
+            return
+        # The points, triangles and point data are changed in place, so that
+        # only one modified event has to go through the Mayavi pipeline
+        dataset = self._mesh_dataset
+        point_data = dataset.point_data
+        if state:
+            vertices = self._lod['vertices']
+            full = dict(points=dataset.points.data, polys=tvtk.CellArray(),
+                        point_data=tvtk.PointData())
+            full['polys'].shallow_copy(dataset.polys)
+            full['point_data'].shallow_copy(point_data)
+            lod_data = tvtk.PointData()
+            for ii in range(point_data.number_of_arrays):
+                array = point_data.get_array(ii)
+                lod_array = tvtk.to_tvtk(
+                    array2vtk(array.to_array()[vertices]))
+                lod_array.name = array.name
+                lod_data.add_array(lod_array)
+                attribute = point_data.is_array_an_attribute(ii)
+                if attribute >= 0:
+                    lod_data.set_active_attribute(ii, attribute)
+            points = tvtk.to_tvtk(array2vtk(
+                dataset.points.to_array()[vertices]))
+            self._lod_full = full
+        else:
+            full, self._lod_full = self._lod_full, None
+            points, lod_data = full['points'], full['point_data']
+        dataset.points.data = points
+        dataset.polys.shallow_copy(self._lod['polys'] if state
+                                   else full['polys'])
+        point_data.shallow_copy(lod_data)
+        dataset.delete_cells()  # the cached cells are out of date
+        dataset.modified()
+
 
 class OverlayData(object):
     """Encapsulation of statistical neuroimaging overlay viz data"""
@@ -3490,9 +4599,17 @@ class TimeViewer(HasTraits):
                                "automatic number of steps")
     orientation = Enum("lateral", "medial", "rostral", "caudal",
                        "dorsal", "ventral", "frontal", "parietal")
+    # playback: time points are dropped to keep up with the frame rate
+    playing = Bool(False, desc="play the time points")
+    fps = Float(10., enter_set=True, auto_set=False,
+                desc="number of time points shown per second")
+    loop = Bool(True, desc="play from the start after the last time point")
 
     # GUI layout
     view = View(VSplit(Item(name="current_time"),
+                       HGroup(Item(name="playing"),
+                              Item(name="fps"),
+                              Item(name="loop")),
                        Group(HSplit(Item(name="fmin"),
                                     Item(name="fmid"),
                                     Item(name="fmax"),
@@ -3507,6 +4624,15 @@ class TimeViewer(HasTraits):
 
     def __init__(self, brain):
         super(TimeViewer, self).__init__()
+        self._timer = None  # see _toggle_playing
+        self._play_start = (0., 0)
+        self._played = 0
+        self._play_interval = 0.1
+        self._n_prefetch = 8
+        # trait changes are applied after a delay in ms, see _schedule_update
+        self._pending = OrderedDict()
+        self._update_timer = None
+        self._update_delay = 50
 
         if isinstance(brain, (list, tuple)):
             self.brains = brain
@@ -3536,6 +4662,8 @@ class TimeViewer(HasTraits):
             if not np.all(props["time"] == this_props["time"]):
                 raise ValueError("all brains must have the same time"
                                  "points")
+        for brain in self.brains:  # see _update_time_range
+            brain._time_viewers.add(self)
 
         # Show GUI
         self.configure_traits()
@@ -3546,13 +4674,15 @@ class TimeViewer(HasTraits):
         """
         if self._disable_updates:
             return
+        self._schedule_update("smoothing_steps", self._apply_smoothing_steps)
 
+    def _apply_smoothing_steps(self):
         smoothing_steps = self.smoothing_steps
         if smoothing_steps < 0:
             smoothing_steps = None
 
         for brain in self.brains:
-            brain.set_data_smoothing_steps(self.smoothing_steps)
+            brain.set_data_smoothing_steps(smoothing_steps)
 
     @on_trait_change("orientation")
     def _set_orientation(self):
@@ -3570,9 +4700,103 @@ class TimeViewer(HasTraits):
         """
         if self._disable_updates:
             return
+        if self.playing:  # already paced by the frame rate
+            self._apply_time_point()
+        else:
+            self._schedule_update("current_time", self._apply_time_point)
 
+    def _apply_time_point(self):
         for brain in self.brains:
             brain.set_data_time_index(self.current_time)
+            brain._prefetch_frames(self._next_time_indices())
+
+    def _schedule_update(self, name, apply_func):
+        """Apply an update once the traits did not change for a while
+
+        Only the last pending update of each trait is applied, with the
+        trait values at that time.
+        """
+        from pyface.timer.api import Timer
+        self._pending[name] = apply_func
+        if self._update_timer is not None:
+            self._update_timer.Stop()
+        self._update_timer = Timer(self._update_delay, self._flush_updates)
+
+    def _flush_updates(self):
+        """Apply the pending updates now"""
+        if self._update_timer is not None:
+            self._update_timer.Stop()
+            self._update_timer = None
+        pending, self._pending = self._pending, OrderedDict()
+        for apply_func in pending.values():
+            apply_func()
+
+    def _next_time_indices(self):
+        """Get the time indices likely shown next, to prefetch them"""
+        step = max(int(round(self.fps * self._play_interval)), 1) \
+            if self.playing else 1
+        time_idx = self.current_time + \
+            step * np.arange(1, self._n_prefetch + 1)
+        if self.loop:
+            time_idx %= self.max_time + 1
+        time_idx = [int(idx) for idx in time_idx if idx <= self.max_time]
+        if self.current_time > 0:  # for dragging the slider backwards
+            time_idx.append(self.current_time - 1)
+        return time_idx
+
+    @on_trait_change("playing, fps")
+    def _toggle_playing(self):
+        """ Start or stop playing the time points
+        """
+        from pyface.timer.api import Timer
+        from time import time
+        if self._timer is not None:
+            self._timer.Stop()
+            self._timer = None
+        if self.playing and self.fps > 0:
+            if self.current_time == self.max_time and self.loop:
+                self.current_time = 0
+            self._play_start = (time(), self.current_time)
+            self._played = self.current_time
+            self._play_interval = max(1. / self.fps, 0.01)
+            self._timer = Timer(int(1000 * self._play_interval),
+                                self._play_step)
+
+    def _play_step(self):
+        """ Show the time point due at the frame rate
+        """
+        from time import time
+        start, start_idx = self._play_start
+        if self.current_time != self._played:  # the slider was moved
+            start, start_idx = self._play_start = (time(), self.current_time)
+        time_idx = start_idx + int((time() - start) * self.fps)
+        if time_idx > self.max_time:
+            if not self.loop:
+                self.current_time = self.max_time
+                self.playing = False
+                return
+            time_idx %= self.max_time + 1
+        if time_idx != self.current_time:
+            self.current_time = time_idx
+        self._played = time_idx
+
+    def _update_time_range(self):
+        """Extend the time range to time points appended to the brains
+
+        If the last time point was shown, the new last one is shown.
+        """
+        self._flush_updates()
+        max_time = min(brain.n_times for brain in self.brains) - 1
+        follow = self.current_time == self.max_time
+        # the time index shifts when time points are dropped
+        self._disable_updates = True
+        self.current_time = min(self.brains[0].data_time_index, max_time)
+        self.max_time = max_time
+        if follow:
+            self.current_time = max_time
+        self._disable_updates = False
+        if follow:
+            self._apply_time_point()
 
     @on_trait_change("fmin, fmid, fmax, transparent")
     def _scale_colormap(self):
@@ -3580,7 +4804,9 @@ class TimeViewer(HasTraits):
         """
         if self._disable_updates:
             return
+        self._schedule_update("colormap", self._apply_colormap)
 
+    def _apply_colormap(self):
         for brain in self.brains:
             brain.scale_data_colormap(self.fmin, self.fmid, self.fmax,
                                       self.transparent, self.center)